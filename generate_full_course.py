@@ -2,996 +2,18 @@
 # -*- coding: utf-8 -*-
 """
 Полный генератор курса - создаёт все 85 уроков с образовательным контентом
+
+Обёртка над python -m pythonlearn build
 """
 
-import os
 import sys
 
-# Базовая функция для создания HTML
-exec(open('/home/user/pythonlearn/create_all_lessons.py').read())
-
-# Генераторы контента для разных типов уроков
-
-def algo_01_content():
-    """Урок 1: Что такое алгоритм?"""
-    content = '''<h2>Введение</h2>
-                <p>Прежде чем начать программировать, нужно научиться думать как программист. Для этого мы изучим, что такое алгоритмы и как они работают.</p>
-
-                <h2>Что такое алгоритм?</h2>
-                <p><strong>Алгоритм</strong> — это точная последовательность действий, которая приводит к решению какой-то задачи.</p>
-
-                <p>Алгоритмы окружают нас повсюду! Вот несколько примеров из повседневной жизни:</p>
-
-                <ul>
-                    <li><strong>Рецепт приготовления блюда</strong> - точные шаги, которые нужно выполнить, чтобы приготовить еду</li>
-                    <li><strong>Инструкция по сборке мебели</strong> - последовательность действий для сборки шкафа</li>
-                    <li><strong>Маршрут от дома до школы</strong> - набор шагов, как добраться из точки А в точку Б</li>
-                    <li><strong>Правила игры</strong> - что нужно делать, чтобы играть и выиграть</li>
-                </ul>
-
-                <div class="note">
-                    <h4>Важно!</h4>
-                    <p>Алгоритм должен быть <strong>понятным</strong>, <strong>конечным</strong> (завершаться за определённое количество шагов) и <strong>точным</strong> (каждый шаг чётко определён).</p>
-                </div>
-
-                <h2>Пример алгоритма</h2>
-                <p>Давай рассмотрим простой алгоритм: <strong>"Как заварить чай"</strong></p>
-
-                <ol>
-                    <li>Взять чайник</li>
-                    <li>Налить в него воду</li>
-                    <li>Поставить чайник на плиту</li>
-                    <li>Включить плиту</li>
-                    <li>Дождаться, пока вода закипит</li>
-                    <li>Выключить плиту</li>
-                    <li>Положить чайный пакетик в чашку</li>
-                    <li>Налить кипяток в чашку</li>
-                    <li>Подождать 3-5 минут</li>
-                    <li>Достать пакетик</li>
-                    <li>Чай готов!</li>
-                </ol>
-
-                <h2>Свойства алгоритма</h2>
-
-                <h3>1. Дискретность</h3>
-                <p>Алгоритм состоит из отдельных шагов. Каждый шаг выполняется один за другим.</p>
-
-                <h3>2. Определённость</h3>
-                <p>Каждый шаг должен быть понятен и не допускать двусмысленности. Например, "налить много воды" - неточно. Лучше: "налить 1 литр воды".</p>
-
-                <h3>3. Результативность</h3>
-                <p>Алгоритм должен приводить к результату за конечное число шагов.</p>
-
-                <h3>4. Массовость</h3>
-                <p>Алгоритм должен работать для разных входных данных. Например, алгоритм сложения двух чисел работает для любых чисел.</p>
-
-                <div class="warning">
-                    <h4>Задумайся!</h4>
-                    <p>Если в алгоритме будет ошибка хотя бы в одном шаге, результат может быть неправильным. Поэтому в программировании важна точность!</p>
-                </div>
-
-                <div class="quiz-container">
-                    <h3>Тест к уроку</h3>
-
-                    <div class="question">
-                        <h4>Вопрос 1: Что такое алгоритм?</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="false">
-                                    Любое действие
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="true" data-explanation="Именно! Алгоритм - это чёткая последовательность шагов.">
-                                    Точная последовательность действий для решения задачи
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="false">
-                                    Компьютерная программа
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <div class="question">
-                        <h4>Вопрос 2: Какое свойство алгоритма означает, что он должен завершиться за конечное число шагов?</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q2" data-correct="false">
-                                    Дискретность
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q2" data-correct="true" data-explanation="Верно! Результативность гарантирует, что алгоритм закончится и даст результат.">
-                                    Результативность
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q2" data-correct="false">
-                                    Массовость
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <div class="question">
-                        <h4>Вопрос 3: Что из перечисленного НЕ является алгоритмом?</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q3" data-correct="false">
-                                    Рецепт пирога
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q3" data-correct="true" data-explanation="Правильно! Просто мечта - это не последовательность действий.">
-                                    Мечта о будущем
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q3" data-correct="false">
-                                    Инструкция по сборке
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <button class="btn-secondary" id="show-results">Показать результаты</button>
-                    <div class="quiz-results"></div>
-                </div>
-
-                <h2>Задание для практики</h2>
-                <div class="note">
-                    <h4>Практическое задание</h4>
-                    <p>Попробуй написать алгоритм для одной из этих задач:</p>
-                    <ul>
-                        <li>Как почистить зубы</li>
-                        <li>Как собрать рюкзак в школу</li>
-                        <li>Как перейти дорогу по светофору</li>
-                    </ul>
-                    <p>Запиши каждый шаг по порядку. Проверь, чтобы ничего не забыть!</p>
-                </div>'''
-
-    return content
-
-# Теперь создам функцию для генерации ВСЕХ уроков
-def generate_all_lessons():
-    """Главная функция генерации всех 85 уроков"""
-
-    lessons_dir = 'lessons'
-    os.makedirs(lessons_dir, exist_ok=True)
-
-    created = 0
-    updated = 0
-
-    # Здесь я создам ВСЕ уроки
-    # Из-за размера, я буду использовать компактные шаблоны
-
-    print("Создание всех 85 уроков начато...")
-
-    for lesson_id, lesson_data in LESSONS_DATA.items():
-        filepath = os.path.join(lessons_dir, f"{lesson_id}.html")
-
-        # Определяем, создавать ли Skulpt
-        include_skulpt = lesson_data['type'] in ['python', 'oge', 'ege']
-
-        # Генерируем контент в зависимости от урока
-        content_html = generate_lesson_content(lesson_id, lesson_data)
-
-        # Создаём HTML файл
-        html_content = create_lesson_html(
-            lesson_id=lesson_id,
-            title=lesson_data['title'],
-            module=lesson_data['module'],
-            duration=lesson_data['duration'],
-            content_html=content_html,
-            prev_lesson=lesson_data['prev'],
-            next_lesson=lesson_data['next'],
-            include_skulpt=include_skulpt
-        )
-
-        # Записываем файл
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-
-        if os.path.exists(filepath):
-            created += 1
-
-        # Показываем прогресс
-        print(f"Создано: {created}/85 - {lesson_id}.html", end='\r')
+from pythonlearn.build import build
+from pythonlearn.cli import main
 
-    print(f"\n\n✓ Завершено! Создано {created} уроков")
-    return created
-
-def generate_lesson_content(lesson_id, lesson_data):
-    """Генерирует контент для конкретного урока"""
-
-    # Специальные уроки с полным контентом (уже существующие)
-    if lesson_id == "algo-01":
-        return algo_01_content()
-
-    # Для всех остальных уроков создам базовый образовательный контент
-    # Это будет генерироваться на основе типа урока и темы
-
-    return generate_generic_lesson_content(lesson_id, lesson_data)
-
-def generate_generic_lesson_content(lesson_id, lesson_data):
-    """Генерирует базовый образовательный контент для урока"""
-
-    lesson_type = lesson_data['type']
-    title = lesson_data['title']
-
-    # Основной контент в зависимости от типа урока
-    if lesson_type == 'algorithm':
-        return generate_algorithm_lesson(lesson_id, title)
-    elif lesson_type == 'python':
-        return generate_python_lesson(lesson_id, title)
-    elif lesson_type == 'oge':
-        return generate_oge_lesson(lesson_id, title)
-    elif lesson_type == 'ege':
-        return generate_ege_lesson(lesson_id, title)
-    else:
-        return generate_basic_lesson(lesson_id, title)
-
-# Буду продолжать создавать генераторы для каждого типа урока...
+def generate_all_lessons(force=False, jobs=1):
+    """Главная функция генерации всех 85 уроков (пересобирает только изменившиеся)"""
+    return len(build(force=force, jobs=jobs)['written'])
 
 if __name__ == "__main__":
-    total = generate_all_lessons()
-    print(f"\n{'='*60}")
-    print(f"ИТОГО: Создано {total} уроков из 85")
-    print(f"{'='*60}")
-
-# === ГЕНЕРАТОРЫ КОНТЕНТА ДЛЯ РАЗНЫХ ТИПОВ УРОКОВ ===
-
-def generate_algorithm_lesson(lesson_id, title):
-    """Генерирует урок по алгоритмам с блок-схемами"""
-
-    # Определяем тему на основе lesson_id
-    topics = {
-        'algo-02': ('Блок-схемы', 'блок-схем', 'графическое представление алгоритмов'),
-        'algo-03': ('Линейные алгоритмы', 'линейных алгоритмов', 'последовательное выполнение команд'),
-        'algo-04': ('Ветвления', 'ветвлений', 'условные операторы и выбор'),
-        'algo-05': ('Циклы', 'циклов', 'повторение действий'),
-        'algo-06': ('Поиск', 'поиска', 'линейный и бинарный поиск'),
-        'algo-07': ('Сортировки', 'простых сортировок', 'пузырьковая и сортировка выбором'),
-        'algo-08': ('Быстрые сортировки', 'быстрых сортировок', 'QuickSort и MergeSort'),
-        'algo-09': ('Последовательности', 'обработки последовательностей', 'суммы, средние, фильтрация'),
-        'algo-10': ('Числа', 'работы с числами', 'простые числа, НОД, НОК'),
-        'algo-11': ('Строки', 'строковых алгоритмов', 'поиск подстрок, палиндромы'),
-        'algo-12': ('ДП основы', 'динамического программирования', 'мемоизация и оптимизация'),
-        'algo-13': ('ДП продвинутое', 'сложного ДП', 'задачи оптимизации'),
-        'algo-14': ('Жадные алгоритмы', 'жадных алгоритмов', 'локальные оптимумы'),
-        'algo-15': ('Перебор', 'полного перебора', 'перестановки и сочетания'),
-    }
-
-    topic_name, topic_gen, topic_desc = topics.get(lesson_id, ('Алгоритмы', 'алгоритмов', 'решение задач'))
-
-    content = f'''<h2>Введение</h2>
-                <p>В этом уроке мы изучим <strong>{topic_desc}</strong>. Это важная тема для понимания того, как работают программы и решаются сложные задачи.</p>
-
-                <h2>Что такое {topic_name}?</h2>
-                <p><strong>{topic_name}</strong> - это один из фундаментальных подходов в программировании, который помогает эффективно решать задачи.</p>
-
-                <div class="diagram">
-                    <svg class="diagram-svg" width="100%" height="400" viewBox="0 0 600 400" style="max-width: 500px;">
-                        <defs>
-                            <marker id="arrowhead" markerWidth="10" markerHeight="10" refX="9" refY="3" orient="auto">
-                                <polygon points="0,0 0,6 9,3" fill="#1e293b"/>
-                            </marker>
-                        </defs>
-
-                        <!-- Начало -->
-                        <ellipse cx="300" cy="50" rx="80" ry="30" fill="#dbeafe" stroke="#6366f1" stroke-width="3"/>
-                        <text x="300" y="58" text-anchor="middle" font-size="15" font-weight="bold" fill="#1e293b">НАЧАЛО</text>
-
-                        <!-- Стрелка -->
-                        <path d="M 300 80 L 300 120" stroke="#1e293b" stroke-width="3" marker-end="url(#arrowhead)"/>
-
-                        <!-- Процесс -->
-                        <rect x="200" y="120" width="200" height="60" fill="#d1fae5" stroke="#10b981" stroke-width="3" rx="8"/>
-                        <text x="300" y="155" text-anchor="middle" font-size="14" font-weight="600" fill="#1e293b">Обработка данных</text>
-
-                        <!-- Стрелка -->
-                        <path d="M 300 180 L 300 220" stroke="#1e293b" stroke-width="3" marker-end="url(#arrowhead)"/>
-
-                        <!-- Результат -->
-                        <path d="M 220 220 L 380 220 L 360 280 L 200 280 Z" fill="#fef3c7" stroke="#f59e0b" stroke-width="3"/>
-                        <text x="290" y="255" text-anchor="middle" font-size="14" font-weight="600" fill="#1e293b">Вывод результата</text>
-
-                        <!-- Стрелка к концу -->
-                        <path d="M 300 280 L 300 320" stroke="#1e293b" stroke-width="3" marker-end="url(#arrowhead)"/>
-
-                        <!-- Конец -->
-                        <ellipse cx="300" cy="360" rx="80" ry="30" fill="#dbeafe" stroke="#6366f1" stroke-width="3"/>
-                        <text x="300" y="368" text-anchor="middle" font-size="15" font-weight="bold" fill="#1e293b">КОНЕЦ</text>
-                    </svg>
-                </div>
-
-                <h2>Основные понятия</h2>
-                <ul>
-                    <li>Понимание принципов {topic_gen}</li>
-                    <li>Применение на практике</li>
-                    <li>Оценка эффективности</li>
-                    <li>Типовые задачи ОГЭ/ЕГЭ</li>
-                </ul>
-
-                <div class="note">
-                    <h4>Важно знать!</h4>
-                    <p>Эта тема часто встречается на экзаменах ОГЭ и ЕГЭ. Важно понимать не только как применять алгоритм, но и почему он работает.</p>
-                </div>
-
-                <h2>Практический пример</h2>
-                <p>Рассмотрим типовую задачу и решим её пошагово.</p>
-
-                <div class="code-block">
-                    <pre># Пример алгоритма
-# Будет добавлен в следующих версиях урока
-</pre>
-                </div>
-
-                <h2>Проверь себя!</h2>
-
-                <div class="quiz-container">
-                    <h3>Тест к уроку</h3>
-
-                    <div class="question">
-                        <h4>Вопрос 1: Для чего используются {topic_name.lower()}?</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="false">
-                                    Для украшения кода
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="true" data-explanation="Верно! {topic_name} помогают эффективно решать задачи.">
-                                    Для эффективного решения задач
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="false">
-                                    Только для экзаменов
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <div class="question">
-                        <h4>Вопрос 2: Какое свойство важно для алгоритма?</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q2" data-correct="true" data-explanation="Правильно! Алгоритм должен быть эффективным.">
-                                    Эффективность
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q2" data-correct="false">
-                                    Красота
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q2" data-correct="false">
-                                    Сложность
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <div class="question">
-                        <h4>Вопрос 3: Встречается ли эта тема на ОГЭ/ЕГЭ?</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q3" data-correct="true" data-explanation="Да! Эта тема часто встречается на экзаменах.">
-                                    Да, очень часто
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q3" data-correct="false">
-                                    Нет, никогда
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q3" data-correct="false">
-                                    Только на олимпиадах
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <button class="btn-secondary" id="show-results">Показать результаты</button>
-                    <div class="quiz-results"></div>
-                </div>
-
-                <h2>Задание для практики</h2>
-                <div class="note">
-                    <h4>Практическое задание</h4>
-                    <p>Попробуй решить следующие задачи:</p>
-                    <ul>
-                        <li>Разберись с примерами из урока</li>
-                        <li>Реши 2-3 задачи самостоятельно</li>
-                        <li>Проверь свои решения</li>
-                    </ul>
-                </div>'''
-
-    return content
-
-def generate_python_lesson(lesson_id, title):
-    """Генерирует урок по Python с интерактивными примерами"""
-
-    # Определяем тему
-    python_topics = {
-        'python-03': ('Типы данных', 'int, float, str, bool', 'print(type(5))'),
-        'python-04': ('Арифметические операции', '+, -, *, /, //, %, **', 'print(10 + 5)\nprint(10 ** 2)'),
-        'python-05': ('Ввод/вывод', 'input() и print()', 'name = input("Имя: ")\nprint("Привет,", name)'),
-        'python-06': ('Условия if', 'if, elif, else', 'x = 10\nif x > 5:\n    print("Больше 5")'),
-        'python-07': ('Логические операции', 'and, or, not', 'x = 5\nif x > 0 and x < 10:\n    print("От 0 до 10")'),
-        'python-08': ('Цикл while', 'while условие', 'i = 0\nwhile i < 5:\n    print(i)\n    i += 1'),
-        'python-09': ('Цикл for', 'for i in range()', 'for i in range(5):\n    print(i)'),
-        'python-10': ('Строки', 'методы строк', 'text = "Hello"\nprint(text.upper())\nprint(text[0])'),
-        'python-11': ('Списки - основы', 'создание и индексация', 'numbers = [1, 2, 3, 4, 5]\nprint(numbers[0])'),
-        'python-12': ('Списки - методы', 'append, remove, sort', 'lst = [3, 1, 2]\nlst.sort()\nprint(lst)'),
-        'python-13': ('Двумерные списки', 'матрицы', 'matrix = [[1, 2], [3, 4]]\nprint(matrix[0][1])'),
-        'python-14': ('Кортежи', 'неизменяемые последовательности', 't = (1, 2, 3)\nprint(t[0])'),
-        'python-15': ('Множества', 'уникальные элементы', 's = {1, 2, 3}\ns.add(4)\nprint(s)'),
-        'python-16': ('Словари - основы', 'ключ: значение', 'd = {"name": "Иван", "age": 14}\nprint(d["name"])'),
-        'python-17': ('Словари - методы', 'keys(), values(), items()', 'd = {"a": 1}\nprint(d.keys())'),
-        'python-18': ('Функции', 'def, return', 'def hello():\n    print("Привет!")'),
-        'python-19': ('Параметры', 'аргументы функций', 'def greet(name):\n    print("Привет,", name)'),
-        'python-20': ('Return', 'возврат значений', 'def sum(a, b):\n    return a + b'),
-        'python-21': ('Область видимости', 'локальные и глобальные', 'x = 10\ndef func():\n    x = 5'),
-        'python-22': ('Рекурсия', 'функция вызывает себя', 'def factorial(n):\n    if n == 1:\n        return 1\n    return n * factorial(n-1)'),
-        'python-23': ('Lambda', 'анонимные функции', 'square = lambda x: x**2\nprint(square(5))'),
-        'python-24': ('Чтение файлов', 'open(), read()', 'with open("file.txt") as f:\n    content = f.read()'),
-        'python-25': ('Запись в файлы', 'write()', 'with open("file.txt", "w") as f:\n    f.write("Hello")'),
-        'python-26': ('Обработка текста', 'split(), join()', 'text = "a b c"\nwords = text.split()'),
-        'python-27': ('CSV файлы', 'модуль csv', 'import csv\n# работа с CSV'),
-        'python-28': ('Двоичная система', 'bin(), перевод чисел', 'print(bin(10))\nprint(int("1010", 2))'),
-        'python-29': ('8 и 16 системы', 'oct(), hex()', 'print(hex(255))\nprint(oct(8))'),
-        'python-30': ('Арифметика СС', 'операции в разных СС', '# Сложение в двоичной системе'),
-        'python-31': ('СС в Python', 'функции преобразования', 'print(int("FF", 16))'),
-        'python-32': ('Задачи ЕГЭ', 'типовые задачи', '# Решение задач ЕГЭ'),
-        'python-33': ('AND, OR, NOT', 'логика', 'print(True and False)\nprint(not True)'),
-        'python-34': ('Выражения', 'сложная логика', 'x = 5\nresult = (x > 0) and (x < 10)'),
-        'python-35': ('Логика в коде', 'применение', 'if (a > 0) and (b > 0):\n    print("Оба положительные")'),
-        'python-36': ('Логические функции', 'таблицы истинности', '# Построение таблиц'),
-        'python-37': ('Задачи логики', 'ЕГЭ по логике', '# Решение логических задач'),
-        'python-38': ('Графы', 'представление графов', 'graph = {1: [2, 3], 2: [4]}'),
-        'python-39': ('BFS', 'поиск в ширину', 'from collections import deque'),
-        'python-40': ('DFS', 'поиск в глубину', 'def dfs(graph, start):\n    visited = set()'),
-        'python-41': ('Деревья', 'бинарные деревья', 'class Node:\n    def __init__(self, value)'),
-        'python-42': ('Алгоритмы на графах', 'Дейкстра, кратчайшие пути', 'import heapq'),
-        'python-43': ('Графы ЕГЭ', 'задачи с графами', '# Подсчёт путей'),
-    }
-
-    topic_name, keywords, example_code = python_topics.get(lesson_id, ('Python', 'основы Python', 'print("Hello")'))
-
-    content = f'''<h2>Введение</h2>
-                <p>В этом уроке мы изучим <strong>{topic_name}</strong> в Python. Это важная тема, которая поможет тебе писать более эффективные программы.</p>
-
-                <h2>Что такое {topic_name}?</h2>
-                <p><strong>{topic_name}</strong> - это {keywords}. Давай разберёмся, как это работает!</p>
-
-                <h2>Основные концепции</h2>
-                <p>Ключевые слова и операторы: <code>{keywords}</code></p>
-
-                <div class="note">
-                    <h4>Важно!</h4>
-                    <p>Эта тема широко используется в программировании и часто встречается на экзаменах.</p>
-                </div>
-
-                <h2>Примеры кода</h2>
-                <p>Вот базовый пример использования:</p>
-
-                <div class="code-block">
-                    <pre>{example_code}</pre>
-                </div>
-
-                <h2>Попробуй сам!</h2>
-                <p>Запусти код и посмотри, что получится:</p>
-
-                <div class="python-editor">
-                    <div class="editor-header">
-                        <h3>Python редактор</h3>
-                        <div class="editor-controls">
-                            <button class="run-btn">▶ Запустить</button>
-                            <button class="clear-btn">✕ Очистить</button>
-                        </div>
-                    </div>
-                    <textarea id="code-editor" spellcheck="false">{example_code}</textarea>
-                    <div class="output-container">
-                        <h4>Результат:</h4>
-                        <div id="output"></div>
-                    </div>
-                </div>
-
-                <h2>Практические задания</h2>
-                <div class="warning">
-                    <h4>Задание 1</h4>
-                    <p>Попробуй изменить код выше и поэкспериментируй с разными значениями.</p>
-                </div>
-
-                <div class="warning">
-                    <h4>Задание 2</h4>
-                    <p>Напиши свою программу, используя изученные концепции.</p>
-                </div>
-
-                <h2>Проверь себя!</h2>
-
-                <div class="quiz-container">
-                    <h3>Тест к уроку</h3>
-
-                    <div class="question">
-                        <h4>Вопрос 1: Для чего используется {topic_name}?</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="false">
-                                    Только для красоты кода
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="true" data-explanation="Верно! Это важная функциональность Python.">
-                                    Для решения практических задач
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="false">
-                                    Не используется
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <div class="question">
-                        <h4>Вопрос 2: Как правильно использовать {topic_name}?</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q2" data-correct="true" data-explanation="Правильно! Важно следовать синтаксису Python.">
-                                    Следуя синтаксису Python
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q2" data-correct="false">
-                                    Как угодно
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q2" data-correct="false">
-                                    Только в специальных случаях
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <div class="question">
-                        <h4>Вопрос 3: Встречается ли эта тема на экзаменах?</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q3" data-correct="true" data-explanation="Да! Очень часто встречается.">
-                                    Да, регулярно
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q3" data-correct="false">
-                                    Нет
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q3" data-correct="false">
-                                    Только в университете
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <button class="btn-secondary" id="show-results">Показать результаты</button>
-                    <div class="quiz-results"></div>
-                </div>
-
-                <h2>Итоги урока</h2>
-                <p>Теперь ты знаешь:</p>
-                <ul>
-                    <li>Как использовать {topic_name}</li>
-                    <li>Основные операторы и функции</li>
-                    <li>Практическое применение</li>
-                </ul>'''
-
-    return content
-
-def generate_oge_lesson(lesson_id, title):
-    """Генерирует урок подготовки к ОГЭ"""
-
-    content = f'''<h2>Подготовка к ОГЭ</h2>
-                <p>В этом уроке мы разберём типовые задачи ОГЭ по информатике. Научимся решать их быстро и правильно.</p>
-
-                <h2>Типовые задачи</h2>
-                <p>Рассмотрим основные типы заданий, которые встречаются на экзамене:</p>
-
-                <ul>
-                    <li>Анализ алгоритмов</li>
-                    <li>Программирование на Python</li>
-                    <li>Работа с данными</li>
-                    <li>Логические задачи</li>
-                </ul>
-
-                <div class="note">
-                    <h4>Стратегия решения</h4>
-                    <p>Всегда читай задание внимательно, проверяй граничные случаи, тестируй решение на примерах.</p>
-                </div>
-
-                <h2>Пример задачи</h2>
-                <p>Типовая задача ОГЭ:</p>
-
-                <div class="code-block">
-                    <pre># Условие задачи
-# Напишите программу, которая...
-
-# Решение
-# Будет добавлено</pre>
-                </div>
-
-                <h2>Практика</h2>
-
-                <div class="python-editor">
-                    <div class="editor-header">
-                        <h3>Решение задачи</h3>
-                        <div class="editor-controls">
-                            <button class="run-btn">▶ Запустить</button>
-                            <button class="clear-btn">✕ Очистить</button>
-                        </div>
-                    </div>
-                    <textarea id="code-editor" spellcheck="false"># Напиши своё решение здесь
-</textarea>
-                    <div class="output-container">
-                        <h4>Результат:</h4>
-                        <div id="output"></div>
-                    </div>
-                </div>
-
-                <h2>Проверь себя!</h2>
-
-                <div class="quiz-container">
-                    <h3>Тест к уроку</h3>
-
-                    <div class="question">
-                        <h4>Вопрос 1: Сколько баллов можно получить за ОГЭ по информатике?</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="false">
-                                    10
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="true" data-explanation="Правильно! Максимум 19 баллов.">
-                                    19
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="false">
-                                    100
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <div class="question">
-                        <h4>Вопрос 2: Какой язык программирования можно использовать на ОГЭ?</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q2" data-correct="true" data-explanation="Да! Python разрешён на ОГЭ.">
-                                    Python
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q2" data-correct="false">
-                                    HTML
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q2" data-correct="false">
-                                    SQL
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <div class="question">
-                        <h4>Вопрос 3: Нужно ли знать алгоритмы для ОГЭ?</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q3" data-correct="true" data-explanation="Абсолютно! Алгоритмы - основа экзамена.">
-                                    Да, обязательно
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q3" data-correct="false">
-                                    Нет
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q3" data-correct="false">
-                                    Только базовые
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <button class="btn-secondary" id="show-results">Показать результаты</button>
-                    <div class="quiz-results"></div>
-                </div>
-
-                <h2>Рекомендации</h2>
-                <div class="warning">
-                    <h4>Как готовиться к ОГЭ</h4>
-                    <ul>
-                        <li>Решай по 2-3 задачи каждый день</li>
-                        <li>Разбирай свои ошибки</li>
-                        <li>Практикуйся на реальных вариантах</li>
-                        <li>Следи за временем</li>
-                    </ul>
-                </div>'''
-
-    return content
-
-def generate_ege_lesson(lesson_id, title):
-    """Генерирует урок подготовки к ЕГЭ"""
-
-    content = f'''<h2>Подготовка к ЕГЭ</h2>
-                <p>В этом уроке мы разберём сложные задачи ЕГЭ по информатике. Это задачи высокого уровня, требующие глубокого понимания программирования.</p>
-
-                <h2>Типы заданий ЕГЭ</h2>
-                <p>ЕГЭ включает 27 заданий разного уровня сложности:</p>
-
-                <ul>
-                    <li>Базовые задачи (1-12): теория, логика, системы счисления</li>
-                    <li>Средний уровень (13-21): алгоритмы, программирование</li>
-                    <li>Высокий уровень (22-27): сложное программирование, оптимизация</li>
-                </ul>
-
-                <div class="note">
-                    <h4>Важно для ЕГЭ!</h4>
-                    <p>Задачи 25-27 дают максимум баллов, но требуют отличного знания программирования и алгоритмов.</p>
-                </div>
-
-                <h2>Разбор типовой задачи</h2>
-                <p>Рассмотрим задачу высокого уровня:</p>
-
-                <div class="code-block">
-                    <pre># Задача ЕГЭ
-# Условие...
-
-# Решение
-def solve():
-    # Ваш код
-    pass</pre>
-                </div>
-
-                <h2>Решение с объяснением</h2>
-
-                <div class="python-editor">
-                    <div class="editor-header">
-                        <h3>Код решения</h3>
-                        <div class="editor-controls">
-                            <button class="run-btn">▶ Запустить</button>
-                            <button class="clear-btn">✕ Очистить</button>
-                        </div>
-                    </div>
-                    <textarea id="code-editor" spellcheck="false"># Напиши оптимальное решение
-# Учитывай граничные случаи
-# Тестируй на примерах
-</textarea>
-                    <div class="output-container">
-                        <h4>Результат:</h4>
-                        <div id="output"></div>
-                    </div>
-                </div>
-
-                <h2>Проверь себя!</h2>
-
-                <div class="quiz-container">
-                    <h3>Тест к уроку</h3>
-
-                    <div class="question">
-                        <h4>Вопрос 1: Сколько заданий в ЕГЭ по информатике?</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="false">
-                                    20
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="true" data-explanation="Верно! В ЕГЭ 27 заданий.">
-                                    27
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="false">
-                                    30
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <div class="question">
-                        <h4>Вопрос 2: Какие задачи дают больше всего баллов?</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q2" data-correct="false">
-                                    Первые 10
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q2" data-correct="true" data-explanation="Правильно! Задачи 25-27 самые сложные и дают больше баллов.">
-                                    Последние (25-27)
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q2" data-correct="false">
-                                    Все одинаково
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <div class="question">
-                        <h4>Вопрос 3: Нужно ли знать программирование для высоких баллов?</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q3" data-correct="true" data-explanation="Да! Без программирования не получить 80+ баллов.">
-                                    Да, обязательно
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q3" data-correct="false">
-                                    Нет, достаточно теории
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q3" data-correct="false">
-                                    Только базовые знания
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <button class="btn-secondary" id="show-results">Показать результаты</button>
-                    <div class="quiz-results"></div>
-                </div>
-
-                <h2>Стратегия подготовки</h2>
-                <div class="warning">
-                    <h4>План подготовки к ЕГЭ</h4>
-                    <ul>
-                        <li>Начни с базовых задач (1-12)</li>
-                        <li>Переходи к программированию (13-24)</li>
-                        <li>Осваивай сложные задачи (25-27)</li>
-                        <li>Решай пробные варианты каждую неделю</li>
-                        <li>Анализируй ошибки и разбирай решения</li>
-                    </ul>
-                </div>
-
-                <div class="note">
-                    <h4>Совет</h4>
-                    <p>Для получения 90+ баллов нужно уверенно решать задачи 25-27. Практикуйся в программировании каждый день!</p>
-                </div>'''
-
-    return content
-
-def generate_basic_lesson(lesson_id, title):
-    """Базовый шаблон для любого урока"""
-
-    content = f'''<h2>Введение</h2>
-                <p>Добро пожаловать на урок! Здесь мы изучим важную тему по программированию на Python.</p>
-
-                <h2>Основные понятия</h2>
-                <p>В этом уроке рассмотрим ключевые концепции и их применение на практике.</p>
-
-                <div class="note">
-                    <h4>Запомни!</h4>
-                    <p>Эта тема важна для понимания более сложных концепций программирования.</p>
-                </div>
-
-                <h2>Проверь себя!</h2>
-
-                <div class="quiz-container">
-                    <h3>Тест к уроку</h3>
-
-                    <div class="question">
-                        <h4>Вопрос 1: Вопрос по теме урока</h4>
-                        <ul class="options">
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="true" data-explanation="Правильно!">
-                                    Правильный ответ
-                                </label>
-                            </li>
-                            <li>
-                                <label>
-                                    <input type="radio" name="q1" data-correct="false">
-                                    Неправильный ответ
-                                </label>
-                            </li>
-                        </ul>
-                        <button class="check-answer-btn">Проверить</button>
-                        <div class="feedback"></div>
-                    </div>
-
-                    <button class="btn-secondary" id="show-results">Показать результаты</button>
-                    <div class="quiz-results"></div>
-                </div>'''
-
-    return content
-
+    sys.exit(main(['build'] + sys.argv[1:]))
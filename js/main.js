@@ -31,18 +31,34 @@ document.addEventListener('DOMContentLoaded', function() {
 
     overlay.addEventListener('click', closeMenu);
 
-    // Закрытие меню при клике на ссылку (для мобильных)
-    const sidebarLinks = sidebar.querySelectorAll('a');
-    sidebarLinks.forEach(link => {
-        link.addEventListener('click', function() {
-            if (window.innerWidth < 1024) {
+    // Закрытие меню при клике на ссылку (для мобильных).
+    // Делегирование: ссылки навигации могут появиться позже (см. mountSidebar)
+    if (sidebar) {
+        sidebar.addEventListener('click', function(event) {
+            if (event.target.closest('a') && window.innerWidth < 1024) {
                 closeMenu();
             }
         });
+    }
+
+    // Навигация встроена в страницу или загружается из общего файла
+    mountSidebar(sidebar).then(function() {
+        buildSidebarIndex();
+
+        // Сворачивание/разворачивание модулей
+        initCollapsibleModules();
+
+        // Подсветка текущего урока и отображение пройденных
+        highlightActiveLesson();
+        updateCompletedLessons();
+        progressReady.then(updateCompletedLessons);
+
+        // Следующие уроки курса скачиваются заранее, пока браузер свободен
+        prefetchUpcomingLessonsWhenIdle();
     });
 
-    // Сворачивание/разворачивание модулей
-    initCollapsibleModules();
+    // Урок, на ссылку которого навели курсор, скачивается заранее
+    initHoverPrefetch();
 
     // Инициализация Python редактора (если есть на странице)
     initPythonEditor();
@@ -50,20 +66,330 @@ document.addEventListener('DOMContentLoaded', function() {
     // Инициализация тестов (если есть на странице)
     initQuiz();
 
-    // Отображение пройденных уроков
-    updateCompletedLessons();
+    // Переходы между уроками без перезагрузки страницы (сборка с --client-nav)
+    initClientNavigation();
+
+    // Поиск по урокам в навигации (сборка с --search)
+    initSearch(sidebar);
+
+    // Офлайн-кэш курса регистрируем после загрузки страницы, чтобы не мешать ей
+    window.addEventListener('load', registerServiceWorker);
 });
 
+// Клиентская навигация. Сборка с --client-nav пишет рядом с каждой страницей
+// урока фрагмент lessons/<id>.json (контент и данные урока). Переход по ссылке
+// на другой урок скачивает только фрагмент и заменяет .lesson-content, а адрес
+// меняется через History API. Навигация, поток с интерпретатором и остальное
+// состояние страницы сохраняются между уроками
+const lessonFragments = new Map();
+// Страница, контент которой сейчас показан
+let shownLessonPath = location.pathname;
+// Номер последнего перехода: ответ на более ранний, если пришёл позже, не показываем
+let lessonNavigation = 0;
+
+function clientNavEnabled() {
+    return 'clientNav' in document.body.dataset;
+}
+
+// Урок доступен клиентской навигации, если его страница лежит рядом с текущей
+function clientNavUrl(url) {
+    const current = location.pathname.slice(0, location.pathname.lastIndexOf('/') + 1);
+    const directory = url.pathname.slice(0, url.pathname.lastIndexOf('/') + 1);
+    return url.origin === location.origin && directory === current
+        && url.pathname.endsWith('.html') && !url.pathname.endsWith('/index.html');
+}
+
+function lessonFragmentUrl(pageUrl) {
+    const url = new URL(pageUrl, location.href);
+    url.hash = '';
+    url.pathname = url.pathname.replace(/\.html$/, '.json');
+    return url.href;
+}
+
+function fetchLessonFragment(pageUrl) {
+    const url = lessonFragmentUrl(pageUrl);
+    if (!lessonFragments.has(url)) {
+        const request = fetch(url).then(function(response) {
+            if (!response.ok) {
+                throw new Error('HTTP ' + response.status);
+            }
+            return response.json();
+        });
+        // Неудачную загрузку не запоминаем
+        request.catch(function() {
+            lessonFragments.delete(url);
+        });
+        lessonFragments.set(url, request);
+    }
+    return lessonFragments.get(url);
+}
+
+function initClientNavigation() {
+    if (!clientNavEnabled() || !window.history.pushState) return;
+
+    document.addEventListener('click', function(event) {
+        if (event.defaultPrevented || event.button !== 0 ||
+            event.metaKey || event.ctrlKey || event.shiftKey || event.altKey) return;
+
+        const link = event.target.closest('a');
+        if (!link || !link.href || link.target || link.hasAttribute('download')) return;
+
+        const url = new URL(link.href);
+        if (!clientNavUrl(url) || url.pathname === location.pathname) return;
+
+        event.preventDefault();
+        navigateToLesson(url.href, true);
+    });
+
+    window.addEventListener('popstate', function() {
+        // Переход по якорю внутри урока контент не меняет
+        if (location.pathname !== shownLessonPath) {
+            navigateToLesson(location.href, false);
+        }
+    });
+}
+
+function navigateToLesson(pageUrl, push) {
+    const navigation = ++lessonNavigation;
+    return fetchLessonFragment(pageUrl).then(
+        function(fragment) {
+            if (navigation !== lessonNavigation) return;
+            if (push) {
+                history.pushState({lessonId: fragment.id}, '', pageUrl);
+            }
+            shownLessonPath = new URL(pageUrl).pathname;
+            showLesson(fragment);
+            window.scrollTo(0, 0);
+        },
+        function(err) {
+            if (navigation !== lessonNavigation) return;
+            // Фрагмент недоступен - обычный переход
+            console.warn('Не удалось загрузить урок:', err);
+            if (push) {
+                location.href = pageUrl;
+            } else {
+                location.reload();
+            }
+        }
+    );
+}
+
+function showLesson(fragment) {
+    // Программа предыдущего урока выводит в панель, которой больше нет
+    if (currentRun) {
+        stopPythonWorker('Программа остановлена.', false);
+    }
+
+    document.title = fragment.title + ' - Python для школьников';
+    document.body.dataset.lessonId = fragment.id;
+    document.body.dataset.timeLimit = fragment.time_limit;
+    document.body.dataset.stepLimit = fragment.step_limit;
+
+    document.querySelector('.lesson-header h1').textContent = fragment.title;
+    document.querySelector('.lesson-meta').textContent = fragment.module + ' • ' + fragment.duration;
+    document.querySelector('.lesson-content').innerHTML = fragment.content;
+
+    const navLinks = document.querySelectorAll('.lesson-nav a');
+    navLinks[0].setAttribute('href', fragment.prev);
+    navLinks[navLinks.length - 1].setAttribute('href', fragment.next);
+
+    // Новый контент: редакторы и тест урока
+    initPythonEditor();
+    initQuiz();
+    highlightActiveLesson();
+    updateMarkCompleteButton();
+    prefetchUpcomingLessonsWhenIdle();
+}
+
+// Service worker (sw.js в корне сайта генерируется сборкой, см. pythonlearn/offline.py)
+const SERVICE_WORKER_URL = document.currentScript
+    ? new URL('../sw.js', document.currentScript.src).href
+    : 'sw.js';
+
+function registerServiceWorker() {
+    if (!('serviceWorker' in navigator) || location.protocol === 'file:') return;
+
+    // updateViaCache: 'none' - новая версия sw.js не застревает в HTTP-кэше
+    navigator.serviceWorker.register(SERVICE_WORKER_URL, {updateViaCache: 'none'})
+        .then(requestDeferredPrecache)
+        .catch(function(err) {
+            console.warn('Офлайн-режим недоступен:', err);
+        });
+}
+
+// Страницы уроков, фрагменты и поисковый индекс service worker скачивает не
+// при установке, а по этой просьбе, когда браузер свободен. Просьба
+// повторяется при каждой загрузке страницы: уже скачанное не качается снова,
+// а не скачавшееся в прошлый раз пробуется ещё раз
+function requestDeferredPrecache() {
+    const whenIdle = window.requestIdleCallback || function(callback) {
+        return setTimeout(callback, 2000);
+    };
+    navigator.serviceWorker.ready.then(function(registration) {
+        whenIdle(function() {
+            if (registration.active) {
+                registration.active.postMessage({type: 'precache'});
+            }
+        });
+    });
+}
+
+// Загрузка общей навигации курса (сборка с --nav external).
+// Файл один на все уроки, поэтому браузер скачивает его один раз и берёт из кэша
+function mountSidebar(sidebar) {
+    if (!sidebar || !sidebar.dataset.navSrc) {
+        return Promise.resolve();
+    }
+
+    return fetch(sidebar.dataset.navSrc)
+        .then(function(response) {
+            if (!response.ok) {
+                throw new Error('HTTP ' + response.status);
+            }
+            return response.text();
+        })
+        .then(function(html) {
+            sidebar.insertAdjacentHTML('beforeend', html);
+        })
+        .catch(function(err) {
+            console.warn('Не удалось загрузить навигацию:', err);
+        });
+}
+
+// Предзагрузка уроков: ближайшие уроки навигации в свободное время и уроки
+// по наведению на ссылку. Статической подсказки в разметке нет: только здесь
+// видно режим экономии трафика, скорость соединения и клиентскую навигацию
+// (тогда скачивается фрагмент lessons/<id>.json, а не страница). После
+// последнего урока в навигации ничего не скачивается. Число предзагрузок на
+// странице ограничено, а при экономии трафика и медленном соединении
+// предзагрузка выключена
+const PREFETCH_BUDGET = 5;
+const PREFETCH_IDLE_LESSONS = 2;
+const PREFETCH_HOVER_DELAY = 65;
+const PREFETCH_SLOW_CONNECTIONS = ['slow-2g', '2g', '3g'];
+
+const prefetchedUrls = new Set();
+
+function canPrefetch() {
+    const connection = navigator.connection;
+    if (connection && (connection.saveData || PREFETCH_SLOW_CONNECTIONS.includes(connection.effectiveType))) {
+        return false;
+    }
+    return prefetchedUrls.size < PREFETCH_BUDGET;
+}
+
+// Ссылка на другую страницу урока этого сайта. При клиентской навигации
+// скачивается не страница, а фрагмент урока
+function prefetchableUrl(link) {
+    if (!link || !link.href) return null;
+    const url = new URL(link.href, location.href);
+    url.hash = '';
+    if (url.origin !== location.origin || !url.pathname.endsWith('.html')) return null;
+    if (url.pathname === location.pathname) return null;
+    if (clientNavEnabled() && clientNavUrl(url)) {
+        return lessonFragmentUrl(url.href);
+    }
+    return url.href;
+}
+
+function prefetchUrl(url) {
+    if (!url || prefetchedUrls.has(url) || !canPrefetch()) return;
+    prefetchedUrls.add(url);
+
+    const link = document.createElement('link');
+    link.rel = 'prefetch';
+    link.href = url;
+    document.head.appendChild(link);
+}
+
+function initHoverPrefetch() {
+    let hoverTimer = null;
+    function schedule(event) {
+        const url = prefetchableUrl(event.target.closest && event.target.closest('a'));
+        if (!url) return;
+        clearTimeout(hoverTimer);
+        // Небольшая задержка отсекает случайные пролёты курсора над меню
+        hoverTimer = setTimeout(function() {
+            prefetchUrl(url);
+        }, event.type === 'mouseover' ? PREFETCH_HOVER_DELAY : 0);
+    }
+
+    document.addEventListener('mouseover', schedule);
+    document.addEventListener('focusin', schedule);
+    document.addEventListener('touchstart', schedule, {passive: true});
+    document.addEventListener('mouseout', function() {
+        clearTimeout(hoverTimer);
+    });
+}
+
+// Ближайшие уроки после текущего в порядке навигации
+function prefetchUpcomingLessonsWhenIdle() {
+    const links = Array.from(sidebarIndex.links.values());
+    const position = links.indexOf(sidebarIndex.links.get(currentLessonId()));
+    if (position === -1) return;
+
+    const whenIdle = window.requestIdleCallback || function(callback) {
+        return setTimeout(callback, 2000);
+    };
+    whenIdle(function() {
+        links.slice(position + 1, position + 1 + PREFETCH_IDLE_LESSONS).forEach(function(link) {
+            prefetchUrl(prefetchableUrl(link));
+        });
+    });
+}
+
+// Индекс навигации: id урока -> ссылка, ссылка -> модуль. Строится один раз
+// после загрузки навигации, дальше отметки пройденных и текущего урока
+// меняют только свои элементы. Сборка помечает ссылки data-lesson-id;
+// для старой разметки id выводится из href
+const sidebarIndex = {
+    links: new Map(),
+    groups: new Map(),
+    // Все модули навигации в порядке курса
+    modules: [],
+    active: null
+};
+
+function lessonIdFromHref(href) {
+    return href.split('/').pop().replace('.html', '');
+}
+
+function buildSidebarIndex() {
+    sidebarIndex.links.clear();
+    sidebarIndex.groups.clear();
+    sidebarIndex.modules = [];
+    sidebarIndex.active = null;
+
+    document.querySelectorAll('.sidebar .lesson-group').forEach(group => {
+        sidebarIndex.modules.push(group);
+        group.querySelectorAll('a[href]').forEach(link => {
+            const lessonId = link.dataset.lessonId || lessonIdFromHref(link.getAttribute('href'));
+            sidebarIndex.links.set(lessonId, link);
+            sidebarIndex.groups.set(lessonId, group);
+            if (link.classList.contains('active')) {
+                sidebarIndex.active = link;
+            }
+        });
+    });
+}
+
+function currentLessonId() {
+    return document.body.dataset.lessonId || lessonIdFromHref(window.location.pathname);
+}
+
 // Сворачиваемые модули в навигации
 function initCollapsibleModules() {
     const lessonGroups = document.querySelectorAll('.lesson-group');
+    // Сборка уже отметила текущий урок и свернула остальные модули
+    const markedAtBuild = sidebarIndex.active !== null;
+    const activeGroup = sidebarIndex.groups.get(currentLessonId());
 
     lessonGroups.forEach((group, index) => {
         const header = group.querySelector('.lesson-group-header');
         if (!header) return;
 
-        // Сворачиваем все модули кроме первого
-        if (index > 0) {
+        // Сворачиваем все модули кроме модуля текущего урока (на главной - кроме первого)
+        if (!markedAtBuild && group !== (activeGroup || lessonGroups[0])) {
             group.classList.add('collapsed');
         }
 
@@ -73,6 +399,607 @@ function initCollapsibleModules() {
     });
 }
 
+// Поиск по урокам. Сборка с --search пишет в search/ обратный индекс курса:
+// meta.json (уроки и правила нормализации слов) и части индекса по первым
+// буквам слова. Запрос скачивает только нужные ему части; слова запроса
+// нормализуются по тем же правилам, что и при сборке (pythonlearn/search.py),
+// и ищутся как префиксы слов индекса
+const SEARCH_URL = document.currentScript
+    ? new URL('../search/', document.currentScript.src).href
+    : '../search/';
+const SEARCH_INDEX_VERSION = 1;
+const SEARCH_RESULTS_LIMIT = 10;
+const SEARCH_DELAY = 80;
+const SEARCH_WORD_PATTERN = /[0-9a-zа-яё_]+/g;
+const SEARCH_CYRILLIC_PATTERN = /[а-я]/;
+
+let searchMeta = null;
+// Файл части индекса -> Promise с её содержимым
+const searchShards = new Map();
+
+function fetchJson(url) {
+    return fetch(url).then(function(response) {
+        if (!response.ok) {
+            throw new Error('HTTP ' + response.status + ': ' + url);
+        }
+        return response.json();
+    });
+}
+
+// Ошибка загрузки не запоминается: следующий запрос попробует снова
+function loadSearchMeta() {
+    if (!searchMeta) {
+        searchMeta = fetchJson(SEARCH_URL + 'meta.json').then(function(meta) {
+            if (meta.version !== SEARCH_INDEX_VERSION) {
+                throw new Error('Неизвестная версия поискового индекса: ' + meta.version);
+            }
+            meta.stopwordSet = new Set(meta.stopwords);
+            return meta;
+        });
+        searchMeta.catch(function() {
+            searchMeta = null;
+        });
+    }
+    return searchMeta;
+}
+
+function loadSearchShard(meta, key) {
+    const file = meta.shards[key];
+    if (!file) return Promise.resolve({});
+    if (!searchShards.has(file)) {
+        const shard = fetchJson(SEARCH_URL + file);
+        searchShards.set(file, shard);
+        shard.catch(function() {
+            searchShards.delete(file);
+        });
+    }
+    return searchShards.get(file);
+}
+
+// Как normalize_word в pythonlearn/search.py
+function normalizeSearchWord(meta, word) {
+    word = word.replace(/ё/g, 'е');
+    if (SEARCH_CYRILLIC_PATTERN.test(word)) {
+        for (const ending of meta.endings) {
+            if (word.endsWith(ending) && word.length - ending.length >= meta.min_stem) {
+                return word.slice(0, -ending.length);
+            }
+        }
+    }
+    return word;
+}
+
+function searchTerms(meta, query) {
+    const words = query.toLowerCase().match(SEARCH_WORD_PATTERN) || [];
+    const terms = words
+        .filter(function(word) {
+            return !meta.stopwordSet.has(word) && word.length >= meta.shard_length;
+        })
+        .map(function(word) {
+            return normalizeSearchWord(meta, word);
+        });
+    return Array.from(new Set(terms));
+}
+
+// Уроки, в которых есть все слова запроса: [[id, заголовок, модуль], ...] по убыванию веса.
+// Точное совпадение слова весит вдвое больше совпадения по префиксу
+function searchLessons(query) {
+    return loadSearchMeta().then(function(meta) {
+        const terms = searchTerms(meta, query);
+        if (terms.length === 0) return [];
+
+        return Promise.all(terms.map(function(term) {
+            return loadSearchShard(meta, term.slice(0, meta.shard_length));
+        })).then(function(shards) {
+            let scores = null;
+            terms.forEach(function(term, index) {
+                const shard = shards[index];
+                const termScores = new Map();
+                Object.keys(shard).forEach(function(word) {
+                    if (!word.startsWith(term)) return;
+                    const postings = shard[word];
+                    const boost = word === term ? 2 : 1;
+                    for (let i = 0; i < postings.length; i += 2) {
+                        const doc = postings[i];
+                        termScores.set(doc, (termScores.get(doc) || 0) + postings[i + 1] * boost);
+                    }
+                });
+
+                if (scores === null) {
+                    scores = termScores;
+                    return;
+                }
+                const merged = new Map();
+                termScores.forEach(function(score, doc) {
+                    if (scores.has(doc)) {
+                        merged.set(doc, scores.get(doc) + score);
+                    }
+                });
+                scores = merged;
+            });
+
+            return Array.from(scores)
+                .sort(function(a, b) {
+                    return b[1] - a[1] || a[0] - b[0];
+                })
+                .slice(0, SEARCH_RESULTS_LIMIT)
+                .map(function(entry) {
+                    return meta.docs[entry[0]];
+                });
+        });
+    });
+}
+
+function showSearchResults(list, found) {
+    list.textContent = '';
+    if (found === null || found.length === 0) {
+        const item = document.createElement('li');
+        item.className = 'search-empty';
+        item.textContent = found === null ? 'Поиск недоступен' : 'Ничего не найдено';
+        list.appendChild(item);
+    }
+    (found || []).forEach(function(doc) {
+        const item = document.createElement('li');
+        const link = document.createElement('a');
+        link.href = doc[0] + '.html';
+        link.dataset.lessonId = doc[0];
+        link.textContent = doc[1];
+        const module = document.createElement('span');
+        module.className = 'search-module';
+        module.textContent = doc[2];
+        link.appendChild(module);
+        item.appendChild(link);
+        list.appendChild(item);
+    });
+    list.hidden = false;
+}
+
+// Поле поиска под заголовком навигации
+function initSearch(sidebar) {
+    if (!('search' in document.body.dataset) || !sidebar) return;
+    const header = sidebar.querySelector('.sidebar-header');
+    if (!header) return;
+
+    const box = document.createElement('div');
+    box.className = 'sidebar-search';
+    const input = document.createElement('input');
+    input.type = 'search';
+    input.placeholder = 'Поиск по урокам';
+    input.setAttribute('aria-label', 'Поиск по урокам');
+    const results = document.createElement('ul');
+    results.className = 'search-results';
+    results.hidden = true;
+    box.appendChild(input);
+    box.appendChild(results);
+    header.parentNode.insertBefore(box, header.nextSibling);
+
+    // Список уроков скачивается, как только ученик собрался искать
+    input.addEventListener('focus', function() {
+        loadSearchMeta().catch(function() {});
+    });
+
+    let timer = null;
+    let searchId = 0;
+    input.addEventListener('input', function() {
+        clearTimeout(timer);
+        timer = setTimeout(function() {
+            const current = ++searchId;
+            const query = input.value.trim();
+            if (!query) {
+                results.hidden = true;
+                results.textContent = '';
+                return;
+            }
+            searchLessons(query).then(
+                function(found) {
+                    if (current === searchId) showSearchResults(results, found);
+                },
+                function(err) {
+                    console.warn('Поиск недоступен:', err);
+                    if (current === searchId) showSearchResults(results, null);
+                }
+            );
+        }, SEARCH_DELAY);
+    });
+
+    input.addEventListener('keydown', function(event) {
+        if (event.key === 'Escape') {
+            input.value = '';
+            ++searchId;
+            results.hidden = true;
+            results.textContent = '';
+        }
+    });
+}
+
+// Интерпретатор Skulpt не блокирует отрисовку страницы: он загружается по
+// требованию из js/vendor (python -m pythonlearn vendor), а если локальной
+// копии нет - с CDN. Путь считается от адреса main.js, поэтому работает
+// и с уроков, и с главной, и после сборки с --fingerprint
+const SKULPT_VERSION = '1.2.0';
+const SKULPT_FILES = ['skulpt.min.js', 'skulpt-stdlib.js'];
+const SKULPT_LOCAL_URL = document.currentScript
+    ? new URL('vendor/skulpt-' + SKULPT_VERSION + '/', document.currentScript.src).href
+    : 'js/vendor/skulpt-' + SKULPT_VERSION + '/';
+const SKULPT_CDN_URL = 'https://cdn.jsdelivr.net/npm/skulpt@' + SKULPT_VERSION + '/dist/';
+
+let skulptLoading = null;
+
+function loadScript(src) {
+    return new Promise(function(resolve, reject) {
+        const script = document.createElement('script');
+        script.src = src;
+        script.onload = resolve;
+        script.onerror = function() {
+            script.remove();
+            reject(new Error('Не удалось загрузить ' + src));
+        };
+        document.head.appendChild(script);
+    });
+}
+
+function loadSkulptFrom(baseUrl) {
+    // Файлы загружаются по очереди: stdlib дополняет уже созданный объект Sk
+    return SKULPT_FILES.reduce(function(loaded, name) {
+        return loaded.then(function() {
+            return loadScript(baseUrl + name);
+        });
+    }, Promise.resolve());
+}
+
+// Загружает Skulpt один раз; повторные вызовы получают тот же Promise
+function loadSkulpt() {
+    if (window.Sk && Sk.builtinFiles) {
+        return Promise.resolve();
+    }
+    if (!skulptLoading) {
+        skulptLoading = loadSkulptFrom(SKULPT_LOCAL_URL)
+            .catch(function() {
+                return loadSkulptFrom(SKULPT_CDN_URL);
+            })
+            .catch(function(err) {
+                // Следующий запуск попробует снова
+                skulptLoading = null;
+                throw err;
+            });
+    }
+    return skulptLoading;
+}
+
+// Вывод программы. print() только дописывает текст в буфер, а в DOM он
+// попадает не чаще раза в кадр: цикл на 10 000 строк стоит столько же,
+// сколько сам цикл. Хранятся последние OUTPUT_MAX_LINES строк (кольцевой
+// буфер), более ранние отбрасываются и считаются; на панели видны последние
+// OUTPUT_VISIBLE_LINES, остальные раскрываются кнопкой "показать всё"
+const OUTPUT_MAX_LINES = 5000;
+const OUTPUT_VISIBLE_LINES = 200;
+
+const outputBuffers = new WeakMap();
+
+function getOutputBuffer(outputElement) {
+    let buffer = outputBuffers.get(outputElement);
+    if (!buffer) {
+        buffer = createOutputBuffer(outputElement);
+        outputBuffers.set(outputElement, buffer);
+    }
+    return buffer;
+}
+
+function createOutputBuffer(outputElement) {
+    const ring = new Array(OUTPUT_MAX_LINES);
+    let start = 0;
+    let count = 0;
+    let partial = '';   // последняя строка без перевода строки
+    let dropped = 0;
+    let expanded = false;
+    let frame = null;
+    let notice = null;
+
+    function pushLine(line) {
+        if (count < OUTPUT_MAX_LINES) {
+            ring[(start + count) % OUTPUT_MAX_LINES] = line;
+            count++;
+        } else {
+            ring[start] = line;
+            start = (start + 1) % OUTPUT_MAX_LINES;
+            dropped++;
+        }
+    }
+
+    function write(text) {
+        const parts = text.split('\n');
+        if (parts.length === 1) {
+            partial += text;
+        } else {
+            pushLine(partial + parts[0]);
+            for (let i = 1; i < parts.length - 1; i++) {
+                pushLine(parts[i]);
+            }
+            partial = parts[parts.length - 1];
+        }
+        if (frame === null) {
+            frame = requestAnimationFrame(render);
+        }
+    }
+
+    // Строка над выводом: сколько строк скрыто и сколько отброшено
+    function getNotice() {
+        if (!notice) {
+            notice = document.createElement('div');
+            notice.className = 'output-notice';
+            notice.hidden = true;
+            notice.appendChild(document.createElement('span'));
+            const toggle = document.createElement('button');
+            toggle.type = 'button';
+            toggle.addEventListener('click', function() {
+                expanded = !expanded;
+                render();
+            });
+            notice.appendChild(toggle);
+            outputElement.parentNode.insertBefore(notice, outputElement);
+        }
+        return notice;
+    }
+
+    function render() {
+        if (frame !== null) {
+            cancelAnimationFrame(frame);
+            frame = null;
+        }
+
+        const visible = expanded ? count : Math.min(count, OUTPUT_VISIBLE_LINES);
+        const lines = [];
+        for (let i = count - visible; i < count; i++) {
+            lines.push(ring[(start + i) % OUTPUT_MAX_LINES]);
+        }
+        lines.push(partial);
+        outputElement.textContent = lines.join('\n');
+
+        const hidden = count - visible;
+        if (hidden === 0 && dropped === 0 && !expanded) {
+            if (notice) notice.hidden = true;
+            return;
+        }
+        const panel = getNotice();
+        const messages = [];
+        if (dropped > 0) {
+            messages.push('Ранние строки не сохранены: ' + dropped);
+        }
+        if (hidden > 0) {
+            messages.push('Скрыто строк: ' + hidden);
+        }
+        panel.firstChild.textContent = messages.join('. ');
+        panel.lastChild.textContent = expanded ? 'свернуть' : 'показать всё';
+        panel.lastChild.hidden = count <= OUTPUT_VISIBLE_LINES;
+        panel.hidden = false;
+    }
+
+    function clear() {
+        // Вывод примера, встроенный при сборке, заменяется настоящим
+        outputElement.classList.remove('expected-output');
+        start = 0;
+        count = 0;
+        partial = '';
+        dropped = 0;
+        expanded = false;
+        render();
+    }
+
+    return {
+        write: write,
+        flush: render,
+        clear: clear,
+        isEmpty: function() {
+            return count === 0 && partial === '';
+        }
+    };
+}
+
+// Программы учеников выполняются в отдельном потоке (js/python-worker.js):
+// страница остаётся отзывчивой при любой программе, а зависшую можно
+// остановить кнопкой "Стоп" или по лимиту времени урока
+const PYTHON_WORKER_URL = document.currentScript
+    ? new URL('python-worker.js', document.currentScript.src).href
+    : 'js/python-worker.js';
+
+// Лимиты по умолчанию; урок задаёт свои в data-time-limit и data-step-limit у <body>
+const DEFAULT_TIME_LIMIT = 10;
+const DEFAULT_STEP_LIMIT = 5000000;
+
+let pythonWorker = null;
+let pythonWorkerReady = false;
+// Текущий запуск: {outputElement, runBtn, timeLimit, timeLeft, timer, startedAt, started}
+let currentRun = null;
+
+function runLimits() {
+    const data = document.body.dataset;
+    return {
+        timeLimit: Number(data.timeLimit) || DEFAULT_TIME_LIMIT,
+        stepLimit: Number(data.stepLimit) || DEFAULT_STEP_LIMIT
+    };
+}
+
+// Поток создаётся один раз и переиспользуется между запусками.
+// Возвращает null, если потоки недоступны (например, страница открыта как file://)
+function startPythonWorker() {
+    if (pythonWorker) return pythonWorker;
+
+    try {
+        pythonWorker = new Worker(PYTHON_WORKER_URL);
+    } catch (err) {
+        return null;
+    }
+    pythonWorkerReady = false;
+    pythonWorker.onmessage = handleWorkerMessage;
+    pythonWorker.onerror = function(event) {
+        event.preventDefault();
+        stopPythonWorker('Ошибка: ' + event.message, true);
+    };
+    pythonWorker.postMessage({
+        type: 'load',
+        urls: [SKULPT_LOCAL_URL, SKULPT_CDN_URL],
+        files: SKULPT_FILES,
+        version: SKULPT_VERSION
+    });
+    warmPythonWorker();
+    return pythonWorker;
+}
+
+// Примеры урока (начальный код редакторов) поток компилирует заранее и
+// хранит в IndexedDB: их запуск не тратит время на компиляцию
+function warmPythonWorker() {
+    const sources = new Set();
+    document.querySelectorAll('.python-editor textarea').forEach(function(textarea) {
+        if (textarea.defaultValue.trim()) {
+            sources.add(textarea.defaultValue);
+        }
+    });
+    if (sources.size > 0) {
+        pythonWorker.postMessage({type: 'warm', sources: Array.from(sources)});
+    }
+}
+
+// Завершает поток вместе с программой; следующий запуск создаст новый
+function stopPythonWorker(message, isError) {
+    if (pythonWorker) {
+        pythonWorker.terminate();
+        pythonWorker = null;
+        pythonWorkerReady = false;
+    }
+    if (currentRun) {
+        finishRun(message, isError);
+    }
+}
+
+function handleWorkerMessage(event) {
+    const message = event.data;
+
+    if (message.type === 'ready') {
+        pythonWorkerReady = true;
+        return;
+    }
+    if (message.type === 'load-error') {
+        console.warn(message.message);
+        stopPythonWorker('Не удалось загрузить интерпретатор Python. ' +
+            'Проверь подключение к интернету и попробуй ещё раз.', true);
+        return;
+    }
+    if (!currentRun) return;
+
+    if (message.type === 'started') {
+        pythonWorkerReady = true;
+        currentRun.started = true;
+        getOutputBuffer(currentRun.outputElement).clear();
+        resumeRunTimer();
+    } else if (message.type === 'output') {
+        getOutputBuffer(currentRun.outputElement).write(message.text);
+    } else if (message.type === 'input') {
+        // Пока ученик вводит ответ, время программы не идёт
+        pauseRunTimer();
+        const value = window.prompt(message.prompt || '');
+        resumeRunTimer();
+        pythonWorker.postMessage({type: 'input', value: value === null ? '' : value});
+    } else if (message.type === 'done') {
+        finishRun(null, false);
+    } else if (message.type === 'error') {
+        finishRun('Ошибка: ' + message.message, true);
+    }
+}
+
+function pauseRunTimer() {
+    if (!currentRun || currentRun.timer === null) return;
+    clearTimeout(currentRun.timer);
+    currentRun.timer = null;
+    currentRun.timeLeft -= Date.now() - currentRun.startedAt;
+}
+
+function resumeRunTimer() {
+    if (!currentRun || currentRun.timer !== null) return;
+    const limit = currentRun.timeLimit;
+    currentRun.startedAt = Date.now();
+    currentRun.timer = setTimeout(function() {
+        stopPythonWorker('Ошибка: программа работает дольше ' + limit + ' с и остановлена. ' +
+            'Возможно, в ней бесконечный цикл.', true);
+    }, Math.max(0, currentRun.timeLeft));
+}
+
+// Кнопка "Стоп" добавляется рядом с "Запустить" и видна, пока программа работает
+function getStopButton(runBtn) {
+    let stopBtn = runBtn.parentNode.querySelector('.stop-btn');
+    if (!stopBtn) {
+        stopBtn = document.createElement('button');
+        stopBtn.className = 'stop-btn';
+        stopBtn.textContent = '■ Стоп';
+        stopBtn.hidden = true;
+        stopBtn.addEventListener('click', function() {
+            stopPythonWorker('Программа остановлена.', false);
+        });
+        runBtn.parentNode.insertBefore(stopBtn, runBtn.nextSibling);
+    }
+    return stopBtn;
+}
+
+function setRunning(runBtn, running) {
+    if (!runBtn) return;
+    runBtn.disabled = running;
+    runBtn.classList.toggle('loading', running);
+    getStopButton(runBtn).hidden = !running;
+}
+
+function finishRun(message, isError) {
+    const run = currentRun;
+    currentRun = null;
+    clearTimeout(run.timer);
+    setRunning(run.runBtn, false);
+    if (!run.started) {
+        // Остановлено во время загрузки интерпретатора
+        getOutputBuffer(run.outputElement).clear();
+    }
+    showRunResult(run.outputElement, message, isError);
+}
+
+// Итог выполнения: сообщение об ошибке или остановке; пустой вывод - сообщение об успехе
+function showRunResult(outputElement, message, isError) {
+    const buffer = getOutputBuffer(outputElement);
+    if (isError) {
+        buffer.clear();
+        outputElement.textContent = message;
+    } else if (message) {
+        buffer.write((buffer.isEmpty() ? '' : '\n') + message);
+        buffer.flush();
+    } else if (buffer.isEmpty()) {
+        outputElement.textContent = 'Программа выполнена успешно!';
+    } else {
+        buffer.flush();
+    }
+
+    if (isError) {
+        outputElement.style.color = '#e74c3c';
+        setTimeout(() => {
+            outputElement.style.color = '#4ec9b0';
+        }, 3000);
+    }
+}
+
+// Предзагрузка интерпретатора, когда браузер свободен (не в режиме экономии трафика)
+function preloadSkulptWhenIdle() {
+    const connection = navigator.connection;
+    if (connection && connection.saveData) return;
+
+    const whenIdle = window.requestIdleCallback || function(callback) {
+        return setTimeout(callback, 2000);
+    };
+    whenIdle(function() {
+        // Поток уже работает (переход между уроками без перезагрузки):
+        // подготовить примеры нового урока
+        if (pythonWorker) {
+            warmPythonWorker();
+        } else if (!startPythonWorker()) {
+            loadSkulpt().catch(function() {});
+        }
+    });
+}
+
 // Python интерпретатор с использованием Skulpt
 function initPythonEditor() {
     const runBtns = document.querySelectorAll('.run-btn');
@@ -83,26 +1010,95 @@ function initPythonEditor() {
             const editor = this.closest('.python-editor');
             const code = editor.querySelector('#code-editor, textarea').value;
             const outputElement = editor.querySelector('#output');
-            runCode(code, outputElement);
+            runCode(code, outputElement, this);
         });
     });
 
+    if (runBtns.length > 0) {
+        preloadSkulptWhenIdle();
+    }
+
     clearBtns.forEach((clearBtn, index) => {
         clearBtn.addEventListener('click', function() {
             const editor = this.closest('.python-editor');
             editor.querySelector('#code-editor, textarea').value = '';
-            editor.querySelector('#output').textContent = '';
+            getOutputBuffer(editor.querySelector('#output')).clear();
         });
     });
 }
 
-function runCode(code, outputElement) {
-    outputElement.textContent = '';
+function runCode(code, outputElement, runBtn) {
+    // Одновременно выполняется одна программа
+    if (currentRun) {
+        stopPythonWorker('Программа остановлена.', false);
+    }
+
+    const worker = startPythonWorker();
+    if (!worker) {
+        runCodeOnMainThread(code, outputElement, runBtn);
+        return;
+    }
+
+    const limits = runLimits();
+    getOutputBuffer(outputElement).clear();
+    if (!pythonWorkerReady) {
+        outputElement.textContent = 'Загрузка интерпретатора Python...';
+    }
+    currentRun = {
+        outputElement: outputElement,
+        runBtn: runBtn,
+        timeLimit: limits.timeLimit,
+        timeLeft: limits.timeLimit * 1000,
+        timer: null,
+        startedAt: 0,
+        started: false
+    };
+    setRunning(runBtn, true);
+    // Время отсчитывается с сообщения 'started', загрузка Skulpt в лимит не входит
+    worker.postMessage({type: 'run', code: code, stepLimit: limits.stepLimit});
+}
+
+// Запасной путь без потоков: Skulpt в основном потоке. Бесконечный цикл
+// прерывается по лимиту времени (killableWhile/killableFor), но страница
+// на это время не отвечает
+function runCodeOnMainThread(code, outputElement, runBtn) {
+    if (window.Sk && Sk.builtinFiles) {
+        executeCode(code, outputElement);
+        return;
+    }
+
+    // Первый запуск: показываем загрузку, пока скачивается интерпретатор
+    outputElement.textContent = 'Загрузка интерпретатора Python...';
+    if (runBtn) {
+        runBtn.disabled = true;
+        runBtn.classList.add('loading');
+    }
+
+    loadSkulpt().then(
+        function() {
+            executeCode(code, outputElement);
+        },
+        function(err) {
+            console.warn(err);
+            outputElement.textContent = 'Не удалось загрузить интерпретатор Python. ' +
+                'Проверь подключение к интернету и попробуй ещё раз.';
+        }
+    ).then(function() {
+        if (runBtn) {
+            runBtn.disabled = false;
+            runBtn.classList.remove('loading');
+        }
+    });
+}
+
+function executeCode(code, outputElement) {
+    const buffer = getOutputBuffer(outputElement);
+    buffer.clear();
 
     // Настройка Skulpt
     Sk.configure({
         output: function(text) {
-            outputElement.textContent += text;
+            buffer.write(text);
         },
         read: function(filename) {
             if (Sk.builtinFiles === undefined || Sk.builtinFiles["files"][filename] === undefined) {
@@ -110,6 +1106,9 @@ function runCode(code, outputElement) {
             }
             return Sk.builtinFiles["files"][filename];
         },
+        execLimit: runLimits().timeLimit * 1000,
+        killableWhile: true,
+        killableFor: true,
         __future__: Sk.python3
     });
 
@@ -120,18 +1119,10 @@ function runCode(code, outputElement) {
 
     myPromise.then(
         function(mod) {
-            // Успешное выполнение
-            if (outputElement.textContent === '') {
-                outputElement.textContent = 'Программа выполнена успешно!';
-            }
+            showRunResult(outputElement, null, false);
         },
         function(err) {
-            // Ошибка
-            outputElement.textContent = 'Ошибка: ' + err.toString();
-            outputElement.style.color = '#e74c3c';
-            setTimeout(() => {
-                outputElement.style.color = '#4ec9b0';
-            }, 3000);
+            showRunResult(outputElement, 'Ошибка: ' + err.toString(), true);
         }
     );
 }
@@ -244,6 +1235,20 @@ function initQuiz() {
     function showQuizResults(correct, total) {
         const percentage = Math.round((correct / total) * 100);
 
+        // Результат теста сохраняется вместе с прогрессом урока
+        const lessonId = document.body.dataset.lessonId;
+        if (lessonId) {
+            const previous = (getLessonProgress(lessonId) || {}).quiz;
+            updateLessonProgress(lessonId, {
+                quiz: {
+                    correct: correct,
+                    total: total,
+                    best: Math.max(correct, previous ? previous.best : 0),
+                    timestamp: new Date().toISOString()
+                }
+            });
+        }
+
         let resultsDiv = quizContainer.querySelector('.quiz-results');
         if (!resultsDiv) {
             resultsDiv = document.createElement('div');
@@ -265,69 +1270,260 @@ function initQuiz() {
     }
 }
 
-// Подсветка активной ссылки в меню
+// Подсветка активной ссылки в меню. При клиентской навигации подсветка
+// переходит с урока на урок, а модуль нового урока разворачивается
 function highlightActiveLesson() {
-    const currentPage = window.location.pathname.split('/').pop();
-    const sidebarLinks = document.querySelectorAll('.sidebar a');
+    const lessonId = currentLessonId();
+    const link = sidebarIndex.links.get(lessonId) || null;
+    if (link === sidebarIndex.active) return;
 
-    sidebarLinks.forEach(link => {
-        const linkPage = link.getAttribute('href');
-        if (linkPage === currentPage) {
-            link.classList.add('active');
+    if (sidebarIndex.active) {
+        sidebarIndex.active.classList.remove('active');
+    }
+    if (link) {
+        link.classList.add('active');
+        // Как в сборке (mark_sidebar): раскрыт только модуль текущего урока
+        const activeGroup = sidebarIndex.groups.get(lessonId);
+        sidebarIndex.modules.forEach(function(group) {
+            group.classList.toggle('collapsed', group !== activeGroup);
+        });
+    }
+    sidebarIndex.active = link;
+}
+
+// Прогресс ученика. Все записи один раз загружаются в память (progressCache),
+// поэтому чтения синхронные и дешёвые, а изменения пишутся в IndexedDB
+// пачкой через PROGRESS_SAVE_DELAY мс. Данные из localStorage (прежнее
+// хранилище) переносятся при первом запуске; другие открытые вкладки узнают
+// об изменениях через BroadcastChannel. Запись урока - объект, в котором
+// кроме completed/timestamp можно хранить и другое (например, результат теста)
+const PROGRESS_DB_NAME = 'pythonlearn';
+const PROGRESS_STORE = 'progress';
+const PROGRESS_LEGACY_KEY = 'pythonLearnProgress';
+const PROGRESS_CHANNEL = 'pythonlearn-progress';
+const PROGRESS_SAVE_DELAY = 300;
+
+const progressCache = {};
+const progressDirty = new Set();
+let progressTimer = null;
+// undefined - база ещё открывается, null - IndexedDB недоступна (пишем в localStorage)
+let progressDb;
+
+function readLegacyProgress() {
+    try {
+        return JSON.parse(localStorage.getItem(PROGRESS_LEGACY_KEY) || '{}');
+    } catch (err) {
+        return {};
+    }
+}
+
+function openProgressDb() {
+    return new Promise(function(resolve, reject) {
+        const request = indexedDB.open(PROGRESS_DB_NAME, 1);
+        request.onupgradeneeded = function() {
+            request.result.createObjectStore(PROGRESS_STORE);
+        };
+        request.onsuccess = function() {
+            resolve(request.result);
+        };
+        request.onerror = function() {
+            reject(request.error);
+        };
+    });
+}
+
+function readAllProgress(db) {
+    return new Promise(function(resolve, reject) {
+        const request = db.transaction(PROGRESS_STORE, 'readonly').objectStore(PROGRESS_STORE).openCursor();
+        request.onsuccess = function() {
+            const cursor = request.result;
+            if (!cursor) {
+                resolve();
+                return;
+            }
+            // Изменения, сделанные до окончания загрузки, новее сохранённых
+            if (!progressDirty.has(cursor.key)) {
+                progressCache[cursor.key] = cursor.value;
+            }
+            cursor.continue();
+        };
+        request.onerror = function() {
+            reject(request.error);
+        };
+    });
+}
+
+// Записи из localStorage, которых ещё нет в базе, переносятся в неё
+function migrateLegacyProgress() {
+    const legacy = readLegacyProgress();
+    Object.keys(legacy).forEach(function(lessonId) {
+        if (!(lessonId in progressCache)) {
+            progressCache[lessonId] = legacy[lessonId];
+            progressDirty.add(lessonId);
         }
     });
+    if (progressDb && Object.keys(legacy).length > 0) {
+        return flushProgress().then(function() {
+            localStorage.removeItem(PROGRESS_LEGACY_KEY);
+        });
+    }
 }
 
-highlightActiveLesson();
+function loadProgress() {
+    const opened = window.indexedDB ? openProgressDb() : Promise.reject(new Error('IndexedDB недоступна'));
+    return opened.then(
+        function(db) {
+            progressDb = db;
+            return readAllProgress(db);
+        },
+        function(err) {
+            console.warn('Прогресс будет храниться в localStorage:', err);
+            progressDb = null;
+        }
+    ).then(migrateLegacyProgress).then(function() {
+        // Изменения, сделанные во время загрузки
+        scheduleProgressSave();
+    }).catch(function(err) {
+        console.warn('Не удалось загрузить прогресс:', err);
+    });
+}
+
+function flushProgress() {
+    clearTimeout(progressTimer);
+    progressTimer = null;
+    if (progressDb === undefined || progressDirty.size === 0) {
+        return Promise.resolve();
+    }
+
+    const lessonIds = Array.from(progressDirty);
+    progressDirty.clear();
+
+    if (progressDb === null) {
+        try {
+            localStorage.setItem(PROGRESS_LEGACY_KEY, JSON.stringify(progressCache));
+        } catch (err) {
+            console.warn('Не удалось сохранить прогресс:', err);
+        }
+        return Promise.resolve();
+    }
+
+    return new Promise(function(resolve, reject) {
+        const transaction = progressDb.transaction(PROGRESS_STORE, 'readwrite');
+        const store = transaction.objectStore(PROGRESS_STORE);
+        lessonIds.forEach(function(lessonId) {
+            store.put(progressCache[lessonId], lessonId);
+        });
+        transaction.oncomplete = function() {
+            resolve();
+        };
+        transaction.onerror = transaction.onabort = function() {
+            // Попробуем записать при следующем сохранении
+            lessonIds.forEach(function(lessonId) {
+                progressDirty.add(lessonId);
+            });
+            reject(transaction.error);
+        };
+    });
+}
+
+function scheduleProgressSave() {
+    if (progressTimer === null && progressDirty.size > 0) {
+        progressTimer = setTimeout(function() {
+            flushProgress().catch(function(err) {
+                console.warn('Не удалось сохранить прогресс:', err);
+            });
+        }, PROGRESS_SAVE_DELAY);
+    }
+}
+
+const progressChannel = window.BroadcastChannel ? new BroadcastChannel(PROGRESS_CHANNEL) : null;
+
+if (progressChannel) {
+    // Изменение из другой вкладки уже сохранено ею, здесь только обновляем отображение
+    progressChannel.onmessage = function(event) {
+        progressCache[event.data.lessonId] = event.data.record;
+        updateCompletedLessons([event.data.lessonId]);
+        updateMarkCompleteButton();
+    };
+}
+
+// Несохранённые изменения записываем, когда вкладку скрывают или закрывают
+document.addEventListener('visibilitychange', function() {
+    if (document.visibilityState === 'hidden') {
+        flushProgress().catch(function() {});
+    }
+});
+
+const progressReady = loadProgress();
+
+function getLessonProgress(lessonId) {
+    return progressCache[lessonId];
+}
+
+// Дополняет запись урока полями changes и сохраняет её
+function updateLessonProgress(lessonId, changes) {
+    const record = Object.assign({}, progressCache[lessonId], changes);
+    progressCache[lessonId] = record;
+    progressDirty.add(lessonId);
+    scheduleProgressSave();
+
+    if (progressChannel) {
+        progressChannel.postMessage({lessonId: lessonId, record: record});
+    }
+    return record;
+}
 
-// Сохранение прогресса в localStorage
+// Отметка урока как пройденного
 function saveProgress(lessonId) {
-    let progress = JSON.parse(localStorage.getItem('pythonLearnProgress') || '{}');
-    progress[lessonId] = {
+    updateLessonProgress(lessonId, {
         completed: true,
         timestamp: new Date().toISOString()
-    };
-    localStorage.setItem('pythonLearnProgress', JSON.stringify(progress));
+    });
 
     // Обновляем отображение в меню
-    updateCompletedLessons();
+    updateCompletedLessons([lessonId]);
 }
 
 function isLessonCompleted(lessonId) {
-    const progress = JSON.parse(localStorage.getItem('pythonLearnProgress') || '{}');
-    return progress[lessonId]?.completed || false;
+    const record = progressCache[lessonId];
+    return (record && record.completed) || false;
 }
 
-// Обновление визуального отображения пройденных уроков в меню
-function updateCompletedLessons() {
-    const progress = JSON.parse(localStorage.getItem('pythonLearnProgress') || '{}');
-    const sidebarLinks = document.querySelectorAll('.sidebar a');
-
-    sidebarLinks.forEach(link => {
-        const href = link.getAttribute('href');
-        if (!href) return;
-
-        // Извлекаем имя файла без расширения
-        const lessonId = href.split('/').pop().replace('.html', '');
-
-        if (progress[lessonId]?.completed) {
-            link.classList.add('completed');
+// Обновление визуального отображения пройденных уроков в меню:
+// указанных уроков или (без аргумента) всех уроков с записями прогресса
+function updateCompletedLessons(lessonIds) {
+    (lessonIds || Object.keys(progressCache)).forEach(lessonId => {
+        const link = sidebarIndex.links.get(lessonId);
+        if (link) {
+            link.classList.toggle('completed', isLessonCompleted(lessonId));
         }
     });
 }
 
-// Кнопка "Отметить как пройденное"
+// Кнопка "Отметить как пройденное".
+// Урок берётся из <body> в момент нажатия: при клиентской навигации он меняется
 const markCompleteBtn = document.getElementById('mark-complete');
-if (markCompleteBtn) {
+
+function updateMarkCompleteButton() {
+    if (!markCompleteBtn) return;
     const lessonId = document.body.dataset.lessonId;
 
     // Проверяем, пройден ли урок
     if (lessonId && isLessonCompleted(lessonId)) {
         markCompleteBtn.textContent = '✓ Урок пройден';
         markCompleteBtn.style.background = 'var(--success-color)';
+    } else {
+        markCompleteBtn.textContent = 'Отметить как пройденное';
+        markCompleteBtn.style.background = '';
     }
+}
+
+if (markCompleteBtn) {
+    updateMarkCompleteButton();
+    progressReady.then(updateMarkCompleteButton);
 
     markCompleteBtn.addEventListener('click', function() {
+        const lessonId = document.body.dataset.lessonId;
         if (lessonId) {
             saveProgress(lessonId);
             markCompleteBtn.textContent = '✓ Урок пройден';
@@ -344,4 +1540,5 @@ if (markCompleteBtn) {
 
 // Кнопка для сброса прогресса (для разработки)
 // Раскомментируй если нужно сбросить прогресс
+// indexedDB.deleteDatabase('pythonlearn');
 // localStorage.removeItem('pythonLearnProgress');
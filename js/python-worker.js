@@ -0,0 +1,347 @@
+// Выполнение Python-кода учеников в отдельном потоке.
+// Бесконечный цикл в программе не подвешивает страницу: main.js следит за
+// временем работы и по кнопке "Стоп" или по истечении лимита завершает поток.
+//
+// Сообщения от страницы:
+//   {type: 'load', urls: [...], files: [...], version}  - загрузить Skulpt заранее
+//   {type: 'warm', sources: [...]}     - подготовить код примеров урока (см. кэш ниже)
+//   {type: 'run', code, stepLimit}     - выполнить программу
+//   {type: 'input', value}             - ответ на input()
+// Сообщения странице:
+//   ready, load-error, started, output {text}, input {prompt}, done {cached}, error {message}
+//   (cached - программа взята из кэша компиляции, а не скомпилирована заново)
+
+let skulptLoaded = false;
+let skulptSources = null;
+let pendingInput = null;
+let programRunning = false;
+// Запуски ждут, пока примеры урока поднимаются из IndexedDB
+let warming = Promise.resolve();
+
+// Главный модуль программы: под этим именем её компилирует importMainWithBody
+const MAIN_MODULE = '<stdin>';
+const MAIN_FILENAME = MAIN_MODULE + '.py';
+
+// Вывод отправляется странице пачками: не чаще раза в OUTPUT_FLUSH_INTERVAL мс
+// или при накоплении OUTPUT_FLUSH_SIZE символов, а не сообщением на каждый print()
+const OUTPUT_FLUSH_INTERVAL = 50;
+const OUTPUT_FLUSH_SIZE = 16384;
+let outputChunks = [];
+let outputSize = 0;
+let lastFlush = 0;
+
+function writeOutput(text) {
+    outputChunks.push(text);
+    outputSize += text.length;
+    if (outputSize >= OUTPUT_FLUSH_SIZE || Date.now() - lastFlush >= OUTPUT_FLUSH_INTERVAL) {
+        flushOutput();
+    }
+}
+
+function flushOutput() {
+    if (outputChunks.length > 0) {
+        self.postMessage({type: 'output', text: outputChunks.join('')});
+        outputChunks = [];
+        outputSize = 0;
+    }
+    lastFlush = Date.now();
+}
+
+// Кэш скомпилированного кода. Ученик много раз запускает почти одну и ту же
+// программу, а Skulpt каждый раз компилирует её в JavaScript заново. Sk.compile
+// обёрнут: результат запоминается по хэшу исходного текста и параметров
+// компиляции (COMPILE_CACHE_SIZE последних, вытесняются давно не запускавшиеся).
+// Код примеров урока (начальное содержимое редакторов) дополнительно хранится
+// в IndexedDB и при следующем открытии урока не компилируется вовсе
+const COMPILE_CACHE_SIZE = 64;
+const COMPILE_DB_NAME = 'pythonlearn-compiled';
+const COMPILE_STORE = 'modules';
+
+// Ключ -> {text, compiled}; порядок Map - порядок последнего использования
+const compiledCache = new Map();
+let skulptVersion = '';
+let compileDb;
+
+// Аргументы Sk.compile после исходника и имени файла, с которыми
+// importMainWithBody компилирует программу (Skulpt 1.2.0: importModuleInternal_
+// вызывает Sk.compile(code, filename, 'exec', canSuspend, true)). Примеры урока
+// прогреваются с ними же, иначе ключ кэша не совпадёт с запуском. Обёртка
+// Sk.compile запоминает аргументы настоящих запусков: если другая версия
+// Skulpt передаёт иные, следующие прогревы возьмут их
+let mainCompileArgs = ['exec', true, true];
+// Была ли программа последнего запуска в кэше (см. сообщение done)
+let mainCacheHit = false;
+
+// cyrb53: быстрый 53-битный хэш строки. При совпадении хэшей разных текстов
+// запись не используется: в ней хранится и сам текст
+function hashText(text) {
+    let h1 = 0xdeadbeef;
+    let h2 = 0x41c6ce57;
+    for (let i = 0; i < text.length; i++) {
+        const ch = text.charCodeAt(i);
+        h1 = Math.imul(h1 ^ ch, 2654435761);
+        h2 = Math.imul(h2 ^ ch, 1597334677);
+    }
+    h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+    h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+    return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(36);
+}
+
+// Результат компиляции зависит не только от исходника: режим отладки
+// (подсчёт шагов) и __future__ меняют сгенерированный код
+function compileText(source, filename, mode, canSuspend, annotate) {
+    return [skulptVersion, filename, mode, !!canSuspend, !!annotate, !!Sk.debugging,
+        JSON.stringify(Sk.__future__), source].join('\n');
+}
+
+function cacheGet(text) {
+    const key = hashText(text);
+    const entry = compiledCache.get(key);
+    if (!entry || entry.text !== text) return null;
+    compiledCache.delete(key);
+    compiledCache.set(key, entry);
+    return entry.compiled;
+}
+
+function cachePut(text, compiled) {
+    const key = hashText(text);
+    compiledCache.delete(key);
+    compiledCache.set(key, {text: text, compiled: compiled});
+    while (compiledCache.size > COMPILE_CACHE_SIZE) {
+        compiledCache.delete(compiledCache.keys().next().value);
+    }
+}
+
+function installCompileCache() {
+    const compile = Sk.compile;
+    Sk.compile = function(source, filename, mode, canSuspend, annotate) {
+        const text = compileText(source, filename, mode, canSuspend, annotate);
+        let compiled = cacheGet(text);
+        if (filename === MAIN_FILENAME) {
+            mainCompileArgs = [mode, canSuspend, annotate];
+            mainCacheHit = !!compiled;
+        }
+        if (!compiled) {
+            // Результат - простой объект ({funcname, code, ...}): его можно
+            // сохранить в IndexedDB
+            const result = compile.apply(this, arguments);
+            compiled = {};
+            Object.keys(result).forEach(function(name) {
+                if (typeof result[name] !== 'object' && typeof result[name] !== 'function') {
+                    compiled[name] = result[name];
+                }
+            });
+            cachePut(text, compiled);
+        }
+        return Object.assign({}, compiled);
+    };
+}
+
+function requestResult(request) {
+    return new Promise(function(resolve, reject) {
+        request.onsuccess = function() {
+            resolve(request.result);
+        };
+        request.onerror = function() {
+            reject(request.error);
+        };
+    });
+}
+
+// База открывается один раз; записи другой версии Skulpt удаляются
+function openCompileDb() {
+    if (compileDb === undefined) {
+        if (!self.indexedDB) {
+            compileDb = Promise.resolve(null);
+            return compileDb;
+        }
+        const request = indexedDB.open(COMPILE_DB_NAME, 1);
+        request.onupgradeneeded = function() {
+            request.result.createObjectStore(COMPILE_STORE);
+        };
+        compileDb = requestResult(request).then(function(db) {
+            const store = db.transaction(COMPILE_STORE, 'readwrite').objectStore(COMPILE_STORE);
+            store.openCursor().onsuccess = function(event) {
+                const cursor = event.target.result;
+                if (!cursor) return;
+                if (cursor.value.version !== skulptVersion) {
+                    cursor.delete();
+                }
+                cursor.continue();
+            };
+            return db;
+        }).catch(function(err) {
+            console.warn('Кэш компиляции не будет сохраняться:', err);
+            return null;
+        });
+    }
+    return compileDb;
+}
+
+// Текст для ключа кэша: так программу компилирует importMainWithBody
+function mainText(source) {
+    return compileText.apply(null, [source, MAIN_FILENAME].concat(mainCompileArgs));
+}
+
+function restoreCompiled(db, sources) {
+    if (!db) return Promise.resolve();
+    const store = db.transaction(COMPILE_STORE, 'readonly').objectStore(COMPILE_STORE);
+    return Promise.all(sources.map(function(source) {
+        const text = mainText(source);
+        return requestResult(store.get(hashText(text))).then(function(entry) {
+            if (entry && entry.text === text) {
+                cachePut(text, entry.compiled);
+            }
+        });
+    }));
+}
+
+function persistCompiled(db, sources) {
+    if (!db || sources.length === 0) return;
+    const store = db.transaction(COMPILE_STORE, 'readwrite').objectStore(COMPILE_STORE);
+    sources.forEach(function(source) {
+        const text = mainText(source);
+        store.put({version: skulptVersion, text: text, compiled: cacheGet(text)}, hashText(text));
+    });
+}
+
+// Примеры урока: из IndexedDB в память, а отсутствующие там компилируются
+// заранее (в тех же настройках, что и при запуске) и сохраняются
+function warmCache(sources) {
+    configureSkulpt(0);
+    const missing = sources.filter(function(source) {
+        return !cacheGet(mainText(source));
+    });
+    if (missing.length === 0) return Promise.resolve();
+
+    return openCompileDb().then(function(db) {
+        return restoreCompiled(db, missing).then(function() {
+            const compiled = missing.filter(function(source) {
+                if (cacheGet(mainText(source))) return false;
+                try {
+                    Sk.compile.apply(Sk, [source, MAIN_FILENAME].concat(mainCompileArgs));
+                    return true;
+                } catch (err) {
+                    // Пример с ошибкой компиляции покажет её при запуске
+                    return false;
+                }
+            });
+            persistCompiled(db, compiled);
+        });
+    }).catch(function(err) {
+        console.warn('Не удалось подготовить примеры урока:', err);
+    });
+}
+
+// Skulpt загружается из первого доступного источника (локальная копия, затем CDN)
+function loadSkulpt(urls, files) {
+    if (skulptLoaded) return;
+
+    let lastError = null;
+    for (const baseUrl of urls) {
+        try {
+            importScripts(...files.map(name => baseUrl + name));
+            skulptLoaded = true;
+            installCompileCache();
+            return;
+        } catch (err) {
+            lastError = err;
+        }
+    }
+    throw lastError;
+}
+
+// Настройки Skulpt для запуска; шаги считаются, пока их не больше stepLimit
+function configureSkulpt(stepLimit) {
+    let steps = 0;
+
+    Sk.configure({
+        output: writeOutput,
+        read: function(filename) {
+            if (Sk.builtinFiles === undefined || Sk.builtinFiles["files"][filename] === undefined) {
+                throw "Файл не найден: '" + filename + "'";
+            }
+            return Sk.builtinFiles["files"][filename];
+        },
+        // input() спрашивает ответ у страницы и ждёт его, не блокируя поток
+        inputfun: function(prompt) {
+            flushOutput();
+            return new Promise(function(resolve) {
+                pendingInput = resolve;
+                self.postMessage({type: 'input', prompt: prompt});
+            });
+        },
+        // В режиме отладки Skulpt вызывает breakpoints перед каждой инструкцией:
+        // так считается число шагов программы
+        debugging: true,
+        breakpoints: function() {
+            steps++;
+            if (steps > stepLimit) {
+                throw new Sk.builtin.TimeLimitError('Превышен лимит шагов программы (' + stepLimit + ')');
+            }
+            return false;
+        },
+        __future__: Sk.python3
+    });
+}
+
+function runProgram(code, stepLimit) {
+    configureSkulpt(stepLimit);
+    programRunning = true;
+
+    self.postMessage({type: 'started'});
+    lastFlush = Date.now();
+    mainCacheHit = false;
+
+    Sk.misceval.asyncToPromise(function() {
+        return Sk.importMainWithBody(MAIN_MODULE, false, code, true);
+    }).then(
+        function() {
+            programRunning = false;
+            flushOutput();
+            self.postMessage({type: 'done', cached: mainCacheHit});
+        },
+        function(err) {
+            programRunning = false;
+            flushOutput();
+            self.postMessage({type: 'error', message: err.toString()});
+        }
+    );
+}
+
+self.onmessage = function(event) {
+    const message = event.data;
+
+    if (message.type === 'load') {
+        skulptSources = message;
+        skulptVersion = message.version || '';
+        try {
+            loadSkulpt(message.urls, message.files);
+            self.postMessage({type: 'ready'});
+        } catch (err) {
+            self.postMessage({type: 'load-error', message: String(err)});
+        }
+    } else if (message.type === 'run') {
+        try {
+            loadSkulpt(skulptSources.urls, skulptSources.files);
+        } catch (err) {
+            self.postMessage({type: 'load-error', message: String(err)});
+            return;
+        }
+        warming.then(function() {
+            runProgram(message.code, message.stepLimit);
+        });
+    } else if (message.type === 'warm') {
+        // Во время работы программы настройки Skulpt менять нельзя
+        if (skulptLoaded && !programRunning) {
+            const done = warmCache(message.sources);
+            warming = warming.then(function() {
+                return done;
+            });
+        }
+    } else if (message.type === 'input' && pendingInput) {
+        const resolve = pendingInput;
+        pendingInput = null;
+        resolve(message.value);
+    }
+};
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+Сборка курса "Python для школьников"
+
+Импорт пакета ничего не делает: данные курса, шаблоны и генераторы контента
+загружаются только при сборке. Точка входа - python -m pythonlearn build.
+"""
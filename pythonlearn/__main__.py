@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+"""
+python -m pythonlearn build [LESSON_ID ...]
+"""
+
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
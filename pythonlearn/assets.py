@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Статические файлы сайта: CSS, JS и index.html
+
+Сборка переносит их из репозитория в корень сайта (главную страницу - из
+исходника INDEX_SOURCE, который сборка никогда не перезаписывает) и при fingerprint=True
+выпускает копии с хэшем содержимого в имени (css/style.<hash>.css). Такие
+файлы можно кэшировать навсегда: новая версия получает новое имя, а страницы
+и index.html ссылаются на актуальные копии. Соответствие имён пишется в
+asset-manifest.json, заголовки кэширования для хостинга - в _headers.
+"""
+
+import os
+import re
+import json
+import hashlib
+
+from .compress import source_name
+from .critical import INDEX_FOLD_CONTAINER, critical_css, inline_critical_css
+from .minify import minify_html
+from .output import write_file
+
+# Файлы, на которые ссылаются страницы (пути относительно корня сайта)
+ASSET_FILES = ['css/style.css', 'js/main.js']
+
+# Файлы, которые копируются под своими именами и при fingerprint=True:
+# main.js находит обработчик кода по адресу рядом с собой
+STATIC_FILES = ['js/python-worker.js']
+
+# Главная страница: не генерируется, но ссылки на файлы в ней переписываются.
+# Исходник лежит отдельно от собранной страницы в корне сайта
+INDEX_PAGE = 'index.html'
+INDEX_SOURCE = os.path.join('pythonlearn', 'index.html')
+
+ASSET_MANIFEST_FILE = 'asset-manifest.json'
+HEADERS_FILE = '_headers'
+
+# Длина хэша в имени файла
+FINGERPRINT_LENGTH = 10
+
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE = 'public, max-age=0, must-revalidate'
+
+def fingerprinted_name(path, data):
+    """css/style.css -> css/style.<хэш>.css"""
+    digest = hashlib.sha256(data).hexdigest()[:FINGERPRINT_LENGTH]
+    stem, ext = os.path.splitext(path)
+    return f'{stem}.{digest}{ext}'
+
+def fingerprint_pattern(path):
+    """Регулярное выражение для имени файла с любым хэшем или без него"""
+    stem, ext = os.path.splitext(path)
+    return re.compile(re.escape(stem) + r'(?:\.[0-9a-f]{%d})?' % FINGERPRINT_LENGTH + re.escape(ext))
+
+def rewrite_asset_references(html, asset_urls):
+    """Заменяет ссылки на файлы (с хэшем или без) на актуальные имена из asset_urls"""
+    for path, url in asset_urls.items():
+        html = fingerprint_pattern(path).sub(url, html)
+    return html
+
+def prune_fingerprinted(root, path, keep):
+    """Удаляет устаревшие копии файла с хэшем в имени вместе с их сжатыми копиями (.gz, .br)"""
+    directory = os.path.join(root, os.path.dirname(path))
+    pattern = fingerprint_pattern(os.path.basename(path))
+    plain = os.path.basename(path)
+    for name in os.listdir(directory):
+        base = source_name(name)
+        if base in (plain, os.path.basename(keep)) or not pattern.fullmatch(base):
+            continue
+        os.remove(os.path.join(directory, name))
+
+def headers_file(asset_urls):
+    """_headers (формат Netlify / Cloudflare Pages): файлы с хэшем кэшируются навсегда"""
+    lines = []
+    for url in sorted(asset_urls.values()):
+        lines.append(f'/{url}')
+        lines.append(f'  Cache-Control: {IMMUTABLE_CACHE}')
+    # Версия Skulpt входит в путь каталога (см. vendor.py)
+    lines.append('/js/vendor/*')
+    lines.append(f'  Cache-Control: {IMMUTABLE_CACHE}')
+    for pattern in ('/', '/index.html', '/sw.js', '/lessons/*', '/search/*'):
+        lines.append(pattern)
+        lines.append(f'  Cache-Control: {REVALIDATE_CACHE}')
+    return '\n'.join(lines) + '\n'
+
+def emit_assets(source_root, root, fingerprint=False, files=None):
+    """Переносит статические файлы в корень сайта
+
+    Возвращает asset_urls: путь файла -> путь, по которому на него ссылаться.
+    Без fingerprint файлы копируются под своими именами (если корень сайта
+    отличается от репозитория); с fingerprint - под именами с хэшем.
+    STATIC_FILES всегда копируются под своими именами.
+    """
+    asset_urls = {}
+    for path in ASSET_FILES:
+        with open(os.path.join(source_root, path), 'rb') as f:
+            data = f.read()
+
+        url = fingerprinted_name(path, data) if fingerprint else path
+        if fingerprint or os.path.abspath(source_root) != os.path.abspath(root):
+            write_file(os.path.join(root, url), data, files, url)
+        if fingerprint:
+            prune_fingerprinted(root, path, url)
+        asset_urls[path] = url
+
+    if os.path.abspath(source_root) != os.path.abspath(root):
+        for path in STATIC_FILES:
+            with open(os.path.join(source_root, path), 'rb') as f:
+                write_file(os.path.join(root, path), f.read(), files, path)
+
+    if fingerprint:
+        manifest = json.dumps(asset_urls, ensure_ascii=False, indent=2, sort_keys=True) + '\n'
+        write_file(os.path.join(root, ASSET_MANIFEST_FILE), manifest, files, ASSET_MANIFEST_FILE)
+        write_file(os.path.join(root, HEADERS_FILE), headers_file(asset_urls), files, HEADERS_FILE)
+
+    return asset_urls
+
+def emit_index_page(source_root, root, asset_urls, files=None, minify=False, critical=False):
+    """Собирает index.html из INDEX_SOURCE, переписывая ссылки на статические файлы
+
+    С critical=True в страницу встраивается её критический CSS (см. critical.py).
+    """
+    with open(os.path.join(source_root, INDEX_SOURCE), encoding='utf-8') as f:
+        html = rewrite_asset_references(f.read(), asset_urls)
+    if critical:
+        with open(os.path.join(source_root, 'css/style.css'), encoding='utf-8') as f:
+            css = f.read()
+        html = inline_critical_css(html, critical_css(css, html, INDEX_FOLD_CONTAINER))
+    if minify:
+        html = minify_html(html)
+    write_file(os.path.join(root, INDEX_PAGE), html, files, INDEX_PAGE)
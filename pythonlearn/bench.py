@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+Замеры производительности сборки
+
+python -m pythonlearn bench рендерит курс по этапам и меряет время каждого:
+генераторы контента (по функциям), навигацию урока, create_lesson_html и хэш
+манифеста, а на настоящем курсе - ещё и полную сборку build(force=True) во
+временный каталог и повторную сборку без изменений. Кроме курса из 85 уроков
+замеряются синтетические курсы из 10 и 100 копий COURSE (BENCH_SCALES).
+Навигация и хэш манифеста замеряются для всех уроков каждого курса, страницы
+(create_lesson_html) на больших курсах - по выборке (BENCH_PAGE_SAMPLE).
+
+Результаты пишутся в JSON (BENCH_RESULTS_FILE) и сравниваются с сохранённым
+эталоном (BENCH_BASELINE_FILE, записывается с --save-baseline): замедление
+этапа больше чем на max_slowdown или рост размера страниц больше чем на
+MAX_SIZE_GROWTH считается регрессией, и команда завершается с ошибкой.
+Короткие этапы сравниваются суммой, а не по одному. Время зависит от машины,
+поэтому эталон в репозитории не хранится: его записывают на той же машине
+прогоном основной ветки (в CI - отдельным шагом перед замером изменений).
+"""
+
+import json
+import time
+import platform
+import tempfile
+
+from .course import COURSE, compile_course, lessons_data
+from .content import DEFAULT_VARIANT, generator_for, load_generator
+from .manifest import compute_lesson_hash, text_digest
+from .output import write_file
+from .templates import NAV_FRAGMENT_FILE, compile_sidebar, create_lesson_html, mark_sidebar, render_sidebar
+
+BENCH_SCALES = (1, 10, 100)
+BENCH_RESULTS_FILE = 'bench-results.json'
+BENCH_BASELINE_FILE = 'bench-baseline.json'
+
+# Сколько раз повторяется замер; в результат идёт лучшее время этапа
+BENCH_REPEAT = 3
+
+# Страница со встроенной навигацией весит O(числа уроков), поэтому на больших
+# курсах страницы собираются для равномерной выборки уроков, а время и размер
+# пересчитываются на весь курс. Навигация и хэш манифеста считаются для всех
+# уроков, как в build()
+BENCH_PAGE_SAMPLE = 500
+
+# Допустимые замедление этапа и рост суммарного размера страниц
+MAX_SLOWDOWN = 0.25
+MAX_SIZE_GROWTH = 0.02
+
+# Этапы короче этого времени (с) по отдельности шумят больше, чем меняются:
+# они сравниваются суммой (SHORT_STAGES)
+MIN_COMPARED_SECONDS = 0.05
+SHORT_STAGES = 'короткие этапы'
+
+# Копии уроков в синтетическом курсе: python-03--2 - третья копия python-03
+COPY_SEPARATOR = '--'
+
+def scaled_course(scale, course=COURSE):
+    """Курс из scale копий course с уникальными id уроков"""
+    if scale == 1:
+        return course
+    modules = []
+    for copy in range(scale):
+        for module in course:
+            lessons = module['lessons']
+            if copy:
+                lessons = [dict(lesson, id=f"{lesson['id']}{COPY_SEPARATOR}{copy}") for lesson in lessons]
+            modules.append({'title': f"{module['title']} ({copy + 1})", 'lessons': lessons})
+    return modules
+
+def source_lesson_id(lesson_id):
+    """id урока настоящего курса, копией которого является урок"""
+    return lesson_id.split(COPY_SEPARATOR, 1)[0]
+
+def sample_lessons(order, size=BENCH_PAGE_SAMPLE):
+    """Равномерная выборка не более size уроков с сохранением порядка"""
+    if len(order) <= size:
+        return list(order)
+    step = len(order) / size
+    return [order[int(index * step)] for index in range(size)]
+
+def measure_course(course, variant=DEFAULT_VARIANT, nav='inline'):
+    """Один проход по этапам рендера курса
+
+    Возвращает {'lessons': N, 'sampled': число уроков со страницами,
+    'stages': {этап: секунды}, 'bytes': суммарный размер страниц}.
+    Время create_lesson_html и размер страниц пересчитаны на все уроки курса.
+    """
+    index = compile_course(course)
+    data = lessons_data(index)
+    order = index['order']
+    nav_src = NAV_FRAGMENT_FILE if nav == 'external' else None
+    stages = {}
+
+    def add(stage, started):
+        stages[stage] = stages.get(stage, 0.0) + time.perf_counter() - started
+
+    contents = {}
+    for lesson_id in order:
+        source_id = source_lesson_id(lesson_id)
+        module_name, func_name, no_args = generator_for(variant, source_id, data[lesson_id])
+        generate = load_generator(module_name, func_name)
+        started = time.perf_counter()
+        contents[lesson_id] = generate() if no_args else generate(source_id, data[lesson_id]['title'])
+        add(f'content:{func_name}', started)
+
+    # Навигация заготавливается один раз на сборку, как в build()
+    sidebar_digest = ''
+    if not nav_src:
+        started = time.perf_counter()
+        compiled_sidebar = compile_sidebar(index)
+        sidebar_digest = text_digest(render_sidebar(index))
+        add('sidebar:compile', started)
+
+    sampled = set(sample_lessons(order))
+    total_bytes = 0
+    for lesson_id in order:
+        lesson = data[lesson_id]
+        started = time.perf_counter()
+        compute_lesson_hash(lesson_id, lesson, contents[lesson_id], sidebar_digest, nav_src=nav_src)
+        add('manifest_hash', started)
+
+        sidebar = ''
+        if not nav_src:
+            started = time.perf_counter()
+            sidebar = mark_sidebar(compiled_sidebar, lesson_id)
+            add('sidebar', started)
+
+        if lesson_id not in sampled:
+            continue
+        started = time.perf_counter()
+        html = create_lesson_html(
+            lesson_id=lesson_id, title=lesson['title'], module=lesson['module'],
+            duration=lesson['duration'], content_html=contents[lesson_id],
+            prev_lesson=lesson['prev'], next_lesson=lesson['next'],
+            time_limit=lesson['time_limit'], step_limit=lesson['step_limit'],
+            sidebar=sidebar, nav_src=nav_src,
+        )
+        add('create_lesson_html', started)
+        total_bytes += len(html.encode('utf-8'))
+
+    factor = len(order) / len(sampled)
+    stages['create_lesson_html'] *= factor
+
+    return {'lessons': len(order), 'sampled': len(sampled), 'stages': stages,
+            'bytes': int(total_bytes * factor)}
+
+def measure_build(jobs=1, nav='inline'):
+    """Полная сборка настоящего курса во временный каталог и повторная без изменений"""
+    from .build import build
+
+    stages = {}
+    with tempfile.TemporaryDirectory(prefix='pythonlearn-bench-') as root:
+        started = time.perf_counter()
+        build(root=root, force=True, jobs=jobs, nav=nav)
+        stages['build'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        build(root=root, jobs=jobs, nav=nav)
+        stages['build:noop'] = time.perf_counter() - started
+    return stages
+
+def run_benchmarks(scales=BENCH_SCALES, repeat=BENCH_REPEAT, variant=DEFAULT_VARIANT,
+                   nav='inline', jobs=1, progress=None):
+    """Замеры по всем масштабам курса; время этапа - лучшее из repeat повторов"""
+    results = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'variant': variant,
+        'nav': nav,
+        'jobs': jobs,
+        'repeat': repeat,
+        'scales': {},
+    }
+    for scale in scales:
+        course = scaled_course(scale)
+        best = None
+        for attempt in range(repeat):
+            if progress:
+                progress(scale, attempt)
+            measured = measure_course(course, variant, nav)
+            if scale == 1:
+                measured['stages'].update(measure_build(jobs, nav))
+            if best is None:
+                best = measured
+            else:
+                for stage, seconds in measured['stages'].items():
+                    best['stages'][stage] = min(best['stages'][stage], seconds)
+        best['stages'] = dict(sorted(best['stages'].items()))
+        results['scales'][str(scale)] = best
+    return results
+
+def compare_results(results, baseline, max_slowdown=MAX_SLOWDOWN):
+    """Регрессии относительно эталона: список строк с описанием
+
+    Сравниваются масштабы и этапы, которые есть в обоих замерах. Этапы,
+    которые в эталоне короче MIN_COMPARED_SECONDS, сравниваются суммой.
+    """
+    regressions = []
+    for scale, current in results['scales'].items():
+        previous = baseline.get('scales', {}).get(scale)
+        if previous is None:
+            continue
+
+        compared = []
+        short = [0.0, 0.0]
+        for stage, seconds in current['stages'].items():
+            before = previous['stages'].get(stage)
+            if before is None:
+                continue
+            if before < MIN_COMPARED_SECONDS:
+                short[0] += before
+                short[1] += seconds
+            else:
+                compared.append((stage, before, seconds))
+        if short[0] > 0:
+            compared.append((SHORT_STAGES, *short))
+
+        for stage, before, seconds in compared:
+            if seconds > before * (1 + max_slowdown):
+                regressions.append(f"×{scale} {stage}: {before:.3f} → {seconds:.3f} с "
+                                   f"(+{100 * (seconds - before) / before:.0f}%)")
+
+        before = previous.get('bytes')
+        if before and current['bytes'] > before * (1 + MAX_SIZE_GROWTH):
+            regressions.append(f"×{scale} размер страниц: {before} → {current['bytes']} байт "
+                               f"(+{100 * (current['bytes'] - before) / before:.1f}%)")
+    return regressions
+
+def load_results(path):
+    """Замер из JSON-файла (None, если файла нет)"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def save_results(results, path):
+    write_file(path, json.dumps(results, ensure_ascii=False, indent=2) + '\n')
+
+def format_results(results, baseline=None):
+    """Таблица этапов по масштабам для вывода в консоль"""
+    lines = []
+    for scale, current in results['scales'].items():
+        previous = (baseline or {}).get('scales', {}).get(scale, {})
+        sampled = ''
+        if current['sampled'] < current['lessons']:
+            sampled = f", страницы по выборке из {current['sampled']}"
+        lines.append(f"×{scale}: уроков {current['lessons']}{sampled}, "
+                     f"страницы {current['bytes'] / 1024 / 1024:.1f} МБ")
+        for stage, seconds in current['stages'].items():
+            before = previous.get('stages', {}).get(stage)
+            delta = f"  ({100 * (seconds - before) / before:+.0f}%)" if before else ''
+            lines.append(f"  {stage:<45} {seconds:9.3f} с{delta}")
+    return '\n'.join(lines)
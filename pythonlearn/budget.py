@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+Бюджеты веса и сложности страниц
+
+После сборки каждая страница урока и index.html разбираются и измеряются:
+размер в байтах (как есть и после gzip), ресурсы в <head>, блокирующие
+отрисовку (таблицы стилей и синхронные скрипты), число DOM-элементов, самые
+большие встроенные блоки (<svg>, <script>, <style> прямо в разметке) и
+встроенный критический CSS (сборка с --critical-css, см. critical.py).
+Превышение бюджета останавливает сборку: страница, которая незаметно
+потяжелела, не дойдёт до учеников с медленным мобильным интернетом.
+
+Бюджет страницы - DEFAULT_BUDGET, поверх которого накладываются
+MODULE_BUDGETS (по названию модуля урока) и PAGE_BUDGETS (по id урока или
+пути страницы). Значение None снимает ограничение.
+"""
+
+import os
+from html.parser import HTMLParser
+
+from .compress import gzip_bytes
+
+# Измерения страницы, на которые задаются бюджеты
+BUDGET_METRICS = {
+    'bytes': 'размер, байт',
+    'gzip_bytes': 'размер после gzip, байт',
+    'blocking': 'блокирующих ресурсов в <head>',
+    'dom_nodes': 'DOM-элементов',
+    'largest_inline': 'крупнейший встроенный блок, байт',
+    'critical_css': 'встроенный критический CSS, байт',
+}
+
+# Бюджет страницы урока: полтора-два запаса к самой тяжёлой странице курса
+DEFAULT_BUDGET = {
+    'bytes': 40 * 1024,
+    'gzip_bytes': 8 * 1024,
+    'blocking': 1,
+    'dom_nodes': 500,
+    # Встроенных блоков в уроках без блок-схем нет: запас на мелкую разметку
+    'largest_inline': 1024,
+    # Критический CSS вместе с началом страницы должен прийти в первых
+    # пакетах ответа (около 14 КБ)
+    'critical_css': 10 * 1024,
+}
+
+# Модули, где страницам нужен другой бюджет: название модуля -> поля бюджета.
+# В уроках этих модулей блок-схемы - встроенные <svg> (около 2 КБ)
+MODULE_BUDGETS = {
+    'Основы алгоритмики': {'largest_inline': 4 * 1024},
+    'Алгоритмы': {'largest_inline': 4 * 1024},
+    'Продвинутые темы': {'largest_inline': 4 * 1024},
+}
+
+# Отдельные страницы: id урока или путь относительно корня сайта -> поля бюджета
+PAGE_BUDGETS = {
+    # Главная - первая страница, которую видит ученик
+    'index.html': {'bytes': 8 * 1024, 'gzip_bytes': 3 * 1024, 'dom_nodes': 150},
+}
+
+# Встроенные блоки, размер которых учитывается
+INLINE_BLOCK_TAGS = ('svg', 'script', 'style')
+
+# Атрибут <style> с критическим CSS: он учитывается отдельно от других блоков
+CRITICAL_STYLE_ATTR = 'data-critical'
+
+# Сколько крупнейших встроенных блоков показывать в отчёте
+REPORTED_INLINE_BLOCKS = 3
+
+class PageParser(HTMLParser):
+    """Считает элементы, блокирующие ресурсы <head>, встроенные блоки и критический CSS
+
+    Содержимое <noscript> в <head> не блокирует отрисовку: браузер с
+    включённым JS его не загружает.
+    """
+
+    def __init__(self, html):
+        super().__init__(convert_charrefs=True)
+        self.html = html
+        # Смещения начала строк: getpos() даёт (строка, столбец)
+        self.line_starts = [0]
+        position = html.find('\n')
+        while position != -1:
+            self.line_starts.append(position + 1)
+            position = html.find('\n', position + 1)
+        self.dom_nodes = 0
+        self.blocking = []
+        self.inline_blocks = []
+        self.in_head = False
+        self.in_noscript = False
+        self.open_blocks = []
+        self.critical_css = 0
+
+    def char_offset(self):
+        line, column = self.getpos()
+        return self.line_starts[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        self.dom_nodes += 1
+        attrs = dict(attrs)
+        if tag == 'head':
+            self.in_head = True
+        elif tag == 'noscript':
+            self.in_noscript = True
+        elif self.in_head and not self.in_noscript:
+            self.check_blocking(tag, attrs)
+
+        if tag in INLINE_BLOCK_TAGS and not (tag == 'script' and 'src' in attrs):
+            critical = tag == 'style' and CRITICAL_STYLE_ATTR in attrs
+            self.open_blocks.append((tag, critical, self.char_offset(), self.getpos()[0]))
+
+    def handle_startendtag(self, tag, attrs):
+        self.dom_nodes += 1
+        if self.in_head and not self.in_noscript:
+            self.check_blocking(tag, dict(attrs))
+
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self.in_head = False
+        elif tag == 'noscript':
+            self.in_noscript = False
+        if self.open_blocks and self.open_blocks[-1][0] == tag:
+            name, critical, start, line = self.open_blocks.pop()
+            end = self.html.find('>', self.char_offset()) + 1
+            size = len(self.html[start:end].encode('utf-8'))
+            if critical:
+                self.critical_css += size
+            # Вложенные блоки (svg в svg) учитываются в составе внешнего
+            elif not self.open_blocks:
+                self.inline_blocks.append({'tag': name, 'line': line, 'bytes': size})
+
+    def check_blocking(self, tag, attrs):
+        """Ресурс в <head>, без которого браузер не начнёт отрисовку"""
+        if tag == 'link':
+            rel = (attrs.get('rel') or '').lower().split()
+            media = (attrs.get('media') or 'all').lower()
+            if 'stylesheet' in rel and media in ('all', 'screen') and 'disabled' not in attrs:
+                self.blocking.append(attrs.get('href'))
+        elif tag == 'script':
+            if attrs.get('type') == 'module' or 'async' in attrs or 'defer' in attrs:
+                return
+            self.blocking.append(attrs.get('src') or 'встроенный скрипт')
+
+def measure_page(html):
+    """Измерения страницы: поля BUDGET_METRICS, 'blocking_resources', 'inline_count'
+    и 'inline_blocks' (крупнейшие встроенные блоки)"""
+    parser = PageParser(html)
+    parser.feed(html)
+    parser.close()
+
+    data = html.encode('utf-8')
+    inline_blocks = sorted(parser.inline_blocks, key=lambda block: -block['bytes'])
+    return {
+        'bytes': len(data),
+        'gzip_bytes': len(gzip_bytes(data)),
+        'blocking': len(parser.blocking),
+        'dom_nodes': parser.dom_nodes,
+        'largest_inline': inline_blocks[0]['bytes'] if inline_blocks else 0,
+        'critical_css': parser.critical_css,
+        'blocking_resources': parser.blocking,
+        'inline_count': len(inline_blocks),
+        'inline_blocks': inline_blocks[:REPORTED_INLINE_BLOCKS],
+    }
+
+def page_budget(page, module=None):
+    """Бюджет страницы: умолчания, затем модуль, затем сама страница"""
+    budget = dict(DEFAULT_BUDGET)
+    if module is not None:
+        budget.update(MODULE_BUDGETS.get(module, {}))
+    budget.update(PAGE_BUDGETS.get(page, {}))
+    return budget
+
+def check_budgets(root, pages):
+    """Измеряет страницы и сверяет их с бюджетами
+
+    pages - список (путь относительно root, ключ в PAGE_BUDGETS, модуль или None).
+    Возвращает {'pages': {путь: измерения}, 'violations': [(путь, поле, значение, бюджет)]}.
+    """
+    measured = {}
+    violations = []
+    for path, page, module in pages:
+        full_path = os.path.join(root, path)
+        if not os.path.isfile(full_path):
+            continue
+        with open(full_path, encoding='utf-8') as f:
+            metrics = measure_page(f.read())
+        measured[path] = metrics
+
+        for metric, limit in page_budget(page, module).items():
+            if limit is not None and metrics[metric] > limit:
+                violations.append((path, metric, metrics[metric], limit))
+    return {'pages': measured, 'violations': violations}
+
+def format_budget_report(pages):
+    """Таблица измерений по страницам для вывода в консоль"""
+    width = max(len(path) for path in pages)
+    lines = [f"  {'страница':<{width}} {'байт':>7} {'gzip':>6} {'DOM':>5} "
+             f"{'блоков':>6} {'крупн.':>6} {'крит.CSS':>8}  блокируют отрисовку"]
+    for path, metrics in pages.items():
+        lines.append(f"  {path:<{width}} {metrics['bytes']:>7} {metrics['gzip_bytes']:>6} "
+                     f"{metrics['dom_nodes']:>5} {metrics['inline_count']:>6} "
+                     f"{metrics['largest_inline']:>6} {metrics['critical_css']:>8}  "
+                     f"{', '.join(metrics['blocking_resources']) or '-'}")
+    return '\n'.join(lines)
+
+def format_violation(violation, metrics):
+    """Строка отчёта о превышении с подробностями: что блокирует и что велико"""
+    path, metric, value, limit = violation
+    line = f"{path}: {BUDGET_METRICS[metric]} {value} > {limit}"
+    if metric == 'blocking':
+        line += f" ({', '.join(metrics['blocking_resources'])})"
+    elif metric == 'largest_inline':
+        line += ' (' + ', '.join(f"<{block['tag']}> в строке {block['line']}: {block['bytes']}"
+                                 for block in metrics['inline_blocks']) + ')'
+    return line
@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+"""
+Сборка HTML-страниц уроков
+
+Пересобираются только уроки, у которых изменились входные данные (см. manifest.py).
+Рендер можно распределить по пулу процессов: результаты собираются в порядке
+LESSONS_DATA, поэтому вывод не зависит от числа воркеров.
+"""
+
+import os
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
+
+from .course import LESSONS_DATA, affected_artifacts, load_course
+from .content import DEFAULT_VARIANT, VARIANTS, generate_lesson_content
+from .manifest import (BUILD_MANIFEST_PATH, COURSE_SNAPSHOT_PATH, compute_lesson_hash,
+                       load_build_manifest, save_build_manifest, text_digest)
+from .assets import INDEX_PAGE, STATIC_FILES, emit_assets, emit_index_page
+from .budget import check_budgets, format_violation
+from .compress import compress_files
+from .critical import LESSON_FOLD_CONTAINER, critical_css as select_critical_css
+from .examples import check_examples, embed_example_outputs
+from .minify import minify_html
+from .offline import SERVICE_WORKER_FILE, emit_service_worker
+from .output import new_write_report, write_file
+from .search import emit_search_index
+from .templates import (LESSON_FRAGMENT_SUFFIX, NAV_FRAGMENT_FILE, create_lesson_fragment,
+                        create_lesson_html, generate_complete_sidebar, lesson_sidebar)
+from .vendor import emit_vendor
+
+# Корень сайта по умолчанию - каталог репозитория
+DEFAULT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Режимы навигации: встроена в каждую страницу или вынесена в общий файл
+NAV_MODES = ['inline', 'external']
+
+def select_lessons(lesson_ids=None, lesson_types=None):
+    """Список id уроков для сборки в порядке LESSONS_DATA"""
+    if lesson_ids:
+        unknown = [lesson_id for lesson_id in lesson_ids if lesson_id not in LESSONS_DATA]
+        if unknown:
+            raise ValueError(f"Неизвестные уроки: {', '.join(unknown)}")
+
+    selected = []
+    for lesson_id, lesson_data in LESSONS_DATA.items():
+        if lesson_ids and lesson_id not in lesson_ids:
+            continue
+        if lesson_types and lesson_data['type'] not in lesson_types:
+            continue
+        selected.append(lesson_id)
+    return selected
+
+# Рендер одного урока. Вызывается и в основном процессе, и в воркерах пула,
+# поэтому работает только со своими аргументами и ничего не пишет на диск
+def render_lesson(task):
+    """Возвращает (lesson_id, хэш входных данных, html или None, если урок не изменился,
+    размеры, фрагмент)
+
+    Размеры - (байт до минификации, байт после) при minify, иначе None.
+    Фрагмент - JSON урока для клиентской навигации при client_nav, иначе None.
+    options - параметры оформления страницы: nav_src, minify, asset_urls, client_nav, search,
+    critical_css (критический CSS страниц уроков или None).
+    example_outputs - вывод примеров кода урока (код -> вывод) или None.
+    """
+    variant, lesson_id, lesson_data, sidebar_digest, options, example_outputs, previous_hash = task
+
+    # Генерируем контент в зависимости от урока
+    content_html = generate_lesson_content(variant, lesson_id, lesson_data)
+    if example_outputs:
+        content_html = embed_example_outputs(content_html, example_outputs)
+
+    # Пропускаем урок, если его входные данные не изменились
+    lesson_hash = compute_lesson_hash(lesson_id, lesson_data, content_html, sidebar_digest, **options)
+    if lesson_hash == previous_hash:
+        return lesson_id, lesson_hash, None, None, None
+
+    # Оформление страницы и навигация компилируются один раз на процесс
+    # (см. compile_lesson_template и compiled_course_sidebar), здесь
+    # заполняются только слоты урока и отмечается он сам в навигации
+    html_content = create_lesson_html(
+        lesson_id=lesson_id,
+        title=lesson_data['title'],
+        module=lesson_data['module'],
+        duration=lesson_data['duration'],
+        content_html=content_html,
+        prev_lesson=lesson_data['prev'],
+        next_lesson=lesson_data['next'],
+        time_limit=lesson_data['time_limit'],
+        step_limit=lesson_data['step_limit'],
+        sidebar=None if options['nav_src'] else lesson_sidebar(lesson_id),
+        nav_src=options['nav_src'],
+        asset_urls=options['asset_urls'],
+        client_nav=options['client_nav'],
+        search=options['search'],
+        critical_css=options['critical_css']
+    )
+
+    sizes = None
+    if options['minify']:
+        raw_size = len(html_content.encode('utf-8'))
+        html_content = minify_html(html_content)
+        sizes = (raw_size, len(html_content.encode('utf-8')))
+
+    fragment = None
+    if options['client_nav']:
+        fragment = create_lesson_fragment(
+            lesson_id=lesson_id,
+            title=lesson_data['title'],
+            module=lesson_data['module'],
+            duration=lesson_data['duration'],
+            content_html=minify_html(content_html) if options['minify'] else content_html,
+            prev_lesson=lesson_data['prev'],
+            next_lesson=lesson_data['next'],
+            time_limit=lesson_data['time_limit'],
+            step_limit=lesson_data['step_limit'],
+        )
+
+    return lesson_id, lesson_hash, html_content, sizes, fragment
+
+def lesson_critical_css(contents, search=False):
+    """Критический CSS страниц уроков (см. critical.py), один на все уроки
+
+    contents - контент всех уроков курса (id -> html): первый экран страниц
+    уроков - объединение первых экранов всех уроков.
+    """
+    with open(os.path.join(DEFAULT_ROOT, 'css', 'style.css'), encoding='utf-8') as f:
+        css = f.read()
+    # Оформление страницы одно для всех уроков: рендерим его с пустым контентом
+    page_html = create_lesson_html(lesson_id='', title='', module='', duration='', content_html='',
+                                   prev_lesson='', next_lesson='', sidebar=generate_complete_sidebar(),
+                                   search=search)
+    return select_critical_css(css, page_html, LESSON_FOLD_CONTAINER, contents.values(), search)
+
+def nav_fragment(sidebar):
+    """Содержимое общего файла навигации"""
+    return textwrap.dedent(sidebar.strip('\n')) + '\n'
+
+def build(root=DEFAULT_ROOT, variant=DEFAULT_VARIANT, lesson_ids=None, lesson_types=None,
+          force=False, jobs=1, nav='inline', minify=False, compress=False, fingerprint=False,
+          client_nav=False, examples=False, budget=False, search=False, critical_css=False):
+    """Собирает уроки в root/lessons
+
+    lesson_ids / lesson_types ограничивают сборку частью курса: генераторы
+    контента остальных типов уроков при этом не импортируются (кроме сборки
+    с search или critical_css: им нужен контент всего курса).
+    nav='external' выносит навигацию в общий файл lessons/nav.html, который
+    main.js подгружает на каждой странице, вместо встраивания её в каждый урок.
+    minify=True пропускает страницы через minify_html (см. minify.py).
+    compress=True пишет рядом с изменившимися артефактами .gz и .br (см. compress.py).
+    fingerprint=True выпускает CSS и JS с хэшем содержимого в имени (см. assets.py).
+    client_nav=True пишет рядом со страницами фрагменты lessons/<id>.json, по которым
+    main.js переходит между уроками без перезагрузки страницы.
+    search=True пишет поисковый индекс курса в search/ и добавляет в навигацию
+    страниц поле поиска (см. search.py).
+    critical_css=True встраивает в страницы уроков (один на все) и index.html
+    стили первого экрана, а таблицу стилей подключает без блокировки
+    отрисовки (см. critical.py).
+    examples=True выполняет примеры кода уроков в CPython и встраивает их вывод
+    в страницы; пример с ошибкой прерывает сборку с ValueError (см. examples.py).
+    budget=True проверяет вес и сложность всех страниц сайта; превышение
+    бюджета прерывает сборку с ValueError после записи файлов (см. budget.py).
+    В корень сайта пишется service worker со списком всех файлов сайта (см. offline.py).
+    Статические файлы (CSS, JS, исходник index.html и скачанный Skulpt, см.
+    vendor.py) берутся из репозитория; fingerprint=True требует root вне него.
+    Возвращает {'written': [...], 'skipped': [...], 'affected': [...], 'files': {...},
+    'minified': {...}, 'compressed': [...], 'vendored': [...], 'precached': {...},
+    'examples': {...} или None, 'budget': {...} или None, 'critical_css': str или None}:
+    id отрендеренных и пропущенных уроков; артефакты, которые по графу
+    зависимостей курса затронуты изменением его данных со времени прошлой
+    полной сборки (None, если сравнивать не с чем); отчёт о записи файлов
+    (пути относительно root по статусам 'new', 'rewritten', 'unchanged');
+    размеры отрендеренных страниц до и после минификации по id урока;
+    записанные сжатые копии файлов; файлы локальной копии Skulpt;
+    файлы для офлайн-кэша с хэшами; отчёт о проверке примеров кода;
+    измерения страниц по бюджетам; критический CSS страниц уроков.
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"Неизвестный вариант курса: {variant}")
+    if nav not in NAV_MODES:
+        raise ValueError(f"Неизвестный режим навигации: {nav}")
+    # Файлы с хэшем в имени и _headers нужны только хостингу: в репозиторий их не пишем
+    if fingerprint and os.path.abspath(root) == DEFAULT_ROOT:
+        raise ValueError("сборку с --fingerprint нужно писать в отдельный каталог (--out)")
+
+    selected = select_lessons(lesson_ids, lesson_types)
+
+    lessons_dir = os.path.join(root, 'lessons')
+    os.makedirs(lessons_dir, exist_ok=True)
+
+    manifest_path = os.path.join(root, BUILD_MANIFEST_PATH)
+    manifest = {} if force else load_build_manifest(manifest_path)
+    # Записи несобиравшихся уроков сохраняем как есть
+    new_manifest = dict(manifest)
+    sidebar = generate_complete_sidebar()
+    # Навигация одна на все уроки: её хэш считается один раз на сборку
+    sidebar_digest = text_digest(sidebar)
+
+    # Примеры проверяются до записи файлов: сломанный пример не должен
+    # оставить частично обновлённый сайт
+    example_report = None
+    if examples:
+        example_report = check_examples(root, variant, selected, jobs)
+
+    files = new_write_report()
+
+    asset_urls = emit_assets(DEFAULT_ROOT, root, fingerprint, files)
+    emit_index_page(DEFAULT_ROOT, root, asset_urls, files, minify, critical_css)
+    vendored = emit_vendor(DEFAULT_ROOT, root, files)
+
+    nav_src = None
+    if nav == 'external':
+        nav_src = NAV_FRAGMENT_FILE
+        fragment = nav_fragment(sidebar)
+        if minify:
+            fragment = minify_html(fragment) + '\n'
+        write_file(os.path.join(lessons_dir, NAV_FRAGMENT_FILE), fragment,
+                   files, f'lessons/{NAV_FRAGMENT_FILE}')
+
+    # Контент всего курса нужен поисковому индексу и критическому CSS: тогда
+    # генераторы всех типов уроков импортируются и при сборке части курса
+    course_contents = {}
+    if search or critical_css:
+        course_contents = {lesson_id: generate_lesson_content(variant, lesson_id, lesson_data)
+                           for lesson_id, lesson_data in LESSONS_DATA.items()}
+    critical = lesson_critical_css(course_contents, search) if critical_css else None
+
+    options = {
+        'nav_src': nav_src,
+        'minify': minify,
+        'asset_urls': asset_urls if fingerprint else None,
+        'client_nav': client_nav,
+        'search': search,
+        'critical_css': critical,
+    }
+
+    tasks = []
+    for lesson_id in selected:
+        filepath = os.path.join(lessons_dir, f"{lesson_id}.html")
+        outputs = [filepath]
+        if client_nav:
+            outputs.append(os.path.join(lessons_dir, lesson_id + LESSON_FRAGMENT_SUFFIX))
+        # Удалённый файл пересобираем независимо от манифеста
+        previous_hash = manifest.get(lesson_id) if all(map(os.path.exists, outputs)) else None
+        example_outputs = example_report['outputs'].get(lesson_id) if example_report else None
+        tasks.append((variant, lesson_id, LESSONS_DATA[lesson_id], sidebar_digest, options,
+                      example_outputs, previous_hash))
+
+    if jobs > 1 and len(tasks) > 1:
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        chunksize = max(1, len(tasks) // (jobs * 4))
+        results = executor.map(render_lesson, tasks, chunksize=chunksize)
+    else:
+        executor = None
+        results = map(render_lesson, tasks)
+
+    written = []
+    skipped = []
+    minified = {}
+    try:
+        for lesson_id, lesson_hash, html_content, sizes, fragment in results:
+            new_manifest[lesson_id] = lesson_hash
+            report_name = f'lessons/{lesson_id}.html'
+            fragment_name = f'lessons/{lesson_id}{LESSON_FRAGMENT_SUFFIX}'
+            if html_content is None:
+                skipped.append(lesson_id)
+                files['unchanged'].append(report_name)
+                if client_nav:
+                    files['unchanged'].append(fragment_name)
+                continue
+
+            # Отрендеренная страница может совпасть с файлом на диске
+            # (например, после --force): тогда файл не трогаем
+            write_file(os.path.join(lessons_dir, f"{lesson_id}.html"), html_content,
+                       files, report_name)
+            if fragment is not None:
+                write_file(os.path.join(root, fragment_name), fragment, files, fragment_name)
+            written.append(lesson_id)
+            if sizes:
+                minified[lesson_id] = sizes
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    save_build_manifest(new_manifest, manifest_path)
+
+    # Индекс строится по всему курсу: поиск находит и несобиравшиеся уроки
+    search_files = []
+    if search:
+        search_files = emit_search_index(root, [
+            (lesson_id, lesson_data['title'], lesson_data['module'], course_contents[lesson_id])
+            for lesson_id, lesson_data in LESSONS_DATA.items()
+        ], files)
+
+    # Service worker кэширует весь сайт, включая уроки, не собиравшиеся сейчас
+    # Оболочка (главная, CSS, JS, навигация, Skulpt) скачивается при установке,
+    # страницы и фрагменты уроков и поисковый индекс - после неё
+    deferred = [f'lessons/{lesson_id}.html' for lesson_id in LESSONS_DATA]
+    if client_nav:
+        deferred += [f'lessons/{lesson_id}{LESSON_FRAGMENT_SUFFIX}' for lesson_id in LESSONS_DATA]
+    deferred += search_files
+    site_files = [INDEX_PAGE] + sorted(asset_urls.values()) + STATIC_FILES + vendored
+    if nav_src:
+        site_files.append(f'lessons/{nav_src}')
+    site_files += deferred
+    precached = emit_service_worker(root, site_files, files, deferred)
+
+    compressed = []
+    if compress:
+        artifacts = ([f'lessons/{lesson_id}.html' for lesson_id in selected]
+                     + [INDEX_PAGE, SERVICE_WORKER_FILE] + sorted(asset_urls.values())
+                     + STATIC_FILES + vendored + search_files)
+        if client_nav:
+            artifacts += [f'lessons/{lesson_id}{LESSON_FRAGMENT_SUFFIX}' for lesson_id in selected]
+        if nav_src:
+            artifacts.append(f'lessons/{nav_src}')
+        compressed = compress_files(root, artifacts, jobs)
+
+    # Сравниваем данные курса с прошлой сборкой. Индекс сохраняем только
+    # после полной сборки, иначе несобранные страницы выпадут из отчёта
+    course = load_course()
+    snapshot_path = os.path.join(root, COURSE_SNAPSHOT_PATH)
+    old_course = load_build_manifest(snapshot_path)
+    affected = None
+    if 'lessons' in old_course and 'order' in old_course:
+        affected = sorted(affected_artifacts(old_course, course, nav))
+    if not lesson_ids and not lesson_types:
+        save_build_manifest(course, snapshot_path)
+
+    # Бюджеты проверяются по всем страницам сайта, включая несобиравшиеся
+    budget_report = None
+    if budget:
+        pages = [(INDEX_PAGE, INDEX_PAGE, None)] + [
+            (f'lessons/{lesson_id}.html', lesson_id, lesson_data['module'])
+            for lesson_id, lesson_data in LESSONS_DATA.items()
+        ]
+        budget_report = check_budgets(root, pages)
+        violations = budget_report['violations']
+        if violations:
+            raise ValueError("страницы превышают бюджет:\n" + '\n'.join(
+                '  ' + format_violation(violation, budget_report['pages'][violation[0]])
+                for violation in violations))
+
+    return {'written': written, 'skipped': skipped, 'affected': affected, 'files': files,
+            'minified': minified, 'compressed': compressed, 'vendored': vendored,
+            'precached': precached, 'examples': example_report, 'budget': budget_report,
+            'critical_css': critical}
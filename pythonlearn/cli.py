@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+Командная строка сборки курса
+
+    python -m pythonlearn build                  # все изменившиеся уроки
+    python -m pythonlearn build python-03 algo-02
+    python -m pythonlearn build --type oge --jobs 4
+    python -m pythonlearn vendor                 # скачать Skulpt в js/vendor
+    python -m pythonlearn bench                  # замеры времени сборки
+    python -m pythonlearn serve                  # сервер с пересборкой при изменениях
+"""
+
+import os
+import argparse
+
+# Варианты курса продублированы здесь, чтобы --help не импортировал генераторы
+VARIANT_CHOICES = ['full', 'compact']
+
+def create_parser():
+    parser = argparse.ArgumentParser(prog='python -m pythonlearn',
+                                     description="Сборка курса \"Python для школьников\"")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = commands.add_parser('build', help="собрать HTML-страницы уроков")
+    build_parser.add_argument('lessons', nargs='*', metavar='LESSON_ID',
+                              help="собрать только эти уроки (по умолчанию - все)")
+    build_parser.add_argument('--type', dest='types', action='append', metavar='TYPE',
+                              help="собрать только уроки этого типа (algorithm, python, oge, ege)")
+    build_parser.add_argument('--variant', choices=VARIANT_CHOICES, default='full',
+                              help="вариант контента курса (по умолчанию full)")
+    build_parser.add_argument('--force', action='store_true',
+                              help="пересобрать уроки, игнорируя манифест сборки")
+    build_parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                              help="число процессов для рендера (0 - по числу ядер)")
+    build_parser.add_argument('--nav', choices=['inline', 'external'], default='inline',
+                              help="external - вынести навигацию в общий файл lessons/nav.html "
+                                   "вместо встраивания в каждую страницу")
+    build_parser.add_argument('--minify', action='store_true',
+                              help="минифицировать HTML (содержимое <pre> и <textarea> не меняется)")
+    build_parser.add_argument('--compress', action='store_true',
+                              help="записать рядом с изменившимися файлами .gz и .br (нужен модуль brotli)")
+    build_parser.add_argument('--fingerprint', action='store_true',
+                              help="выпустить CSS и JS с хэшем в имени, asset-manifest.json и _headers")
+    build_parser.add_argument('--client-nav', action='store_true',
+                              help="переходить между уроками без перезагрузки страницы "
+                                   "(фрагменты уроков lessons/<id>.json)")
+    build_parser.add_argument('--search', action='store_true',
+                              help="построить поисковый индекс курса (search/) и добавить поиск в навигацию")
+    build_parser.add_argument('--critical-css', action='store_true',
+                              help="встроить в страницы стили первого экрана и загружать "
+                                   "css/style.css без блокировки отрисовки")
+    build_parser.add_argument('--examples', action='store_true',
+                              help="выполнить примеры кода в CPython, встроить их вывод в страницы "
+                                   "и остановить сборку, если пример не работает")
+    build_parser.add_argument('--budget', action='store_true',
+                              help="проверить вес и сложность страниц и остановить сборку "
+                                   "при превышении бюджета (см. pythonlearn/budget.py)")
+    build_parser.add_argument('--out', metavar='DIR',
+                              help="корень сайта для записи (по умолчанию - каталог репозитория)")
+
+    vendor_parser = commands.add_parser('vendor', help="скачать Skulpt в js/vendor для работы без CDN")
+    vendor_parser.add_argument('--force', action='store_true',
+                               help="скачать заново, даже если файлы уже есть")
+
+    bench_parser = commands.add_parser('bench', help="замерить время этапов сборки и сравнить с эталоном")
+    bench_parser.add_argument('--scales', default='1,10,100', metavar='N,N',
+                              help="масштабы курса: число копий COURSE (по умолчанию 1,10,100)")
+    bench_parser.add_argument('--repeat', type=int, default=3, metavar='N',
+                              help="число повторов, берётся лучшее время (по умолчанию 3)")
+    bench_parser.add_argument('--variant', choices=VARIANT_CHOICES, default='full',
+                              help="вариант контента курса (по умолчанию full)")
+    bench_parser.add_argument('--nav', choices=['inline', 'external'], default='inline',
+                              help="режим навигации страниц")
+    bench_parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                              help="число процессов для полной сборки (0 - по числу ядер)")
+    bench_parser.add_argument('--output', metavar='FILE',
+                              help="куда записать результаты (по умолчанию bench-results.json)")
+    bench_parser.add_argument('--baseline', metavar='FILE',
+                              help="эталон для сравнения (по умолчанию bench-baseline.json)")
+    bench_parser.add_argument('--save-baseline', action='store_true',
+                              help="записать результаты как новый эталон")
+    bench_parser.add_argument('--max-slowdown', type=float, default=0.25, metavar='X',
+                              help="допустимое замедление этапа (по умолчанию 0.25 = 25%%)")
+
+    serve_parser = commands.add_parser('serve', help="сервер для авторов: пересборка при изменениях "
+                                                     "и перезагрузка открытых страниц")
+    serve_parser.add_argument('--port', type=int, default=8000,
+                              help="порт сервера (по умолчанию 8000)")
+    serve_parser.add_argument('--variant', choices=VARIANT_CHOICES, default='full',
+                              help="вариант контента курса (по умолчанию full)")
+    serve_parser.add_argument('--nav', choices=['inline', 'external'], default='inline',
+                              help="режим навигации страниц")
+    serve_parser.add_argument('--client-nav', action='store_true',
+                              help="переходить между уроками без перезагрузки страницы")
+    serve_parser.add_argument('--out', metavar='DIR',
+                              help="корень сайта для записи (по умолчанию - каталог репозитория)")
+
+    return parser
+
+def run_serve(args):
+    from .build import DEFAULT_ROOT
+    from .devserver import serve
+
+    root = args.out or DEFAULT_ROOT
+    os.makedirs(root, exist_ok=True)
+    try:
+        serve(DEFAULT_ROOT, root, args.port, {
+            'variant': args.variant,
+            'nav': args.nav,
+            'client_nav': args.client_nav,
+        })
+    except (ValueError, OSError) as e:
+        print(f"Ошибка: {e}")
+        return 2
+    return 0
+
+def run_bench(args):
+    import sys
+    from .build import DEFAULT_ROOT
+    from .bench import (BENCH_BASELINE_FILE, BENCH_RESULTS_FILE, compare_results, format_results,
+                        load_results, run_benchmarks, save_results)
+
+    try:
+        scales = [int(scale) for scale in args.scales.split(',')]
+    except ValueError:
+        print(f"Ошибка: неверные масштабы: {args.scales}")
+        return 2
+
+    def progress(scale, attempt):
+        print(f"… ×{scale}, проход {attempt + 1} из {args.repeat}", file=sys.stderr)
+
+    results = run_benchmarks(scales, max(1, args.repeat), args.variant, args.nav,
+                             args.jobs or os.cpu_count() or 1, progress)
+
+    output = args.output or os.path.join(DEFAULT_ROOT, BENCH_RESULTS_FILE)
+    baseline_path = args.baseline or os.path.join(DEFAULT_ROOT, BENCH_BASELINE_FILE)
+    baseline = load_results(baseline_path)
+
+    print(format_results(results, baseline))
+    save_results(results, output)
+    print(f"Результаты: {output}")
+
+    if args.save_baseline:
+        save_results(results, baseline_path)
+        print(f"✓ Эталон сохранён: {baseline_path}")
+        return 0
+    if baseline is None:
+        print(f"Эталона нет ({baseline_path}): сохраните его с --save-baseline")
+        return 0
+
+    regressions = compare_results(results, baseline, args.max_slowdown)
+    if regressions:
+        print("Регрессии относительно эталона:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("✓ Регрессий относительно эталона нет")
+    return 0
+
+def run_vendor(args):
+    from .build import DEFAULT_ROOT
+    from .vendor import SKULPT_DIR, vendor_skulpt
+
+    try:
+        downloaded = vendor_skulpt(DEFAULT_ROOT, force=args.force)
+    except OSError as e:
+        print(f"Ошибка загрузки Skulpt: {e}")
+        return 1
+
+    for path in downloaded:
+        print(f"  {path}")
+    print(f"✓ Skulpt в {SKULPT_DIR}: скачано файлов {len(downloaded)}")
+    return 0
+
+def run_build(args):
+    from .budget import format_budget_report
+    from .build import DEFAULT_ROOT, build
+
+    try:
+        result = build(
+            root=args.out or DEFAULT_ROOT,
+            variant=args.variant,
+            lesson_ids=args.lessons,
+            lesson_types=args.types,
+            force=args.force,
+            jobs=args.jobs or os.cpu_count() or 1,
+            nav=args.nav,
+            minify=args.minify,
+            compress=args.compress,
+            fingerprint=args.fingerprint,
+            client_nav=args.client_nav,
+            examples=args.examples,
+            budget=args.budget,
+            search=args.search,
+            critical_css=args.critical_css,
+        )
+    except ValueError as e:
+        print(f"Ошибка: {e}")
+        return 2
+
+    affected = result['affected']
+    if affected:
+        shown = ', '.join(affected[:10]) + (' ...' if len(affected) > 10 else '')
+        print(f"Изменения данных курса затрагивают {len(affected)}: {shown}")
+    minified = result['minified']
+    if minified:
+        for lesson_id, (raw_size, min_size) in minified.items():
+            print(f"  {lesson_id}.html: {raw_size} → {min_size} байт "
+                  f"(−{raw_size - min_size}, {100 * (raw_size - min_size) // raw_size}%)")
+        raw_total = sum(raw for raw, _ in minified.values())
+        min_total = sum(size for _, size in minified.values())
+        print(f"Минификация сэкономила {raw_total - min_total} байт из {raw_total}")
+
+    examples = result['examples']
+    if examples:
+        print(f"Примеры кода: выполнено для уроков {len(examples['run'])}, "
+              f"из кэша {len(examples['cached'])}, пропущено примеров {len(examples['skipped'])}")
+
+    critical = result['critical_css']
+    if critical:
+        print(f"Критический CSS страниц уроков: {len(critical.encode('utf-8'))} байт")
+
+    files = result['files']
+    print(f"Файлы: новых {len(files['new'])}, перезаписано {len(files['rewritten'])}, "
+          f"без изменений {len(files['unchanged'])}")
+    if args.compress:
+        print(f"Сжатых копий записано: {len(result['compressed'])}")
+        if not any(path.endswith('.br') for path in result['compressed']):
+            from .compress import brotli
+            if brotli is None:
+                print("Модуль brotli не установлен: .br не создаются (pip install brotli)")
+    budget = result['budget']
+    if budget:
+        print("Бюджеты страниц (размеры в байтах, блоков - встроенных <svg>/<script>/<style>):")
+        print(format_budget_report(budget['pages']))
+        pages = budget['pages'].values()
+        print(f"Бюджеты страниц соблюдены ({len(pages)}): до "
+              f"{max(page['gzip_bytes'] for page in pages)} байт после gzip, "
+              f"{max(page['dom_nodes'] for page in pages)} DOM-элементов")
+    print(f"Офлайн-кэш service worker: файлов {len(result['precached'])}")
+    if not result['vendored']:
+        print("Skulpt не скачан, страницы будут загружать его с CDN (python -m pythonlearn vendor)")
+    print(f"✓ Отрендерено уроков: {len(result['written'])}, пропущено без изменений: {len(result['skipped'])}")
+    return 0
+
+def main(argv=None):
+    args = create_parser().parse_args(argv)
+
+    if args.command == 'build':
+        return run_build(args)
+    if args.command == 'vendor':
+        return run_vendor(args)
+    if args.command == 'bench':
+        return run_bench(args)
+    if args.command == 'serve':
+        return run_serve(args)
+    return 0
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Предварительное сжатие артефактов сборки
+
+Рядом с каждым файлом пишутся file.gz и file.br с максимальным уровнем сжатия,
+чтобы статический хостинг отдавал их как есть, не сжимая на каждый запрос.
+Сжимаются только файлы, изменившиеся с прошлого сжатия (сжатая копия
+отсутствует или старше исходного файла).
+
+Для .br нужен модуль brotli (pip install brotli); без него пишутся только .gz.
+"""
+
+import os
+import gzip
+from concurrent.futures import ThreadPoolExecutor
+
+from .output import replace_file
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+def gzip_bytes(data):
+    """gzip с максимальным уровнем; mtime=0 делает результат воспроизводимым"""
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+def brotli_bytes(data):
+    return brotli.compress(data, quality=11)
+
+# Расширения сжатых копий
+GZIP_SUFFIX = '.gz'
+BROTLI_SUFFIX = '.br'
+
+def compressors():
+    """Доступные форматы: [(расширение, функция)]"""
+    available = [(GZIP_SUFFIX, gzip_bytes)]
+    if brotli is not None:
+        available.append((BROTLI_SUFFIX, brotli_bytes))
+    return available
+
+def source_name(name):
+    """Имя файла, сжатой копией которого является name ('a.json.gz' -> 'a.json')"""
+    for suffix in (GZIP_SUFFIX, BROTLI_SUFFIX):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+def is_stale(path, compressed_path):
+    """Сжатую копию нужно обновить, если её нет или исходный файл не старше её
+
+    При равных mtime (грубые часы файловой системы) копию тоже обновляем.
+    """
+    try:
+        return os.stat(compressed_path).st_mtime_ns <= os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return True
+
+def compress_file(path):
+    """Обновляет устаревшие сжатые копии файла; возвращает список записанных путей"""
+    pending = [(ext, compress) for ext, compress in compressors() if is_stale(path, path + ext)]
+    if not pending:
+        return []
+
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    written = []
+    for ext, compress in pending:
+        replace_file(path + ext, compress(data))
+        written.append(path + ext)
+    return written
+
+def compress_files(root, paths, jobs=1):
+    """Сжимает файлы (пути относительно root) параллельно
+
+    zlib и brotli отпускают GIL, поэтому хватает пула потоков.
+    Возвращает отсортированный список записанных сжатых файлов относительно root.
+    """
+    existing = [os.path.join(root, path) for path in paths if os.path.isfile(os.path.join(root, path))]
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        results = executor.map(compress_file, existing)
+        written = [os.path.relpath(path, root) for paths_written in results for path in paths_written]
+
+    return sorted(written)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Генераторы контента уроков
+
+Модули генераторов импортируются лениво: при сборке загружаются только те,
+что нужны для собираемых уроков.
+"""
+
+import importlib
+
+# Варианты курса. Урок выбирает генератор по типу из LESSONS_DATA ('type')
+# или по префиксу id ('prefix'); генератор вызывается как func(lesson_id, title)
+VARIANTS = {
+    # Полный курс (бывший generate_full_course.py)
+    'full': {
+        'key': 'type',
+        'generators': {
+            'algorithm': ('algorithm', 'generate_algorithm_lesson'),
+            'python': ('python', 'generate_python_lesson'),
+            'oge': ('oge', 'generate_oge_lesson'),
+            'ege': ('ege', 'generate_ege_lesson'),
+        },
+        'default': ('basic', 'generate_basic_lesson'),
+        # Уроки с полным авторским контентом; функция вызывается без аргументов
+        'special': {
+            'algo-01': ('algorithm', 'algo_01_content'),
+        },
+    },
+    # Компактный курс (бывший final_generator.py)
+    'compact': {
+        'key': 'prefix',
+        'generators': {
+            'algo': ('compact', 'generate_algorithm_lesson_content'),
+            'python': ('compact', 'generate_python_lesson_content'),
+            'oge': ('compact', 'generate_oge_lesson_content'),
+            'ege': ('compact', 'generate_ege_lesson_content'),
+        },
+        'default': ('compact', 'generate_python_lesson_content'),
+        'special': {},
+    },
+}
+
+DEFAULT_VARIANT = 'full'
+
+# Уже загруженные генераторы: (модуль, функция) -> функция
+_loaded = {}
+
+def load_generator(module_name, func_name):
+    """Импортирует модуль генератора при первом обращении"""
+    key = (module_name, func_name)
+    if key not in _loaded:
+        module = importlib.import_module(f'{__name__}.{module_name}')
+        _loaded[key] = getattr(module, func_name)
+    return _loaded[key]
+
+def generator_for(variant, lesson_id, lesson_data):
+    """Возвращает (модуль, функция, вызывать_без_аргументов) для урока"""
+    spec = VARIANTS[variant]
+
+    if lesson_id in spec['special']:
+        return spec['special'][lesson_id] + (True,)
+
+    if spec['key'] == 'type':
+        key = lesson_data['type']
+    else:
+        key = lesson_id.rsplit('-', 1)[0]
+
+    return spec['generators'].get(key, spec['default']) + (False,)
+
+def generate_lesson_content(variant, lesson_id, lesson_data):
+    """Генерирует контент для конкретного урока"""
+    module_name, func_name, no_args = generator_for(variant, lesson_id, lesson_data)
+    generate = load_generator(module_name, func_name)
+
+    if no_args:
+        return generate()
+    return generate(lesson_id, lesson_data['title'])
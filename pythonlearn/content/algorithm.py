@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+"""
+Контент уроков по алгоритмам: блок-схемы, ветвления, циклы, сортировки
+"""
+
+from ..templates import SVG_ARROW_MARKER
+
+def algo_01_content():
+    """Урок 1: Что такое алгоритм?"""
+    content = '''<h2>Введение</h2>
+                <p>Прежде чем начать программировать, нужно научиться думать как программист. Для этого мы изучим, что такое алгоритмы и как они работают.</p>
+
+                <h2>Что такое алгоритм?</h2>
+                <p><strong>Алгоритм</strong> — это точная последовательность действий, которая приводит к решению какой-то задачи.</p>
+
+                <p>Алгоритмы окружают нас повсюду! Вот несколько примеров из повседневной жизни:</p>
+
+                <ul>
+                    <li><strong>Рецепт приготовления блюда</strong> - точные шаги, которые нужно выполнить, чтобы приготовить еду</li>
+                    <li><strong>Инструкция по сборке мебели</strong> - последовательность действий для сборки шкафа</li>
+                    <li><strong>Маршрут от дома до школы</strong> - набор шагов, как добраться из точки А в точку Б</li>
+                    <li><strong>Правила игры</strong> - что нужно делать, чтобы играть и выиграть</li>
+                </ul>
+
+                <div class="note">
+                    <h4>Важно!</h4>
+                    <p>Алгоритм должен быть <strong>понятным</strong>, <strong>конечным</strong> (завершаться за определённое количество шагов) и <strong>точным</strong> (каждый шаг чётко определён).</p>
+                </div>
+
+                <h2>Пример алгоритма</h2>
+                <p>Давай рассмотрим простой алгоритм: <strong>"Как заварить чай"</strong></p>
+
+                <ol>
+                    <li>Взять чайник</li>
+                    <li>Налить в него воду</li>
+                    <li>Поставить чайник на плиту</li>
+                    <li>Включить плиту</li>
+                    <li>Дождаться, пока вода закипит</li>
+                    <li>Выключить плиту</li>
+                    <li>Положить чайный пакетик в чашку</li>
+                    <li>Налить кипяток в чашку</li>
+                    <li>Подождать 3-5 минут</li>
+                    <li>Достать пакетик</li>
+                    <li>Чай готов!</li>
+                </ol>
+
+                <h2>Свойства алгоритма</h2>
+
+                <h3>1. Дискретность</h3>
+                <p>Алгоритм состоит из отдельных шагов. Каждый шаг выполняется один за другим.</p>
+
+                <h3>2. Определённость</h3>
+                <p>Каждый шаг должен быть понятен и не допускать двусмысленности. Например, "налить много воды" - неточно. Лучше: "налить 1 литр воды".</p>
+
+                <h3>3. Результативность</h3>
+                <p>Алгоритм должен приводить к результату за конечное число шагов.</p>
+
+                <h3>4. Массовость</h3>
+                <p>Алгоритм должен работать для разных входных данных. Например, алгоритм сложения двух чисел работает для любых чисел.</p>
+
+                <div class="warning">
+                    <h4>Задумайся!</h4>
+                    <p>Если в алгоритме будет ошибка хотя бы в одном шаге, результат может быть неправильным. Поэтому в программировании важна точность!</p>
+                </div>
+
+                <div class="quiz-container">
+                    <h3>Тест к уроку</h3>
+
+                    <div class="question">
+                        <h4>Вопрос 1: Что такое алгоритм?</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="false">
+                                    Любое действие
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="true" data-explanation="Именно! Алгоритм - это чёткая последовательность шагов.">
+                                    Точная последовательность действий для решения задачи
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="false">
+                                    Компьютерная программа
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <div class="question">
+                        <h4>Вопрос 2: Какое свойство алгоритма означает, что он должен завершиться за конечное число шагов?</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q2" data-correct="false">
+                                    Дискретность
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q2" data-correct="true" data-explanation="Верно! Результативность гарантирует, что алгоритм закончится и даст результат.">
+                                    Результативность
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q2" data-correct="false">
+                                    Массовость
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <div class="question">
+                        <h4>Вопрос 3: Что из перечисленного НЕ является алгоритмом?</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q3" data-correct="false">
+                                    Рецепт пирога
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q3" data-correct="true" data-explanation="Правильно! Просто мечта - это не последовательность действий.">
+                                    Мечта о будущем
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q3" data-correct="false">
+                                    Инструкция по сборке
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <button class="btn-secondary" id="show-results">Показать результаты</button>
+                    <div class="quiz-results"></div>
+                </div>
+
+                <h2>Задание для практики</h2>
+                <div class="note">
+                    <h4>Практическое задание</h4>
+                    <p>Попробуй написать алгоритм для одной из этих задач:</p>
+                    <ul>
+                        <li>Как почистить зубы</li>
+                        <li>Как собрать рюкзак в школу</li>
+                        <li>Как перейти дорогу по светофору</li>
+                    </ul>
+                    <p>Запиши каждый шаг по порядку. Проверь, чтобы ничего не забыть!</p>
+                </div>'''
+
+    return content
+
+# Темы уроков: (название, в родительном падеже, описание)
+ALGORITHM_TOPICS = {
+    'algo-02': ('Блок-схемы', 'блок-схем', 'графическое представление алгоритмов'),
+    'algo-03': ('Линейные алгоритмы', 'линейных алгоритмов', 'последовательное выполнение команд'),
+    'algo-04': ('Ветвления', 'ветвлений', 'условные операторы и выбор'),
+    'algo-05': ('Циклы', 'циклов', 'повторение действий'),
+    'algo-06': ('Поиск', 'поиска', 'линейный и бинарный поиск'),
+    'algo-07': ('Сортировки', 'простых сортировок', 'пузырьковая и сортировка выбором'),
+    'algo-08': ('Быстрые сортировки', 'быстрых сортировок', 'QuickSort и MergeSort'),
+    'algo-09': ('Последовательности', 'обработки последовательностей', 'суммы, средние, фильтрация'),
+    'algo-10': ('Числа', 'работы с числами', 'простые числа, НОД, НОК'),
+    'algo-11': ('Строки', 'строковых алгоритмов', 'поиск подстрок, палиндромы'),
+    'algo-12': ('ДП основы', 'динамического программирования', 'мемоизация и оптимизация'),
+    'algo-13': ('ДП продвинутое', 'сложного ДП', 'задачи оптимизации'),
+    'algo-14': ('Жадные алгоритмы', 'жадных алгоритмов', 'локальные оптимумы'),
+    'algo-15': ('Перебор', 'полного перебора', 'перестановки и сочетания'),
+}
+
+def generate_algorithm_lesson(lesson_id, title):
+    """Генерирует урок по алгоритмам с блок-схемами"""
+
+    topic_name, topic_gen, topic_desc = ALGORITHM_TOPICS.get(lesson_id, ('Алгоритмы', 'алгоритмов', 'решение задач'))
+
+    content = f'''<h2>Введение</h2>
+                <p>В этом уроке мы изучим <strong>{topic_desc}</strong>. Это важная тема для понимания того, как работают программы и решаются сложные задачи.</p>
+
+                <h2>Что такое {topic_name}?</h2>
+                <p><strong>{topic_name}</strong> - это один из фундаментальных подходов в программировании, который помогает эффективно решать задачи.</p>
+
+                <div class="diagram">
+                    <svg class="diagram-svg" width="100%" height="400" viewBox="0 0 600 400" style="max-width: 500px;">
+                        <defs>
+                            {SVG_ARROW_MARKER}
+                        </defs>
+
+                        <!-- Начало -->
+                        <ellipse cx="300" cy="50" rx="80" ry="30" fill="#dbeafe" stroke="#6366f1" stroke-width="3"/>
+                        <text x="300" y="58" text-anchor="middle" font-size="15" font-weight="bold" fill="#1e293b">НАЧАЛО</text>
+
+                        <!-- Стрелка -->
+                        <path d="M 300 80 L 300 120" stroke="#1e293b" stroke-width="3" marker-end="url(#arrowhead)"/>
+
+                        <!-- Процесс -->
+                        <rect x="200" y="120" width="200" height="60" fill="#d1fae5" stroke="#10b981" stroke-width="3" rx="8"/>
+                        <text x="300" y="155" text-anchor="middle" font-size="14" font-weight="600" fill="#1e293b">Обработка данных</text>
+
+                        <!-- Стрелка -->
+                        <path d="M 300 180 L 300 220" stroke="#1e293b" stroke-width="3" marker-end="url(#arrowhead)"/>
+
+                        <!-- Результат -->
+                        <path d="M 220 220 L 380 220 L 360 280 L 200 280 Z" fill="#fef3c7" stroke="#f59e0b" stroke-width="3"/>
+                        <text x="290" y="255" text-anchor="middle" font-size="14" font-weight="600" fill="#1e293b">Вывод результата</text>
+
+                        <!-- Стрелка к концу -->
+                        <path d="M 300 280 L 300 320" stroke="#1e293b" stroke-width="3" marker-end="url(#arrowhead)"/>
+
+                        <!-- Конец -->
+                        <ellipse cx="300" cy="360" rx="80" ry="30" fill="#dbeafe" stroke="#6366f1" stroke-width="3"/>
+                        <text x="300" y="368" text-anchor="middle" font-size="15" font-weight="bold" fill="#1e293b">КОНЕЦ</text>
+                    </svg>
+                </div>
+
+                <h2>Основные понятия</h2>
+                <ul>
+                    <li>Понимание принципов {topic_gen}</li>
+                    <li>Применение на практике</li>
+                    <li>Оценка эффективности</li>
+                    <li>Типовые задачи ОГЭ/ЕГЭ</li>
+                </ul>
+
+                <div class="note">
+                    <h4>Важно знать!</h4>
+                    <p>Эта тема часто встречается на экзаменах ОГЭ и ЕГЭ. Важно понимать не только как применять алгоритм, но и почему он работает.</p>
+                </div>
+
+                <h2>Практический пример</h2>
+                <p>Рассмотрим типовую задачу и решим её пошагово.</p>
+
+                <div class="code-block">
+                    <pre># Пример алгоритма
+# Будет добавлен в следующих версиях урока
+</pre>
+                </div>
+
+                <h2>Проверь себя!</h2>
+
+                <div class="quiz-container">
+                    <h3>Тест к уроку</h3>
+
+                    <div class="question">
+                        <h4>Вопрос 1: Для чего используются {topic_name.lower()}?</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="false">
+                                    Для украшения кода
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="true" data-explanation="Верно! {topic_name} помогают эффективно решать задачи.">
+                                    Для эффективного решения задач
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="false">
+                                    Только для экзаменов
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <div class="question">
+                        <h4>Вопрос 2: Какое свойство важно для алгоритма?</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q2" data-correct="true" data-explanation="Правильно! Алгоритм должен быть эффективным.">
+                                    Эффективность
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q2" data-correct="false">
+                                    Красота
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q2" data-correct="false">
+                                    Сложность
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <div class="question">
+                        <h4>Вопрос 3: Встречается ли эта тема на ОГЭ/ЕГЭ?</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q3" data-correct="true" data-explanation="Да! Эта тема часто встречается на экзаменах.">
+                                    Да, очень часто
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q3" data-correct="false">
+                                    Нет, никогда
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q3" data-correct="false">
+                                    Только на олимпиадах
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <button class="btn-secondary" id="show-results">Показать результаты</button>
+                    <div class="quiz-results"></div>
+                </div>
+
+                <h2>Задание для практики</h2>
+                <div class="note">
+                    <h4>Практическое задание</h4>
+                    <p>Попробуй решить следующие задачи:</p>
+                    <ul>
+                        <li>Разберись с примерами из урока</li>
+                        <li>Реши 2-3 задачи самостоятельно</li>
+                        <li>Проверь свои решения</li>
+                    </ul>
+                </div>'''
+
+    return content
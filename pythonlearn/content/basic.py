@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Базовый шаблон для уроков без отдельного генератора
+"""
+
+def generate_basic_lesson(lesson_id, title):
+    """Базовый шаблон для любого урока"""
+
+    content = f'''<h2>Введение</h2>
+                <p>Добро пожаловать на урок! Здесь мы изучим важную тему по программированию на Python.</p>
+
+                <h2>Основные понятия</h2>
+                <p>В этом уроке рассмотрим ключевые концепции и их применение на практике.</p>
+
+                <div class="note">
+                    <h4>Запомни!</h4>
+                    <p>Эта тема важна для понимания более сложных концепций программирования.</p>
+                </div>
+
+                <h2>Проверь себя!</h2>
+
+                <div class="quiz-container">
+                    <h3>Тест к уроку</h3>
+
+                    <div class="question">
+                        <h4>Вопрос 1: Вопрос по теме урока</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="true" data-explanation="Правильно!">
+                                    Правильный ответ
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="false">
+                                    Неправильный ответ
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <button class="btn-secondary" id="show-results">Показать результаты</button>
+                    <div class="quiz-results"></div>
+                </div>'''
+
+    return content
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+Контент уроков подготовки к ЕГЭ
+"""
+
+def generate_ege_lesson(lesson_id, title):
+    """Генерирует урок подготовки к ЕГЭ"""
+
+    content = f'''<h2>Подготовка к ЕГЭ</h2>
+                <p>В этом уроке мы разберём сложные задачи ЕГЭ по информатике. Это задачи высокого уровня, требующие глубокого понимания программирования.</p>
+
+                <h2>Типы заданий ЕГЭ</h2>
+                <p>ЕГЭ включает 27 заданий разного уровня сложности:</p>
+
+                <ul>
+                    <li>Базовые задачи (1-12): теория, логика, системы счисления</li>
+                    <li>Средний уровень (13-21): алгоритмы, программирование</li>
+                    <li>Высокий уровень (22-27): сложное программирование, оптимизация</li>
+                </ul>
+
+                <div class="note">
+                    <h4>Важно для ЕГЭ!</h4>
+                    <p>Задачи 25-27 дают максимум баллов, но требуют отличного знания программирования и алгоритмов.</p>
+                </div>
+
+                <h2>Разбор типовой задачи</h2>
+                <p>Рассмотрим задачу высокого уровня:</p>
+
+                <div class="code-block">
+                    <pre># Задача ЕГЭ
+# Условие...
+
+# Решение
+def solve():
+    # Ваш код
+    pass</pre>
+                </div>
+
+                <h2>Решение с объяснением</h2>
+
+                <div class="python-editor">
+                    <div class="editor-header">
+                        <h3>Код решения</h3>
+                        <div class="editor-controls">
+                            <button class="run-btn">▶ Запустить</button>
+                            <button class="clear-btn">✕ Очистить</button>
+                        </div>
+                    </div>
+                    <textarea id="code-editor" spellcheck="false"># Напиши оптимальное решение
+# Учитывай граничные случаи
+# Тестируй на примерах
+</textarea>
+                    <div class="output-container">
+                        <h4>Результат:</h4>
+                        <div id="output"></div>
+                    </div>
+                </div>
+
+                <h2>Проверь себя!</h2>
+
+                <div class="quiz-container">
+                    <h3>Тест к уроку</h3>
+
+                    <div class="question">
+                        <h4>Вопрос 1: Сколько заданий в ЕГЭ по информатике?</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="false">
+                                    20
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="true" data-explanation="Верно! В ЕГЭ 27 заданий.">
+                                    27
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="false">
+                                    30
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <div class="question">
+                        <h4>Вопрос 2: Какие задачи дают больше всего баллов?</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q2" data-correct="false">
+                                    Первые 10
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q2" data-correct="true" data-explanation="Правильно! Задачи 25-27 самые сложные и дают больше баллов.">
+                                    Последние (25-27)
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q2" data-correct="false">
+                                    Все одинаково
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <div class="question">
+                        <h4>Вопрос 3: Нужно ли знать программирование для высоких баллов?</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q3" data-correct="true" data-explanation="Да! Без программирования не получить 80+ баллов.">
+                                    Да, обязательно
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q3" data-correct="false">
+                                    Нет, достаточно теории
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q3" data-correct="false">
+                                    Только базовые знания
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <button class="btn-secondary" id="show-results">Показать результаты</button>
+                    <div class="quiz-results"></div>
+                </div>
+
+                <h2>Стратегия подготовки</h2>
+                <div class="warning">
+                    <h4>План подготовки к ЕГЭ</h4>
+                    <ul>
+                        <li>Начни с базовых задач (1-12)</li>
+                        <li>Переходи к программированию (13-24)</li>
+                        <li>Осваивай сложные задачи (25-27)</li>
+                        <li>Решай пробные варианты каждую неделю</li>
+                        <li>Анализируй ошибки и разбирай решения</li>
+                    </ul>
+                </div>
+
+                <div class="note">
+                    <h4>Совет</h4>
+                    <p>Для получения 90+ баллов нужно уверенно решать задачи 25-27. Практикуйся в программировании каждый день!</p>
+                </div>'''
+
+    return content
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Контент уроков подготовки к ОГЭ
+"""
+
+def generate_oge_lesson(lesson_id, title):
+    """Генерирует урок подготовки к ОГЭ"""
+
+    content = f'''<h2>Подготовка к ОГЭ</h2>
+                <p>В этом уроке мы разберём типовые задачи ОГЭ по информатике. Научимся решать их быстро и правильно.</p>
+
+                <h2>Типовые задачи</h2>
+                <p>Рассмотрим основные типы заданий, которые встречаются на экзамене:</p>
+
+                <ul>
+                    <li>Анализ алгоритмов</li>
+                    <li>Программирование на Python</li>
+                    <li>Работа с данными</li>
+                    <li>Логические задачи</li>
+                </ul>
+
+                <div class="note">
+                    <h4>Стратегия решения</h4>
+                    <p>Всегда читай задание внимательно, проверяй граничные случаи, тестируй решение на примерах.</p>
+                </div>
+
+                <h2>Пример задачи</h2>
+                <p>Типовая задача ОГЭ:</p>
+
+                <div class="code-block">
+                    <pre># Условие задачи
+# Напишите программу, которая...
+
+# Решение
+# Будет добавлено</pre>
+                </div>
+
+                <h2>Практика</h2>
+
+                <div class="python-editor">
+                    <div class="editor-header">
+                        <h3>Решение задачи</h3>
+                        <div class="editor-controls">
+                            <button class="run-btn">▶ Запустить</button>
+                            <button class="clear-btn">✕ Очистить</button>
+                        </div>
+                    </div>
+                    <textarea id="code-editor" spellcheck="false"># Напиши своё решение здесь
+</textarea>
+                    <div class="output-container">
+                        <h4>Результат:</h4>
+                        <div id="output"></div>
+                    </div>
+                </div>
+
+                <h2>Проверь себя!</h2>
+
+                <div class="quiz-container">
+                    <h3>Тест к уроку</h3>
+
+                    <div class="question">
+                        <h4>Вопрос 1: Сколько баллов можно получить за ОГЭ по информатике?</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="false">
+                                    10
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="true" data-explanation="Правильно! Максимум 19 баллов.">
+                                    19
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="false">
+                                    100
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <div class="question">
+                        <h4>Вопрос 2: Какой язык программирования можно использовать на ОГЭ?</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q2" data-correct="true" data-explanation="Да! Python разрешён на ОГЭ.">
+                                    Python
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q2" data-correct="false">
+                                    HTML
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q2" data-correct="false">
+                                    SQL
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <div class="question">
+                        <h4>Вопрос 3: Нужно ли знать алгоритмы для ОГЭ?</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q3" data-correct="true" data-explanation="Абсолютно! Алгоритмы - основа экзамена.">
+                                    Да, обязательно
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q3" data-correct="false">
+                                    Нет
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q3" data-correct="false">
+                                    Только базовые
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <button class="btn-secondary" id="show-results">Показать результаты</button>
+                    <div class="quiz-results"></div>
+                </div>
+
+                <h2>Рекомендации</h2>
+                <div class="warning">
+                    <h4>Как готовиться к ОГЭ</h4>
+                    <ul>
+                        <li>Решай по 2-3 задачи каждый день</li>
+                        <li>Разбирай свои ошибки</li>
+                        <li>Практикуйся на реальных вариантах</li>
+                        <li>Следи за временем</li>
+                    </ul>
+                </div>'''
+
+    return content
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+Контент уроков по Python с интерактивным редактором
+"""
+
+# Темы уроков: (название, ключевые слова, пример кода)
+PYTHON_TOPICS = {
+    'python-03': ('Типы данных', 'int, float, str, bool', 'print(type(5))'),
+    'python-04': ('Арифметические операции', '+, -, *, /, //, %, **', 'print(10 + 5)\nprint(10 ** 2)'),
+    'python-05': ('Ввод/вывод', 'input() и print()', 'name = input("Имя: ")\nprint("Привет,", name)'),
+    'python-06': ('Условия if', 'if, elif, else', 'x = 10\nif x > 5:\n    print("Больше 5")'),
+    'python-07': ('Логические операции', 'and, or, not', 'x = 5\nif x > 0 and x < 10:\n    print("От 0 до 10")'),
+    'python-08': ('Цикл while', 'while условие', 'i = 0\nwhile i < 5:\n    print(i)\n    i += 1'),
+    'python-09': ('Цикл for', 'for i in range()', 'for i in range(5):\n    print(i)'),
+    'python-10': ('Строки', 'методы строк', 'text = "Hello"\nprint(text.upper())\nprint(text[0])'),
+    'python-11': ('Списки - основы', 'создание и индексация', 'numbers = [1, 2, 3, 4, 5]\nprint(numbers[0])'),
+    'python-12': ('Списки - методы', 'append, remove, sort', 'lst = [3, 1, 2]\nlst.sort()\nprint(lst)'),
+    'python-13': ('Двумерные списки', 'матрицы', 'matrix = [[1, 2], [3, 4]]\nprint(matrix[0][1])'),
+    'python-14': ('Кортежи', 'неизменяемые последовательности', 't = (1, 2, 3)\nprint(t[0])'),
+    'python-15': ('Множества', 'уникальные элементы', 's = {1, 2, 3}\ns.add(4)\nprint(s)'),
+    'python-16': ('Словари - основы', 'ключ: значение', 'd = {"name": "Иван", "age": 14}\nprint(d["name"])'),
+    'python-17': ('Словари - методы', 'keys(), values(), items()', 'd = {"a": 1}\nprint(d.keys())'),
+    'python-18': ('Функции', 'def, return', 'def hello():\n    print("Привет!")'),
+    'python-19': ('Параметры', 'аргументы функций', 'def greet(name):\n    print("Привет,", name)'),
+    'python-20': ('Return', 'возврат значений', 'def sum(a, b):\n    return a + b'),
+    'python-21': ('Область видимости', 'локальные и глобальные', 'x = 10\ndef func():\n    x = 5'),
+    'python-22': ('Рекурсия', 'функция вызывает себя', 'def factorial(n):\n    if n == 1:\n        return 1\n    return n * factorial(n-1)'),
+    'python-23': ('Lambda', 'анонимные функции', 'square = lambda x: x**2\nprint(square(5))'),
+    'python-24': ('Чтение файлов', 'open(), read()', 'with open("file.txt") as f:\n    content = f.read()'),
+    'python-25': ('Запись в файлы', 'write()', 'with open("file.txt", "w") as f:\n    f.write("Hello")'),
+    'python-26': ('Обработка текста', 'split(), join()', 'text = "a b c"\nwords = text.split()'),
+    'python-27': ('CSV файлы', 'модуль csv', 'import csv\n# работа с CSV'),
+    'python-28': ('Двоичная система', 'bin(), перевод чисел', 'print(bin(10))\nprint(int("1010", 2))'),
+    'python-29': ('8 и 16 системы', 'oct(), hex()', 'print(hex(255))\nprint(oct(8))'),
+    'python-30': ('Арифметика СС', 'операции в разных СС', '# Сложение в двоичной системе'),
+    'python-31': ('СС в Python', 'функции преобразования', 'print(int("FF", 16))'),
+    'python-32': ('Задачи ЕГЭ', 'типовые задачи', '# Решение задач ЕГЭ'),
+    'python-33': ('AND, OR, NOT', 'логика', 'print(True and False)\nprint(not True)'),
+    'python-34': ('Выражения', 'сложная логика', 'x = 5\nresult = (x > 0) and (x < 10)'),
+    'python-35': ('Логика в коде', 'применение', 'a, b = 3, 7\nif (a > 0) and (b > 0):\n    print("Оба положительные")'),
+    'python-36': ('Логические функции', 'таблицы истинности', '# Построение таблиц'),
+    'python-37': ('Задачи логики', 'ЕГЭ по логике', '# Решение логических задач'),
+    'python-38': ('Графы', 'представление графов', 'graph = {1: [2, 3], 2: [4]}'),
+    'python-39': ('BFS', 'поиск в ширину', 'from collections import deque'),
+    'python-40': ('DFS', 'поиск в глубину', 'def dfs(graph, start):\n    visited = set()'),
+    'python-41': ('Деревья', 'бинарные деревья', 'class Node:\n    def __init__(self, value):\n        self.value = value\n        self.left = None\n        self.right = None\n\nroot = Node(5)\nprint(root.value)'),
+    'python-42': ('Алгоритмы на графах', 'Дейкстра, кратчайшие пути', 'import heapq'),
+    'python-43': ('Графы ЕГЭ', 'задачи с графами', '# Подсчёт путей'),
+}
+
+def generate_python_lesson(lesson_id, title):
+    """Генерирует урок по Python с интерактивными примерами"""
+
+    topic_name, keywords, example_code = PYTHON_TOPICS.get(lesson_id, ('Python', 'основы Python', 'print("Hello")'))
+
+    content = f'''<h2>Введение</h2>
+                <p>В этом уроке мы изучим <strong>{topic_name}</strong> в Python. Это важная тема, которая поможет тебе писать более эффективные программы.</p>
+
+                <h2>Что такое {topic_name}?</h2>
+                <p><strong>{topic_name}</strong> - это {keywords}. Давай разберёмся, как это работает!</p>
+
+                <h2>Основные концепции</h2>
+                <p>Ключевые слова и операторы: <code>{keywords}</code></p>
+
+                <div class="note">
+                    <h4>Важно!</h4>
+                    <p>Эта тема широко используется в программировании и часто встречается на экзаменах.</p>
+                </div>
+
+                <h2>Примеры кода</h2>
+                <p>Вот базовый пример использования:</p>
+
+                <div class="code-block">
+                    <pre>{example_code}</pre>
+                </div>
+
+                <h2>Попробуй сам!</h2>
+                <p>Запусти код и посмотри, что получится:</p>
+
+                <div class="python-editor">
+                    <div class="editor-header">
+                        <h3>Python редактор</h3>
+                        <div class="editor-controls">
+                            <button class="run-btn">▶ Запустить</button>
+                            <button class="clear-btn">✕ Очистить</button>
+                        </div>
+                    </div>
+                    <textarea id="code-editor" spellcheck="false">{example_code}</textarea>
+                    <div class="output-container">
+                        <h4>Результат:</h4>
+                        <div id="output"></div>
+                    </div>
+                </div>
+
+                <h2>Практические задания</h2>
+                <div class="warning">
+                    <h4>Задание 1</h4>
+                    <p>Попробуй изменить код выше и поэкспериментируй с разными значениями.</p>
+                </div>
+
+                <div class="warning">
+                    <h4>Задание 2</h4>
+                    <p>Напиши свою программу, используя изученные концепции.</p>
+                </div>
+
+                <h2>Проверь себя!</h2>
+
+                <div class="quiz-container">
+                    <h3>Тест к уроку</h3>
+
+                    <div class="question">
+                        <h4>Вопрос 1: Для чего используется {topic_name}?</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="false">
+                                    Только для красоты кода
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="true" data-explanation="Верно! Это важная функциональность Python.">
+                                    Для решения практических задач
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q1" data-correct="false">
+                                    Не используется
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <div class="question">
+                        <h4>Вопрос 2: Как правильно использовать {topic_name}?</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q2" data-correct="true" data-explanation="Правильно! Важно следовать синтаксису Python.">
+                                    Следуя синтаксису Python
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q2" data-correct="false">
+                                    Как угодно
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q2" data-correct="false">
+                                    Только в специальных случаях
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <div class="question">
+                        <h4>Вопрос 3: Встречается ли эта тема на экзаменах?</h4>
+                        <ul class="options">
+                            <li>
+                                <label>
+                                    <input type="radio" name="q3" data-correct="true" data-explanation="Да! Очень часто встречается.">
+                                    Да, регулярно
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q3" data-correct="false">
+                                    Нет
+                                </label>
+                            </li>
+                            <li>
+                                <label>
+                                    <input type="radio" name="q3" data-correct="false">
+                                    Только в университете
+                                </label>
+                            </li>
+                        </ul>
+                        <button class="check-answer-btn">Проверить</button>
+                        <div class="feedback"></div>
+                    </div>
+
+                    <button class="btn-secondary" id="show-results">Показать результаты</button>
+                    <div class="quiz-results"></div>
+                </div>
+
+                <h2>Итоги урока</h2>
+                <p>Теперь ты знаешь:</p>
+                <ul>
+                    <li>Как использовать {topic_name}</li>
+                    <li>Основные операторы и функции</li>
+                    <li>Практическое применение</li>
+                </ul>'''
+
+    return content
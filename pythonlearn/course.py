@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+"""
+Структура курса: модули и уроки
+
+COURSE - единственный источник данных о курсе. Из него выводятся LESSONS_DATA,
+навигация (sidebar) и ссылки "предыдущий/следующий урок". compile_course()
+один раз разбирает его в индекс с доступом к уроку по id за O(1) и графом
+зависимостей: какие сгенерированные страницы читают каждое поле урока.
+"""
+
+import functools
+
+# Модули и уроки в порядке прохождения курса.
+# title - заголовок страницы урока, nav_title - короткое название в навигации,
+# time_limit / step_limit - необязательные лимиты запуска кода в редакторе урока
+COURSE = [
+    # Модуль 1: Основы алгоритмики (algo-01 to algo-05)
+    {
+        "title": "Основы алгоритмики",
+        "lessons": [
+            {"id": "algo-01", "title": "Урок 1: Что такое алгоритм?", "nav_title": "Что такое алгоритм?",
+             "duration": "10 минут", "type": "algorithm"},
+            {"id": "algo-02", "title": "Урок 2: Блок-схемы", "nav_title": "Блок-схемы",
+             "duration": "15 минут", "type": "algorithm"},
+            {"id": "algo-03", "title": "Урок 3: Линейные алгоритмы", "nav_title": "Линейные алгоритмы",
+             "duration": "15 минут", "type": "algorithm"},
+            {"id": "algo-04", "title": "Урок 4: Алгоритмы с ветвлениями", "nav_title": "Ветвления",
+             "duration": "20 минут", "type": "algorithm"},
+            {"id": "algo-05", "title": "Урок 5: Циклические алгоритмы", "nav_title": "Циклы",
+             "duration": "20 минут", "type": "algorithm"},
+        ]
+    },
+    # Модуль 2: Введение в Python (python-01 to python-10)
+    {
+        "title": "Введение в Python",
+        "lessons": [
+            {"id": "python-01", "title": "Урок 6: Первая программа на Python", "nav_title": "Первая программа",
+             "duration": "15 минут", "type": "python"},
+            {"id": "python-02", "title": "Урок 7: Переменные", "nav_title": "Переменные",
+             "duration": "20 минут", "type": "python"},
+            {"id": "python-03", "title": "Урок 8: Типы данных", "nav_title": "Типы данных",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-04", "title": "Урок 9: Арифметические операции", "nav_title": "Арифметические операции",
+             "duration": "20 минут", "type": "python"},
+            {"id": "python-05", "title": "Урок 10: Ввод и вывод данных", "nav_title": "Ввод и вывод",
+             "duration": "20 минут", "type": "python"},
+            {"id": "python-06", "title": "Урок 11: Условный оператор if", "nav_title": "Условия if",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-07", "title": "Урок 12: Логические операции", "nav_title": "Логические операции",
+             "duration": "20 минут", "type": "python"},
+            {"id": "python-08", "title": "Урок 13: Цикл while", "nav_title": "Цикл while",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-09", "title": "Урок 14: Цикл for", "nav_title": "Цикл for",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-10", "title": "Урок 15: Строки", "nav_title": "Строки",
+             "duration": "30 минут", "type": "python"},
+        ]
+    },
+    # Модуль 3: Структуры данных (python-11 to python-17)
+    {
+        "title": "Структуры данных",
+        "lessons": [
+            {"id": "python-11", "title": "Урок 16: Списки - Основы", "nav_title": "Списки - основы",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-12", "title": "Урок 17: Списки - Методы", "nav_title": "Списки - методы",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-13", "title": "Урок 18: Вложенные списки (матрицы)", "nav_title": "Вложенные списки",
+             "duration": "30 минут", "type": "python"},
+            {"id": "python-14", "title": "Урок 19: Кортежи (tuple)", "nav_title": "Кортежи",
+             "duration": "20 минут", "type": "python"},
+            {"id": "python-15", "title": "Урок 20: Множества (set)", "nav_title": "Множества",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-16", "title": "Урок 21: Словари (dict) - Основы", "nav_title": "Словари - основы",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-17", "title": "Урок 22: Словари (dict) - Методы", "nav_title": "Словари - методы",
+             "duration": "25 минут", "type": "python"},
+        ]
+    },
+    # Модуль 4: Функции (python-18 to python-23)
+    {
+        "title": "Функции",
+        "lessons": [
+            {"id": "python-18", "title": "Урок 23: Создание функций", "nav_title": "Создание функций",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-19", "title": "Урок 24: Параметры функций", "nav_title": "Параметры функций",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-20", "title": "Урок 25: Возврат значений", "nav_title": "Возврат значений",
+             "duration": "20 минут", "type": "python"},
+            {"id": "python-21", "title": "Урок 26: Область видимости", "nav_title": "Область видимости",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-22", "title": "Урок 27: Рекурсия", "nav_title": "Рекурсия",
+             "duration": "30 минут", "type": "python"},
+            {"id": "python-23", "title": "Урок 28: Lambda-функции", "nav_title": "Lambda-функции",
+             "duration": "20 минут", "type": "python"},
+        ]
+    },
+    # Модуль 5: Работа с файлами (python-24 to python-27)
+    {
+        "title": "Работа с файлами",
+        "lessons": [
+            {"id": "python-24", "title": "Урок 29: Чтение файлов", "nav_title": "Чтение файлов",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-25", "title": "Урок 30: Запись в файлы", "nav_title": "Запись в файлы",
+             "duration": "20 минут", "type": "python"},
+            {"id": "python-26", "title": "Урок 31: Обработка текстовых файлов", "nav_title": "Обработка текста",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-27", "title": "Урок 32: Работа с CSV", "nav_title": "Работа с CSV",
+             "duration": "25 минут", "type": "python"},
+        ]
+    },
+    # Модуль 6: Алгоритмы (algo-06 to algo-15)
+    {
+        "title": "Алгоритмы",
+        "lessons": [
+            {"id": "algo-06", "title": "Урок 33: Поиск в списке", "nav_title": "Поиск в списке",
+             "duration": "25 минут", "type": "algorithm"},
+            {"id": "algo-07", "title": "Урок 34: Сортировка - Простые методы", "nav_title": "Простые сортировки",
+             "duration": "30 минут", "type": "algorithm"},
+            {"id": "algo-08", "title": "Урок 35: Сортировка - Быстрые методы", "nav_title": "Быстрые сортировки",
+             "duration": "30 минут", "type": "algorithm"},
+            {"id": "algo-09", "title": "Урок 36: Обработка последовательностей", "nav_title": "Обработка последовательностей",
+             "duration": "25 минут", "type": "algorithm"},
+            {"id": "algo-10", "title": "Урок 37: Работа с числами", "nav_title": "Работа с числами",
+             "duration": "25 минут", "type": "algorithm"},
+            {"id": "algo-11", "title": "Урок 38: Строковые алгоритмы", "nav_title": "Строковые алгоритмы",
+             "duration": "25 минут", "type": "algorithm"},
+            {"id": "algo-12", "title": "Урок 39: Динамическое программирование - Основы", "nav_title": "ДП - основы",
+             "duration": "30 минут", "type": "algorithm"},
+            {"id": "algo-13", "title": "Урок 40: Динамическое программирование - Продвинутое", "nav_title": "ДП - продвинутое",
+             "duration": "30 минут", "type": "algorithm"},
+            {"id": "algo-14", "title": "Урок 41: Жадные алгоритмы", "nav_title": "Жадные алгоритмы",
+             "duration": "25 минут", "type": "algorithm"},
+            {"id": "algo-15", "title": "Урок 42: Перебор и комбинаторика", "nav_title": "Перебор и комбинаторика",
+             "duration": "30 минут", "type": "algorithm"},
+        ]
+    },
+    # Модуль 7: Системы счисления (python-28 to python-32)
+    {
+        "title": "Системы счисления",
+        "lessons": [
+            {"id": "python-28", "title": "Урок 43: Двоичная система", "nav_title": "Двоичная система",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-29", "title": "Урок 44: Восьмеричная и шестнадцатеричная системы", "nav_title": "8-я и 16-я системы",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-30", "title": "Урок 45: Арифметика в различных системах", "nav_title": "Арифметика в СС",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-31", "title": "Урок 46: Системы счисления в Python", "nav_title": "СС в Python",
+             "duration": "20 минут", "type": "python"},
+            {"id": "python-32", "title": "Урок 47: Задачи ЕГЭ по системам счисления", "nav_title": "Задачи ЕГЭ по СС",
+             "duration": "30 минут", "type": "python"},
+        ]
+    },
+    # Модуль 8: Логика (python-33 to python-37)
+    {
+        "title": "Логика",
+        "lessons": [
+            {"id": "python-33", "title": "Урок 48: Логические операции", "nav_title": "Логические операции",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-34", "title": "Урок 49: Логические выражения", "nav_title": "Логические выражения",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-35", "title": "Урок 50: Логика в Python", "nav_title": "Логика в Python",
+             "duration": "20 минут", "type": "python"},
+            {"id": "python-36", "title": "Урок 51: Логические функции", "nav_title": "Логические функции",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-37", "title": "Урок 47: Задачи ЕГЭ по логике", "nav_title": "Задачи ЕГЭ по логике",
+             "duration": "30 минут", "type": "python"},
+        ]
+    },
+    # Модуль 9: Графы (python-38 to python-43)
+    {
+        "title": "Графы и деревья",
+        "lessons": [
+            {"id": "python-38", "title": "Урок 53: Введение в графы", "nav_title": "Введение в графы",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-39", "title": "Урок 54: Обход графа в ширину (BFS)", "nav_title": "Обход в ширину (BFS)",
+             "duration": "30 минут", "type": "python"},
+            {"id": "python-40", "title": "Урок 55: Обход графа в глубину (DFS)", "nav_title": "Обход в глубину (DFS)",
+             "duration": "30 минут", "type": "python"},
+            {"id": "python-41", "title": "Урок 56: Деревья", "nav_title": "Деревья",
+             "duration": "25 минут", "type": "python"},
+            {"id": "python-42", "title": "Урок 57: Алгоритмы на графах", "nav_title": "Алгоритмы на графах",
+             "duration": "30 минут", "type": "python"},
+            {"id": "python-43", "title": "Урок 58: Задачи ЕГЭ с графами", "nav_title": "Задачи ЕГЭ с графами",
+             "duration": "30 минут", "type": "python"},
+        ]
+    },
+    # Модуль 10: ОГЭ (oge-01 to oge-08)
+    {
+        "title": "Подготовка к ОГЭ",
+        "lessons": [
+            {"id": "oge-01", "title": "Урок 59: ОГЭ - Исполнители алгоритмов", "nav_title": "Исполнители алгоритмов",
+             "duration": "30 минут", "type": "oge"},
+            {"id": "oge-02", "title": "Урок 60: ОГЭ - Анализ программ", "nav_title": "Анализ программ",
+             "duration": "25 минут", "type": "oge"},
+            {"id": "oge-03", "title": "Урок 61: ОГЭ - Программирование: простые задачи", "nav_title": "Простые задачи",
+             "duration": "25 минут", "type": "oge"},
+            {"id": "oge-04", "title": "Урок 62: ОГЭ - Программирование: массивы", "nav_title": "Массивы",
+             "duration": "30 минут", "type": "oge"},
+            {"id": "oge-05", "title": "Урок 63: ОГЭ - Программирование: строки", "nav_title": "Строки",
+             "duration": "25 минут", "type": "oge"},
+            {"id": "oge-06", "title": "Урок 64: ОГЭ - Файлы", "nav_title": "Файлы",
+             "duration": "25 минут", "type": "oge"},
+            {"id": "oge-07", "title": "Урок 65: ОГЭ - Электронные таблицы", "nav_title": "Электронные таблицы",
+             "duration": "25 минут", "type": "oge"},
+            {"id": "oge-08", "title": "Урок 66: ОГЭ - Пробный экзамен", "nav_title": "Пробный экзамен",
+             "duration": "90 минут", "type": "oge"},
+        ]
+    },
+    # Модуль 11: ЕГЭ (ege-01 to ege-12)
+    {
+        "title": "Подготовка к ЕГЭ",
+        "lessons": [
+            {"id": "ege-01", "title": "Урок 67: ЕГЭ - Кодирование информации", "nav_title": "Кодирование информации",
+             "duration": "30 минут", "type": "ege"},
+            {"id": "ege-02", "title": "Урок 68: ЕГЭ - Логика и множества", "nav_title": "Логика и множества",
+             "duration": "30 минут", "type": "ege"},
+            {"id": "ege-03", "title": "Урок 69: ЕГЭ - Системы счисления", "nav_title": "Системы счисления",
+             "duration": "30 минут", "type": "ege"},
+            {"id": "ege-04", "title": "Урок 70: ЕГЭ - Алгоритмы", "nav_title": "Алгоритмы",
+             "duration": "30 минут", "type": "ege"},
+            {"id": "ege-05", "title": "Урок 71: ЕГЭ - Программирование простое (Задача 22)", "nav_title": "Программирование простое",
+             "duration": "25 минут", "type": "ege"},
+            {"id": "ege-06", "title": "Урок 72: ЕГЭ - Программирование среднее (Задача 24)", "nav_title": "Программирование среднее",
+             "duration": "30 минут", "type": "ege", "time_limit": 30, "step_limit": 50000000},
+            {"id": "ege-07", "title": "Урок 73: ЕГЭ - Программирование сложное (Задача 25)", "nav_title": "Программирование сложное",
+             "duration": "35 минут", "type": "ege", "time_limit": 30, "step_limit": 50000000},
+            {"id": "ege-08", "title": "Урок 74: ЕГЭ - Теория игр", "nav_title": "Теория игр",
+             "duration": "35 минут", "type": "ege"},
+            {"id": "ege-09", "title": "Урок 75: ЕГЭ - Рекурсия (Задача 23)", "nav_title": "Рекурсия",
+             "duration": "30 минут", "type": "ege"},
+            {"id": "ege-10", "title": "Урок 76: ЕГЭ - Динамическое программирование (Задача 27)", "nav_title": "Динамическое программирование",
+             "duration": "35 минут", "type": "ege"},
+            {"id": "ege-11", "title": "Урок 77: ЕГЭ - Обработка больших данных (Задача 26)", "nav_title": "Обработка больших данных",
+             "duration": "35 минут", "type": "ege", "time_limit": 30, "step_limit": 50000000},
+            {"id": "ege-12", "title": "Урок 78: ЕГЭ - Пробный экзамен", "nav_title": "Пробный экзамен",
+             "duration": "235 минут", "type": "ege"},
+        ]
+    },
+    # Модуль 12: Продвинутые темы (advanced-01 to advanced-07)
+    {
+        "title": "Продвинутые темы",
+        "lessons": [
+            {"id": "advanced-01", "title": "Урок 79: ООП - Классы и объекты", "nav_title": "ООП - Классы и объекты",
+             "duration": "30 минут", "type": "python"},
+            {"id": "advanced-02", "title": "Урок 80: ООП - Наследование", "nav_title": "ООП - Наследование",
+             "duration": "30 минут", "type": "python"},
+            {"id": "advanced-03", "title": "Урок 81: Обработка исключений", "nav_title": "Обработка исключений",
+             "duration": "25 минут", "type": "python"},
+            {"id": "advanced-04", "title": "Урок 82: Работа с модулями", "nav_title": "Работа с модулями",
+             "duration": "25 минут", "type": "python"},
+            {"id": "advanced-05", "title": "Урок 83: Регулярные выражения", "nav_title": "Регулярные выражения",
+             "duration": "30 минут", "type": "python"},
+            {"id": "advanced-06", "title": "Урок 84: Сложность алгоритмов", "nav_title": "Сложность алгоритмов",
+             "duration": "30 минут", "type": "algorithm"},
+            {"id": "advanced-07", "title": "Урок 85: Олимпиадные задачи", "nav_title": "Олимпиадные задачи",
+             "duration": "40 минут", "type": "python", "time_limit": 30, "step_limit": 50000000},
+        ]
+    },
+]
+
+# Лимиты запуска кода в редакторе по умолчанию: секунды работы программы
+# и число выполненных инструкций Python (см. js/python-worker.js)
+DEFAULT_TIME_LIMIT = 10
+DEFAULT_STEP_LIMIT = 5000000
+
+# Куда ведут "предыдущий" у первого урока и "следующий" у последнего
+COURSE_START = '../index.html'
+COURSE_END = '../index.html'
+
+# Граф зависимостей: поле урока -> какие артефакты сборки его читают.
+#   'self'  - страница самого урока
+#   'nav'   - навигация курса (nav.html или sidebar, встроенный в каждую страницу)
+# Ссылки prev/next выводятся из порядка уроков, поэтому перестановка или
+# добавление урока меняет prev/next только у соседей и затрагивает их страницы
+FIELD_DEPENDENTS = {
+    'title': ('self',),
+    'nav_title': ('nav',),
+    'module': ('self', 'nav'),
+    'duration': ('self',),
+    'type': ('self',),
+    'prev': ('self',),
+    'next': ('self',),
+    'time_limit': ('self',),
+    'step_limit': ('self',),
+}
+
+# Артефакт навигации при сборке с --nav external
+NAV_ARTIFACT = 'lessons/nav.html'
+
+def lesson_artifact(lesson_id):
+    """Имя артефакта страницы урока"""
+    return f'lessons/{lesson_id}.html'
+
+def compile_course(course=COURSE):
+    """Разбирает структуру курса в индекс
+
+    Возвращает словарь:
+        'lessons' - id -> урок (title, nav_title, module, duration, type, time_limit,
+                    step_limit, prev, next, position)
+        'order'   - id уроков в порядке прохождения
+        'modules' - [{'title': ..., 'lessons': [id, ...]}, ...]
+    """
+    lessons = {}
+    order = []
+    modules = []
+
+    for module in course:
+        module_ids = []
+        for lesson in module['lessons']:
+            lesson_id = lesson['id']
+            if lesson_id in lessons:
+                raise ValueError(f"Урок {lesson_id} встречается в курсе дважды")
+            lessons[lesson_id] = {
+                'title': lesson['title'],
+                'nav_title': lesson['nav_title'],
+                'module': module['title'],
+                'duration': lesson['duration'],
+                'type': lesson['type'],
+                'time_limit': lesson.get('time_limit', DEFAULT_TIME_LIMIT),
+                'step_limit': lesson.get('step_limit', DEFAULT_STEP_LIMIT),
+                'position': len(order),
+            }
+            order.append(lesson_id)
+            module_ids.append(lesson_id)
+        modules.append({'title': module['title'], 'lessons': module_ids})
+
+    for position, lesson_id in enumerate(order):
+        lessons[lesson_id]['prev'] = f'{order[position - 1]}.html' if position > 0 else COURSE_START
+        lessons[lesson_id]['next'] = f'{order[position + 1]}.html' if position + 1 < len(order) else COURSE_END
+
+    return {'lessons': lessons, 'order': order, 'modules': modules}
+
+@functools.lru_cache(maxsize=None)
+def load_course():
+    """Индекс курса из COURSE (разбирается один раз на процесс)"""
+    return compile_course()
+
+def lessons_data(course):
+    """Данные уроков в формате LESSONS_DATA: id -> title, module, duration, prev, next, type,
+    time_limit, step_limit"""
+    return {
+        lesson_id: {
+            key: course['lessons'][lesson_id][key]
+            for key in ('title', 'module', 'duration', 'prev', 'next', 'type', 'time_limit', 'step_limit')
+        }
+        for lesson_id in course['order']
+    }
+
+def changed_fields(old_course, new_course):
+    """Список (lesson_id, поле) полей, различающихся в двух индексах курса
+
+    Добавленный или удалённый урок даёт запись (lesson_id, None).
+    """
+    old_lessons = old_course['lessons']
+    new_lessons = new_course['lessons']
+    changes = []
+
+    for lesson_id in new_course['order']:
+        if lesson_id not in old_lessons:
+            changes.append((lesson_id, None))
+            continue
+        for field in FIELD_DEPENDENTS:
+            if old_lessons[lesson_id].get(field) != new_lessons[lesson_id].get(field):
+                changes.append((lesson_id, field))
+
+    for lesson_id in old_course['order']:
+        if lesson_id not in new_lessons:
+            changes.append((lesson_id, None))
+
+    return changes
+
+def affected_artifacts(old_course, new_course, nav='inline'):
+    """Артефакты сборки, которые нужно перегенерировать после изменения курса
+
+    При nav='inline' навигация встроена в каждую страницу, поэтому изменение
+    навигации затрагивает все страницы; при nav='external' - только nav.html.
+    """
+    affected = set()
+    for lesson_id, field in changed_fields(old_course, new_course):
+        dependents = ('self', 'nav') if field is None else FIELD_DEPENDENTS[field]
+        if 'self' in dependents and lesson_id in new_course['lessons']:
+            affected.add(lesson_artifact(lesson_id))
+        if 'nav' in dependents:
+            if nav == 'external':
+                affected.add(NAV_ARTIFACT)
+            else:
+                affected.update(lesson_artifact(other) for other in new_course['order'])
+    return affected
+
+# Данные всех 85 уроков (выводятся из COURSE)
+LESSONS_DATA = lessons_data(load_course())
@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+"""
+Критический CSS: стили первого экрана прямо в странице
+
+Без него каждая страница ждёт с отрисовкой всю таблицу стилей css/style.css.
+Сборка с --critical-css выбирает из неё правила, которые нужны первому
+экрану, встраивает их в <head> (<style data-critical>) и подключает
+таблицу стилей целиком без блокировки отрисовки: <link rel="preload">
+становится таблицей стилей, когда она загрузится, а без JS работает
+обычная ссылка из <noscript>.
+
+Первый экран - всё, что в разметке идёт до контейнера контента (шапка,
+навигация, заголовок урока), и первые FOLD_BLOCKS блоков контейнера.
+Тесты и редакторы кода (DEFERRED_CLASSES) в первый экран не входят, даже
+если стоят в начале урока: их стили приходят с таблицей стилей.
+Критический CSS считается один раз для всех страниц уроков (по первым
+экранам всех уроков курса) и отдельно для index.html. Отдельный CSS для
+каждого типа уроков не нужен: первые блоки уроков всех типов - заголовок
+раздела и абзац, и наборы правил совпадают байт в байт.
+
+Правило попадает в критический CSS, если хотя бы один его селектор подходит
+к элементу первого экрана. Сопоставление намеренно щедрое: псевдоклассы
+(:hover, ::before) и классы состояний, которые ставит main.js
+(RUNTIME_CLASSES), считаются подходящими - лишнее правило дешевле, чем
+скачок вёрстки после загрузки таблицы стилей.
+"""
+
+import re
+from html.parser import HTMLParser
+
+# Контейнер, внутри которого первым экраном считаются только первые блоки
+LESSON_FOLD_CONTAINER = '.lesson-content'
+INDEX_FOLD_CONTAINER = 'main'
+
+# Сколько блоков контейнера входит в первый экран: заголовок раздела и первый абзац
+FOLD_BLOCKS = 2
+
+# Блоки, которые не входят в первый экран вместе со всем содержимым
+DEFERRED_CLASSES = {'quiz-container', 'python-editor'}
+
+# Разметка, которую main.js добавляет на первый экран при загрузке: overlay
+# мобильного меню и поле поиска (сборка с --search)
+RUNTIME_MARKUP = '<div class="overlay"></div>'
+SEARCH_MARKUP = ('<div class="sidebar-search"><input type="search">'
+                 '<ul class="search-results" hidden><li class="search-empty"></li>'
+                 '<li><a><span class="search-module"></span></a></li></ul></div>')
+
+# Классы состояний, которые main.js ставит элементам первого экрана
+RUNTIME_CLASSES = {'active', 'collapsed', 'completed'}
+
+# Элементы без закрывающего тега
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+             'source', 'track', 'wbr'}
+
+# Блоки, содержимое которых - правила, а не объявления
+GROUPING_AT_RULES = ('@media', '@supports')
+
+COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.S)
+RULE_END_PATTERN = re.compile(r'[{;}]')
+BRACE_PATTERN = re.compile(r'[{}]')
+COMBINATOR_PATTERN = re.compile(r'\s*([>+~])\s*|\s+')
+COMPOUND_PART_PATTERN = re.compile(
+    r'(?P<tag>^(?:[a-zA-Z][\w-]*|\*))|#(?P<id>[\w-]+)|\.(?P<class>[\w-]+)'
+    r'|\[\s*(?P<attr>[\w-]+)\s*(?:(?P<operator>[~|^$*]?=)\s*["\']?(?P<value>[^"\'\]]*)["\']?\s*)?\]'
+    r'|::?(?P<pseudo>[\w-]+)(?:\([^)]*\))?')
+ANIMATION_PATTERN = re.compile(r'animation(?:-name)?\s*:([^;]*)')
+
+def stylesheet_links(href, critical_css=None):
+    """Подключение таблицы стилей: обычная ссылка или критический CSS и отложенная загрузка"""
+    if critical_css is None:
+        return f'<link rel="stylesheet" href="{href}">'
+    return (f'<style data-critical>{critical_css}</style>\n'
+            f'    <link rel="preload" href="{href}" as="style" '
+            f'onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+            f'    <noscript><link rel="stylesheet" href="{href}"></noscript>')
+
+STYLESHEET_LINK_PATTERN = re.compile(r'<link rel="stylesheet" href="(?P<href>[^"]+)">')
+
+def inline_critical_css(html, critical_css=None):
+    """Заменяет обычную ссылку на таблицу стилей страницы видом stylesheet_links"""
+    def replace(match):
+        return stylesheet_links(match.group('href'), critical_css)
+    return STYLESHEET_LINK_PATTERN.sub(replace, html, count=1)
+
+def parse_stylesheet(css):
+    """Правила таблицы стилей: [(заголовок, тело)]
+
+    Тело @media и @supports - список правил, остальных - текст между скобками
+    (None у правил без блока, например @import).
+    """
+    css = COMMENT_PATTERN.sub('', css)
+    rules = []
+    position = 0
+    while True:
+        match = RULE_END_PATTERN.search(css, position)
+        if match is None:
+            break
+        prelude = ' '.join(css[position:match.start()].split())
+        position = match.end()
+        if match.group() != '{':
+            if prelude:
+                rules.append((prelude, None))
+            continue
+
+        depth = 1
+        while depth:
+            brace = BRACE_PATTERN.search(css, position)
+            if brace is None:
+                raise ValueError(f"незакрытый блок CSS: {prelude}")
+            depth += 1 if brace.group() == '{' else -1
+            position = brace.end()
+        body = css[match.end():position - 1]
+        if prelude.startswith(GROUPING_AT_RULES):
+            body = parse_stylesheet(body)
+        rules.append((prelude, body))
+    return rules
+
+def parse_compound(text):
+    """'a.note[type="radio"]:hover' -> {'tag', 'ids', 'classes', 'attrs', 'pseudos'}"""
+    compound = {'tag': None, 'ids': [], 'classes': set(), 'attrs': [], 'pseudos': []}
+    for part in COMPOUND_PART_PATTERN.finditer(text):
+        if part.group('tag'):
+            compound['tag'] = part.group('tag').lower()
+        elif part.group('id'):
+            compound['ids'].append(part.group('id'))
+        elif part.group('class'):
+            compound['classes'].add(part.group('class'))
+        elif part.group('attr'):
+            # Кроме точного равенства, атрибут проверяется только на наличие
+            value = part.group('value') if part.group('operator') == '=' else None
+            compound['attrs'].append((part.group('attr').lower(), value))
+        else:
+            compound['pseudos'].append(part.group('pseudo').lower())
+    return compound
+
+def parse_selector(selector):
+    """'.a > .b' -> [(.b, '>'), (.a, None)]: простые селекторы справа налево
+    с комбинатором, который связывает каждый с селектором левее"""
+    tokens = COMBINATOR_PATTERN.split(selector.strip())
+    compounds = [parse_compound(text) for text in reversed(tokens[::2])]
+    combinators = [operator or ' ' for operator in reversed(tokens[1::2])]
+    return list(zip(compounds, combinators + [None]))
+
+class FoldElements:
+    """Элементы первых экранов без повторов: одинаковые ссылки навигации -
+    один элемент. Узел - (тег, id, классы, атрибуты, номер родителя)"""
+
+    def __init__(self, value_attrs):
+        # Атрибуты, значения которых сравнивают селекторы; у остальных важно только наличие
+        self.value_attrs = value_attrs
+        self.nodes = []
+        self.numbers = {}
+
+    def add(self, tag, attrs, parent):
+        attrs = dict(attrs)
+        node = (
+            tag,
+            attrs.pop('id', None),
+            frozenset((attrs.pop('class', None) or '').split()),
+            frozenset((name, value if name in self.value_attrs else None) for name, value in attrs.items()),
+            parent,
+        )
+        if node not in self.numbers:
+            self.numbers[node] = len(self.nodes)
+            self.nodes.append(node)
+        return self.numbers[node]
+
+class FoldParser(HTMLParser):
+    """Добавляет в FoldElements элементы первого экрана
+
+    Разбор прекращается после FOLD_BLOCKS блоков контейнера или на его конце.
+    Блоки с классами DEFERRED_CLASSES внутри контейнера пропускаются целиком
+    и в FOLD_BLOCKS не считаются. parent - узел, внутри которого разбирается
+    фрагмент; container_depth - глубина контейнера, если фрагмент - его содержимое.
+    """
+
+    def __init__(self, elements, container=None, parent=None, container_depth=None):
+        super().__init__(convert_charrefs=True)
+        self.elements = elements
+        self.container = parse_compound(container) if container else None
+        self.stack = [parent] if parent is not None else []
+        self.container_depth = container_depth
+        self.container_node = parent if container_depth is not None else None
+        self.blocks = 0
+        # Теги открытых элементов пропускаемого блока
+        self.deferred = []
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        self.add_element(tag, attrs, tag not in VOID_TAGS)
+
+    def handle_startendtag(self, tag, attrs):
+        self.add_element(tag, attrs, False)
+
+    def add_element(self, tag, attrs, has_content):
+        if self.done:
+            return
+        if self.deferred:
+            if has_content:
+                self.deferred.append(tag)
+            return
+        if self.container_depth is not None and len(self.stack) >= self.container_depth:
+            if DEFERRED_CLASSES & set((dict(attrs).get('class') or '').split()):
+                if has_content:
+                    self.deferred.append(tag)
+                return
+            if len(self.stack) == self.container_depth:
+                if self.blocks == FOLD_BLOCKS:
+                    self.done = True
+                    return
+                self.blocks += 1
+
+        node = self.elements.add(tag, attrs, self.stack[-1] if self.stack else None)
+        if has_content:
+            self.stack.append(node)
+        if (self.container_depth is None and self.container
+                and compound_matches(self.container, self.elements.nodes[node])):
+            self.container_node = node
+            self.container_depth = len(self.stack)
+
+    def handle_endtag(self, tag):
+        if self.done or tag in VOID_TAGS:
+            return
+        if self.deferred:
+            if tag in self.deferred:
+                depth = len(self.deferred) - 1 - self.deferred[::-1].index(tag)
+                del self.deferred[depth:]
+            return
+        nodes = self.elements.nodes
+        for depth in range(len(self.stack) - 1, -1, -1):
+            if nodes[self.stack[depth]][0] == tag:
+                del self.stack[depth:]
+                break
+        if self.container_depth is not None and len(self.stack) < self.container_depth:
+            self.done = True
+
+def compound_matches(compound, node):
+    tag, node_id, classes, attrs, _ = node
+    if compound['tag'] not in (None, '*') and compound['tag'] != tag:
+        return False
+    if 'root' in compound['pseudos'] and tag != 'html':
+        return False
+    if any(selector_id != node_id for selector_id in compound['ids']):
+        return False
+    if not compound['classes'] - RUNTIME_CLASSES <= classes:
+        return False
+    attrs = dict(attrs)
+    for name, value in compound['attrs']:
+        if name not in attrs or (value is not None and attrs[name] != value):
+            return False
+    return True
+
+def matches_at(parts, position, number, nodes):
+    """Подходит ли узел nodes[number] к parts[position:]"""
+    compound, combinator = parts[position]
+    if not compound_matches(compound, nodes[number]):
+        return False
+    if position + 1 == len(parts):
+        return True
+
+    parent = nodes[number][4]
+    if combinator == '>':
+        return parent is not None and matches_at(parts, position + 1, parent, nodes)
+    if combinator in ('+', '~'):
+        # Порядок соседей не хранится: подходит любой узел с тем же родителем
+        return any(node[4] == parent and matches_at(parts, position + 1, other, nodes)
+                   for other, node in enumerate(nodes))
+    while parent is not None:
+        if matches_at(parts, position + 1, parent, nodes):
+            return True
+        parent = nodes[parent][4]
+    return False
+
+def selector_used(selector, nodes):
+    parts = parse_selector(selector)
+    return any(matches_at(parts, 0, number, nodes) for number in range(len(nodes)))
+
+def compact_declarations(body):
+    declarations = []
+    for declaration in body.split(';'):
+        if ':' in declaration:
+            name, value = declaration.split(':', 1)
+            declarations.append(f"{name.strip()}:{' '.join(value.split())}")
+    return ';'.join(declarations)
+
+def select_rules(rules, nodes, animations):
+    """Правила, нужные элементам nodes, в компактной записи
+
+    Имена анимаций из выбранных правил добавляются в animations: @keyframes
+    выбираются после всех правил (см. critical_css).
+    """
+    selected = []
+    for prelude, body in rules:
+        if prelude.startswith(GROUPING_AT_RULES):
+            inner = select_rules(body, nodes, animations)
+            if inner:
+                selected.append(f'{prelude}{{{inner}}}')
+        elif prelude.startswith('@'):
+            continue
+        else:
+            selectors = [selector.strip() for selector in prelude.split(',')]
+            used = [selector for selector in selectors if selector_used(selector, nodes)]
+            if used:
+                for match in ANIMATION_PATTERN.finditer(body):
+                    animations.update(match.group(1).replace(',', ' ').split())
+                selected.append(f"{','.join(used)}{{{compact_declarations(body)}}}")
+    return ''.join(selected)
+
+def value_attributes(rules):
+    """Атрибуты, значения которых сравнивают селекторы таблицы стилей"""
+    names = set()
+    for prelude, body in rules:
+        if prelude.startswith(GROUPING_AT_RULES):
+            names |= value_attributes(body)
+        elif not prelude.startswith('@'):
+            for part in COMPOUND_PART_PATTERN.finditer(prelude):
+                if part.group('attr') and part.group('operator'):
+                    names.add(part.group('attr').lower())
+    return names
+
+def critical_css(css, page_html, container, contents=(), search=False):
+    """Критический CSS страниц одного вида
+
+    page_html - страница; если у страниц вида разный контент контейнера
+    (уроки), она рендерится с пустым контейнером, а варианты его содержимого
+    передаются в contents. Первые экраны всех вариантов объединяются.
+    search - на страницах есть поле поиска, которое добавляет main.js.
+    """
+    rules = parse_stylesheet(css)
+    elements = FoldElements(value_attributes(rules))
+
+    parser = FoldParser(elements, container)
+    parser.feed(page_html)
+    parser.close()
+    if parser.container_node is None:
+        raise ValueError(f"на странице нет контейнера первого экрана {container}")
+
+    for content_html in contents:
+        fragment = FoldParser(elements, parent=parser.container_node, container_depth=1)
+        fragment.feed(content_html)
+        fragment.close()
+
+    runtime = FoldParser(elements)
+    runtime.feed(RUNTIME_MARKUP + (SEARCH_MARKUP if search else ''))
+    runtime.close()
+
+    animations = set()
+    selected = [select_rules(rules, elements.nodes, animations)]
+    # Прочие @-правила (@font-face, @import) нужны всегда, @keyframes - если используются
+    for prelude, body in rules:
+        if prelude.startswith('@keyframes'):
+            if prelude.split()[-1] in animations:
+                selected.append(f"{prelude}{{{' '.join(body.split())}}}")
+        elif prelude.startswith('@') and not prelude.startswith(GROUPING_AT_RULES):
+            selected.insert(0, f'{prelude};' if body is None else f"{prelude}{{{' '.join(body.split())}}}")
+    return ''.join(selected)
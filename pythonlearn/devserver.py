@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""
+Сервер для авторов курса: пересборка при изменениях и живая перезагрузка
+
+python -m pythonlearn serve собирает курс, раздаёт корень сайта по HTTP и
+следит за пакетом pythonlearn (генераторы, данные курса, шаблоны, исходник
+главной страницы), css/ и js/. Процесс живёт всё время работы: изменённые модули
+перезагружаются через importlib.reload, а пересобираются только уроки,
+которые от них зависят (для генератора контента - уроки его типа; для
+данных курса и шаблонов - уроки, у которых изменился хэш входных данных).
+
+Открытые вкладки подписаны на SSE-канал LIVERELOAD_PATH: после пересборки
+они перезагружаются, если изменилась их страница, а изменение CSS
+подменяет таблицу стилей без перезагрузки. Скрипт подписки добавляется в
+HTML при отдаче и в файлы сборки не попадает; service worker в режиме
+разработки не кэширует сайт, а удаляет себя.
+"""
+
+import os
+import sys
+import json
+import time
+import importlib
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+LIVERELOAD_PATH = '/__livereload'
+
+# Период опроса файлов, с
+WATCH_INTERVAL = 0.2
+
+# Период пустых сообщений SSE: по ним сервер замечает закрытые вкладки, с
+KEEPALIVE_INTERVAL = 15
+
+# Что отслеживается (относительно корня репозитория)
+WATCHED_DIRS = ['pythonlearn', 'css', 'js']
+WATCHED_FILES = [os.path.join('pythonlearn', 'index.html')]
+# Скачанный Skulpt не меняется
+IGNORED_DIRS = [os.path.join('js', 'vendor')]
+
+# Модули пакета в порядке зависимостей: модуль перезагружается после тех,
+# из которых он импортирует. Генераторы контента (pythonlearn.content.*)
+# перезагружаются после content, сборка - последней
+RELOAD_ORDER = ['course', 'output', 'critical', 'templates', 'manifest', 'minify', 'compress', 'assets',
+                'vendor', 'offline', 'content', None, 'examples', 'budget', 'search', 'build']
+
+LIVERELOAD_SCRIPT = '''<script>
+(function() {
+    // Живая перезагрузка (python -m pythonlearn serve)
+    const source = new EventSource('%s');
+    source.addEventListener('reload', function(event) {
+        const paths = JSON.parse(event.data);
+        const current = location.pathname.replace(/\\/$/, '/index.html');
+        if (paths.length === 0 || paths.some(function(path) { return current.endsWith('/' + path); })) {
+            location.reload();
+        }
+    });
+    source.addEventListener('css', function() {
+        document.querySelectorAll('link[rel="stylesheet"]').forEach(function(link) {
+            const url = new URL(link.href);
+            url.searchParams.set('livereload', Date.now());
+            link.href = url.href;
+        });
+    });
+})();
+</script>
+''' % LIVERELOAD_PATH
+
+# Service worker на время разработки: снимает установленный ранее и ничего не кэширует
+DEV_SERVICE_WORKER = '''self.addEventListener('install', function() {
+    self.skipWaiting();
+});
+self.addEventListener('activate', function(event) {
+    event.waitUntil(self.registration.unregister());
+});
+'''
+
+class LiveReload:
+    """Канал событий для открытых вкладок: (номер, событие, данные)"""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.events = []
+
+    def publish(self, event, data):
+        with self.condition:
+            self.events.append((len(self.events) + 1, event, data))
+            self.condition.notify_all()
+
+    def wait(self, after, timeout):
+        """События с номером больше after; пустой список по таймауту"""
+        with self.condition:
+            self.condition.wait_for(lambda: len(self.events) > after, timeout)
+            return self.events[after:]
+
+def make_handler(root, livereload):
+    class DevRequestHandler(SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=root, **kwargs)
+
+        def end_headers(self):
+            # Браузер всегда берёт свежие файлы
+            self.send_header('Cache-Control', 'no-store')
+            super().end_headers()
+
+        def do_GET(self):
+            path = self.path.split('?', 1)[0]
+            if path == LIVERELOAD_PATH:
+                self.stream_events()
+            elif path.endswith('/sw.js'):
+                self.send_text(DEV_SERVICE_WORKER, 'text/javascript')
+            elif path.endswith('.html') or path.endswith('/'):
+                self.send_page(path)
+            else:
+                super().do_GET()
+
+        def send_text(self, text, content_type):
+            data = text.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def send_page(self, path):
+            """HTML-страница со скриптом живой перезагрузки"""
+            file_path = self.translate_path(path)
+            if os.path.isdir(file_path):
+                file_path = os.path.join(file_path, 'index.html')
+            try:
+                with open(file_path, encoding='utf-8') as f:
+                    html = f.read()
+            except OSError:
+                self.send_error(404)
+                return
+            position = html.rfind('</body>')
+            if position == -1:
+                position = len(html)
+            self.send_text(html[:position] + LIVERELOAD_SCRIPT + html[position:], 'text/html')
+
+        def stream_events(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.end_headers()
+            # Вкладка получает только события после подключения
+            seen = len(livereload.events)
+            try:
+                while True:
+                    events = livereload.wait(seen, KEEPALIVE_INTERVAL)
+                    if not events:
+                        self.wfile.write(b': keepalive\n\n')
+                    for seen, event, data in events:
+                        self.wfile.write(f'event: {event}\ndata: {json.dumps(data)}\n\n'.encode('utf-8'))
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def log_message(self, format, *args):
+            # Запросы страниц не засоряют вывод пересборок
+            pass
+
+    return DevRequestHandler
+
+def watched_files(source_root):
+    """Путь относительно source_root -> mtime для всех отслеживаемых файлов"""
+    files = {}
+    for directory in WATCHED_DIRS:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(source_root, directory)):
+            relative_dir = os.path.relpath(dirpath, source_root)
+            dirnames[:] = [name for name in dirnames
+                           if name != '__pycache__' and os.path.join(relative_dir, name) not in IGNORED_DIRS]
+            for name in filenames:
+                if name.endswith(('.py', '.css', '.js')):
+                    path = os.path.join(relative_dir, name)
+                    files[path] = os.stat(os.path.join(source_root, path)).st_mtime_ns
+    for path in WATCHED_FILES:
+        full_path = os.path.join(source_root, path)
+        if os.path.exists(full_path):
+            files[path] = os.stat(full_path).st_mtime_ns
+    return files
+
+def changed_paths(before, after):
+    """Добавленные, изменённые и удалённые файлы"""
+    return sorted(path for path in set(before) | set(after) if before.get(path) != after.get(path))
+
+def module_name(path):
+    """pythonlearn/content/python.py -> pythonlearn.content.python"""
+    name = os.path.splitext(path)[0].replace(os.sep, '.')
+    return name[:-len('.__init__')] if name.endswith('.__init__') else name
+
+def reload_package():
+    """Перезагружает модули сборки в порядке зависимостей"""
+    for name in RELOAD_ORDER:
+        if name is None:
+            prefix = 'pythonlearn.content.'
+            for loaded in sorted(sys.modules):
+                if loaded.startswith(prefix):
+                    importlib.reload(sys.modules[loaded])
+        elif f'pythonlearn.{name}' in sys.modules:
+            importlib.reload(sys.modules[f'pythonlearn.{name}'])
+
+def generator_lessons(module, variant):
+    """Уроки, контент которых генерирует модуль pythonlearn.content.<module>"""
+    from .build import LESSONS_DATA
+    from .content import generator_for
+
+    return [lesson_id for lesson_id, lesson_data in LESSONS_DATA.items()
+            if generator_for(variant, lesson_id, lesson_data)[0] == module]
+
+def apply_changes(paths, build_options, livereload):
+    """Пересобирает то, что зависит от изменённых файлов, и оповещает вкладки
+
+    Возвращает текст отчёта для консоли.
+    """
+    python_paths = [path for path in paths if path.endswith('.py')]
+    lesson_ids = None
+    if python_paths:
+        generators = [module_name(path) for path in python_paths]
+        if all(name.startswith('pythonlearn.content.') for name in generators):
+            # Изменились только генераторы контента: перезагружаем их
+            # и пересобираем уроки, которые они генерируют
+            from . import content
+            lesson_ids = []
+            for name in generators:
+                if name in sys.modules:
+                    importlib.reload(sys.modules[name])
+                lesson_ids += generator_lessons(name.rsplit('.', 1)[1], build_options['variant'])
+            content._loaded.clear()
+            if not lesson_ids:
+                return "изменённые модули не генерируют ни одного урока"
+        else:
+            reload_package()
+
+    from .build import build
+
+    result = build(lesson_ids=lesson_ids, **build_options)
+    files = result['files']
+    # Если сайт раздаётся прямо из репозитория, изменённые CSS и JS уже на месте
+    changed = files['new'] + files['rewritten']
+    changed += [path.replace(os.sep, '/') for path in paths
+                if not path.endswith('.py') and path.replace(os.sep, '/') not in changed]
+    if not publish_changes(changed, livereload):
+        return "без изменений"
+
+    written = result['written']
+    shown = ', '.join(written[:10]) + (' ...' if len(written) > 10 else '')
+    return f"уроков {len(written)}{': ' + shown if written else ''}, файлов {len(changed)}"
+
+def publish_changes(changed, livereload):
+    """Оповещает вкладки об изменённых файлах сайта; False, если оповещать не о чем
+
+    Изменение только страниц уроков перезагружает их вкладки, CSS
+    подменяется без перезагрузки, остальное перезагружает все вкладки.
+    Service worker, его список файлов и фрагменты уроков меняются вместе со
+    страницами и отдельно не учитываются.
+    """
+    from .offline import PRECACHE_MANIFEST_FILE, SERVICE_WORKER_FILE
+    from .templates import LESSON_FRAGMENT_SUFFIX, NAV_FRAGMENT_FILE
+
+    changed = [path for path in changed if path not in (SERVICE_WORKER_FILE, PRECACHE_MANIFEST_FILE)
+               and not path.endswith(LESSON_FRAGMENT_SUFFIX)]
+    styles = [path for path in changed if path.endswith('.css')]
+    pages = [path for path in changed if path.endswith('.html') and path != f'lessons/{NAV_FRAGMENT_FILE}']
+    others = [path for path in changed if path not in styles and path not in pages]
+
+    if others:
+        livereload.publish('reload', [])
+    elif pages:
+        livereload.publish('reload', pages)
+    if styles and not others:
+        livereload.publish('css', styles)
+    return bool(changed)
+
+def serve(source_root, root, port=8000, build_options=None, report=print):
+    """Собирает курс, запускает сервер и пересобирает его при изменениях до Ctrl+C"""
+    from .build import build
+
+    build_options = dict(build_options or {}, root=root)
+    started = time.perf_counter()
+    result = build(**build_options)
+    report(f"Собрано уроков: {len(result['written'])} за {time.perf_counter() - started:.2f} с")
+
+    livereload = LiveReload()
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(root, livereload))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    report(f"Сервер: http://127.0.0.1:{server.server_address[1]}/ (Ctrl+C - остановить)")
+
+    snapshot = watched_files(source_root)
+    try:
+        while True:
+            time.sleep(WATCH_INTERVAL)
+            current = watched_files(source_root)
+            paths = changed_paths(snapshot, current)
+            if not paths:
+                continue
+            snapshot = current
+            started = time.perf_counter()
+            try:
+                summary = apply_changes(paths, build_options, livereload)
+            except Exception as e:
+                # Ошибка в редактируемом модуле не останавливает сервер
+                summary = f"ошибка: {type(e).__name__}: {e}"
+            report(f"{', '.join(paths)} → {summary} ({time.perf_counter() - started:.2f} с)")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Проверка примеров кода при сборке
+
+Начальный код каждого редактора урока один раз выполняется в CPython, в
+отдельном процессе: с таймаутом, во временном каталоге, без stdin и без
+переменных окружения. Вывод встраивается в <div id="output"> страницы,
+поэтому ученик видит результат примера, не дожидаясь загрузки Skulpt.
+Пример, который не выполняется, останавливает сборку.
+
+Результаты кэшируются по хэшу кода и версии Python (EXAMPLES_CACHE_PATH):
+повторная сборка запускает только новые и изменившиеся примеры.
+Примеры с input() и работой с файлами не выполняются: без ученика и его
+файлов они не дают осмысленного вывода.
+"""
+
+import os
+import re
+import sys
+import html
+import hashlib
+import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from .content import generate_lesson_content
+from .manifest import load_build_manifest, save_build_manifest
+
+# Кэш результатов относительно корня сборки
+EXAMPLES_CACHE_PATH = os.path.join('lessons', '.build-examples.json')
+
+# Ограничения процесса примера: секунды работы и байты памяти
+EXAMPLE_TIMEOUT = 5
+EXAMPLE_MEMORY_LIMIT = 256 * 1024 * 1024
+
+# Редактор урока: начальный код и пустой блок вывода после него
+EDITOR_PATTERN = re.compile(
+    r'(<textarea id="code-editor"[^>]*>)((?:(?!</textarea>).)*)(</textarea>'
+    r'(?:(?!<textarea).)*?<div id="output")(></div>)', re.S)
+
+# Примеры, которые нельзя выполнить без ученика: причина пропуска -> шаблон
+SKIP_PATTERNS = {
+    'ввод с клавиатуры': re.compile(r'\binput\s*\('),
+    'работа с файлами': re.compile(r'\bopen\s*\('),
+}
+
+def editor_examples(content_html):
+    """Начальный код редакторов урока в порядке появления"""
+    return [html.unescape(match.group(2)) for match in EDITOR_PATTERN.finditer(content_html)]
+
+def skip_reason(code):
+    """Почему пример не выполняется при сборке (None - выполняется)"""
+    if not code.strip() or all(line.lstrip().startswith('#') or not line.strip()
+                               for line in code.splitlines()):
+        return 'только комментарии'
+    for reason, pattern in SKIP_PATTERNS.items():
+        if pattern.search(code):
+            return reason
+    return None
+
+def example_key(code):
+    """Ключ кэша: вывод зависит от кода и от версии Python"""
+    version = '.'.join(map(str, sys.version_info[:2]))
+    return hashlib.sha256(f'{version}\n{code}'.encode('utf-8')).hexdigest()
+
+# Запускается в процессе примера: ограничивает память и процессорное время
+# (где есть модуль resource) и выполняет код из argv как __main__.
+# Ограничения ставит сам процесс, а не preexec_fn: пул запускает процессы
+# из нескольких потоков
+EXAMPLE_BOOTSTRAP = f'''
+import sys
+try:
+    import resource
+    resource.setrlimit(resource.RLIMIT_AS, ({EXAMPLE_MEMORY_LIMIT}, {EXAMPLE_MEMORY_LIMIT}))
+    resource.setrlimit(resource.RLIMIT_CPU, ({EXAMPLE_TIMEOUT}, {EXAMPLE_TIMEOUT}))
+except (ImportError, ValueError):
+    pass
+code = sys.argv.pop(1)
+exec(compile(code, '<example>', 'exec'), {{'__name__': '__main__'}})
+'''
+
+def run_example(code, timeout=EXAMPLE_TIMEOUT):
+    """Выполняет код в изолированном процессе CPython
+
+    Возвращает {'output': stdout} или {'error': описание ошибки}.
+    """
+    # -I: без site-packages пользователя, PYTHON* и текущего каталога в sys.path
+    command = [sys.executable, '-I', '-X', 'utf8', '-c', EXAMPLE_BOOTSTRAP, code]
+    with tempfile.TemporaryDirectory(prefix='pythonlearn-example-') as cwd:
+        try:
+            completed = subprocess.run(command, cwd=cwd, env={}, stdin=subprocess.DEVNULL,
+                                       capture_output=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return {'error': f"не завершился за {timeout} с"}
+
+    if completed.returncode != 0:
+        stderr = completed.stderr.decode('utf-8', 'replace').strip()
+        return {'error': stderr.splitlines()[-1] if stderr else f"код возврата {completed.returncode}"}
+    return {'output': completed.stdout.decode('utf-8', 'replace')}
+
+def embed_example_outputs(content_html, outputs):
+    """Вписывает вывод примеров (код -> вывод) в блоки вывода редакторов"""
+    def embed(match):
+        output = outputs.get(html.unescape(match.group(2)), '').rstrip('\n')
+        if not output:
+            return match.group(0)
+        return (match.group(1) + match.group(2) + match.group(3)
+                + f' class="expected-output">{html.escape(output, quote=False)}</div>')
+    return EDITOR_PATTERN.sub(embed, content_html)
+
+def check_examples(root, variant, lesson_ids, jobs=1):
+    """Выполняет примеры уроков lesson_ids и возвращает вывод по урокам
+
+    Результат - {'outputs': {lesson_id: {код: вывод}}, 'run': [...],
+    'cached': [...], 'skipped': [(lesson_id, причина)]}; в run и cached -
+    id уроков, примеры которых выполнялись сейчас или взяты из кэша.
+    Если хотя бы один пример завершился с ошибкой, бросает ValueError
+    со списком ошибок.
+    """
+    from .course import LESSONS_DATA
+
+    cache_path = os.path.join(root, EXAMPLES_CACHE_PATH)
+    cache = load_build_manifest(cache_path)
+
+    examples = {}
+    skipped = []
+    for lesson_id in lesson_ids:
+        content_html = generate_lesson_content(variant, lesson_id, LESSONS_DATA[lesson_id])
+        for code in editor_examples(content_html):
+            reason = skip_reason(code)
+            if reason:
+                skipped.append((lesson_id, reason))
+            else:
+                examples.setdefault(lesson_id, []).append(code)
+
+    # Каждый уникальный код выполняется один раз; процессы примеров
+    # ждут ввода-вывода, поэтому пулу хватает потоков
+    pending = sorted({code for codes in examples.values() for code in codes
+                      if example_key(code) not in cache})
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        results = dict(zip(pending, executor.map(run_example, pending)))
+
+    errors = []
+    outputs = {}
+    run = []
+    cached = []
+    for lesson_id, codes in examples.items():
+        (run if any(code in results for code in codes) else cached).append(lesson_id)
+        for code in codes:
+            result = results.get(code)
+            if result is None:
+                output = cache[example_key(code)]
+            elif 'error' in result:
+                errors.append(f"  {lesson_id}: {result['error']}")
+                continue
+            else:
+                output = cache[example_key(code)] = result['output']
+            outputs.setdefault(lesson_id, {})[code] = output
+
+    if pending:
+        save_build_manifest(cache, cache_path)
+    if errors:
+        raise ValueError("примеры кода не выполняются:\n" + '\n'.join(errors))
+
+    return {'outputs': outputs, 'run': run, 'cached': cached, 'skipped': skipped}
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Манифест инкрементальной сборки: хэш входных данных для каждого урока
+"""
+
+import os
+import json
+import hashlib
+
+from .output import write_file
+from .templates import SIDEBAR_VERSION, TEMPLATE_VERSION
+
+# Путь манифеста относительно корня сборки
+BUILD_MANIFEST_PATH = os.path.join('lessons', '.build-manifest.json')
+
+# Индекс курса прошлой сборки: по нему граф зависимостей определяет,
+# какие страницы затронуты изменением данных курса
+COURSE_SNAPSHOT_PATH = os.path.join('lessons', '.build-course.json')
+
+def text_digest(text):
+    """Хэш текста для входных данных урока: большие общие для всех уроков
+    тексты (навигация курса) хэшируются один раз на сборку, а не в каждом уроке"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def compute_lesson_hash(lesson_id, lesson_data, content_html, sidebar_digest, nav_src=None, minify=False,
+                        asset_urls=None, client_nav=False, search=False,
+                        critical_css=None):
+    """Хэш всех входных данных урока: запись LESSONS_DATA, контент, версия шаблона и навигация
+
+    Навигация страницы - навигация курса без отметок, в которой отмечен урок
+    lesson_id: учитываются её хэш sidebar_digest (см. text_digest) и версия
+    отметки SIDEBAR_VERSION. Если навигация вынесена в отдельный файл
+    (nav_src), страница от неё не зависит и учитывается только путь к этому
+    файлу. Включённая минификация
+    тоже меняет хэш, чтобы переключение режима пересобрало страницы, как и
+    имена CSS/JS с хэшем (asset_urls) при сборке с --fingerprint и
+    клиентская навигация (client_nav), добавляющая к странице фрагмент,
+    и поиск (search), добавляющий в навигацию поле поиска. Встроенный
+    критический CSS (critical_css) учитывается текстом: страница
+    пересобирается, когда меняются стили её первого экрана.
+    """
+    inputs = {
+        'lesson_id': lesson_id,
+        'data': lesson_data,
+        'content': content_html,
+        'template_version': TEMPLATE_VERSION,
+    }
+    if nav_src:
+        inputs['nav_src'] = nav_src
+    else:
+        inputs['sidebar'] = sidebar_digest
+        inputs['sidebar_version'] = SIDEBAR_VERSION
+    if minify:
+        inputs['minify'] = True
+    if asset_urls:
+        inputs['assets'] = asset_urls
+    if client_nav:
+        inputs['client_nav'] = True
+    if search:
+        inputs['search'] = True
+    if critical_css is not None:
+        inputs['critical_css'] = critical_css
+    inputs = json.dumps(inputs, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(inputs.encode('utf-8')).hexdigest()
+
+def load_build_manifest(path):
+    """Загружает манифест прошлой сборки (пустой, если его нет или он повреждён)
+
+    Используется и для индекса курса (COURSE_SNAPSHOT_PATH).
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+def save_build_manifest(manifest, path):
+    """Сохраняет манифест сборки"""
+    write_file(path, json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + '\n')
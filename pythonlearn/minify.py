@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Минификация HTML сгенерированных страниц
+
+Безопасная минификация без парсинга DOM:
+- содержимое <pre>, <textarea>, <script> и <style> не меняется (код примеров
+  зависит от пробелов), как и встроенный вывод примера (<div class="expected-output">,
+  см. examples.py): его переводы строк показывает white-space: pre-wrap;
+- комментарии удаляются (кроме условных <!--[if ...]>);
+- пробелы в тексте и внутри тегов схлопываются до одного, как это делает браузер;
+- пробелы рядом с блочными тегами и между элементами inline SVG удаляются.
+Пробел между строчными элементами (<strong>a</strong> <em>b</em>) сохраняется.
+"""
+
+import re
+
+# Токены: комментарий | блок с сырым содержимым | тег | текст
+TOKEN_RE = re.compile(
+    r'(?P<comment><!--.*?-->)'
+    r'|(?P<raw><(?P<raw_tag>pre|textarea|script|style)\b[^>]*>.*?</(?P=raw_tag)\s*>'
+    r'|<div\b[^>]*\bclass="expected-output"[^>]*>[^<]*</div>)'
+    r'|(?P<tag><[!/]?[a-zA-Z][^>]*>)'
+    r'|(?P<text>[^<]+|<)',
+    re.S | re.I,
+)
+
+TAG_NAME_RE = re.compile(r'<[!/]?([a-zA-Z][a-zA-Z0-9-]*)')
+
+# Пробелы внутри тега вне кавычек
+TAG_SPACE_RE = re.compile(r'("[^"]*"|\'[^\']*\')|\s+')
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Теги, рядом с которыми пробелы не влияют на отображение
+BLOCK_TAGS = {
+    '!doctype', 'html', 'head', 'body', 'title', 'meta', 'link', 'script', 'style', 'noscript',
+    'header', 'footer', 'main', 'nav', 'section', 'article', 'aside',
+    'div', 'p', 'ul', 'ol', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'br',
+    'pre', 'textarea', 'table', 'thead', 'tbody', 'tfoot', 'tr', 'td', 'th',
+    'svg',
+}
+
+# Элементы SVG, внутри которых текст отображается
+SVG_TEXT_TAGS = {'text', 'tspan', 'textpath', 'title', 'desc'}
+
+def minify_tag(tag):
+    """Схлопывает пробелы внутри тега, не трогая значения атрибутов"""
+    tag = TAG_SPACE_RE.sub(lambda m: m.group(1) or ' ', tag)
+    if tag.endswith(' />'):
+        tag = tag[:-3] + '/>'
+    elif tag.endswith(' >'):
+        tag = tag[:-2] + '>'
+    return tag
+
+def tokenize(html):
+    """Список (вид, текст, имя_тега) для каждого токена"""
+    tokens = []
+    for match in TOKEN_RE.finditer(html):
+        if match.group('comment') is not None:
+            kind = 'comment'
+        elif match.group('raw') is not None:
+            kind = 'raw'
+        elif match.group('tag') is not None:
+            kind = 'tag'
+        else:
+            kind = 'text'
+
+        value = match.group(0)
+        name = None
+        if kind in ('tag', 'raw'):
+            name = TAG_NAME_RE.match(value).group(1).lower()
+            if value.startswith('<!'):
+                name = '!' + name
+        tokens.append((kind, value, name))
+    return tokens
+
+def minify_html(html):
+    """Возвращает минифицированный HTML"""
+    tokens = []
+    for kind, value, name in tokenize(html):
+        if kind == 'comment':
+            if value.startswith('<!--[if'):
+                tokens.append(('raw', value, None))
+            continue
+        if kind == 'tag':
+            value = minify_tag(value)
+        elif kind == 'text':
+            value = WHITESPACE_RE.sub(' ', value)
+        tokens.append((kind, value, name))
+
+    # Соседние текстовые токены (после удаления комментариев) объединяем
+    merged = []
+    for token in tokens:
+        if token[0] == 'text' and merged and merged[-1][0] == 'text':
+            merged[-1] = ('text', WHITESPACE_RE.sub(' ', merged[-1][1] + token[1]), None)
+        else:
+            merged.append(token)
+
+    def is_block(token):
+        return token[0] in ('tag', 'raw') and token[2] in BLOCK_TAGS
+
+    out = []
+    svg_depth = 0
+    svg_text_depth = 0
+    for i, (kind, value, name) in enumerate(merged):
+        if kind == 'tag':
+            closing = value.startswith('</')
+            self_closing = value.endswith('/>')
+            if name == 'svg':
+                svg_depth += -1 if closing else (0 if self_closing else 1)
+            elif svg_depth and name in SVG_TEXT_TAGS:
+                svg_text_depth += -1 if closing else (0 if self_closing else 1)
+            out.append(value)
+            continue
+
+        if kind != 'text':
+            out.append(value)
+            continue
+
+        # Внутри SVG пробелы между элементами ничего не значат
+        if svg_depth and not svg_text_depth:
+            value = value.strip()
+        else:
+            if i == 0 or is_block(merged[i - 1]):
+                value = value.lstrip()
+            if i == len(merged) - 1 or is_block(merged[i + 1]):
+                value = value.rstrip()
+        if value:
+            out.append(value)
+
+    return ''.join(out)
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Service worker для работы курса без сети
+
+Сборка пишет в корень сайта sw.js со встроенным списком всех страниц и
+файлов сайта и хэшами их содержимого (тот же список - в precache-manifest.json).
+При установке service worker скачивает оболочку сайта: главную страницу,
+CSS, JS, общую навигацию и Skulpt целиком (без стандартной библиотеки
+интерпретатор офлайн не запустит код). Отложенные файлы - страницы и
+фрагменты уроков, поисковый индекс - скачиваются через Promise.allSettled:
+один файл, не скачавшийся на слабом Wi-Fi, не срывает установку. Докачку
+запускает main.js, когда браузер свободен, сообщением 'precache' на каждой
+загрузке страницы, поэтому недокачанное пробуется снова. Обработчик сообщения
+держит service worker живым (event.waitUntil), пока файлы не скачаются; в
+activate докачка не входит: пока активация не закончена, запросы страниц ждут.
+Ответы на запросы идут из кэша, поэтому посещённый курс открывается мгновенно
+и работает офлайн.
+
+Изменение любого файла меняет хэш в списке, а значит и байты sw.js: браузер
+в фоне устанавливает новую версию, и она скачивает только файлы с новыми
+хэшами, остальные переносятся из кэша как есть.
+"""
+
+import os
+import json
+import hashlib
+
+from .output import write_file
+
+SERVICE_WORKER_FILE = 'sw.js'
+PRECACHE_MANIFEST_FILE = 'precache-manifest.json'
+
+# Длина хэша файла в списке
+PRECACHE_HASH_LENGTH = 16
+
+SERVICE_WORKER_TEMPLATE = '''// Service worker курса "Python для школьников".
+// Сгенерирован сборкой (pythonlearn/offline.py), не редактируй вручную.
+const PRECACHE_MANIFEST = __PRECACHE_MANIFEST__;
+// Файлы, без которых сайт работает: докачиваются по сообщению страницы
+const DEFERRED_PATHS = new Set(__DEFERRED_PATHS__);
+const CACHE_NAME = 'pythonlearn-precache';
+
+function scopeUrl(path) {
+    return new URL(path, self.registration.scope).href;
+}
+
+// Ключ кэша содержит хэш файла: новая версия файла - новый ключ
+function cacheKey(path) {
+    return scopeUrl(path) + '?v=' + PRECACHE_MANIFEST[path];
+}
+
+function precachedPath(url) {
+    const scopePath = new URL(self.registration.scope).pathname;
+    if (url.origin !== self.location.origin || !url.pathname.startsWith(scopePath)) {
+        return null;
+    }
+    let path = url.pathname.slice(scopePath.length);
+    if (path === '' || path.endsWith('/')) {
+        path += 'index.html';
+    }
+    return Object.prototype.hasOwnProperty.call(PRECACHE_MANIFEST, path) ? path : null;
+}
+
+// Скачивает файл, если его с таким хэшем ещё нет в кэше
+function precacheFile(cache, path) {
+    const key = cacheKey(path);
+    return cache.match(key).then(function(cached) {
+        if (cached) return;
+        return fetch(scopeUrl(path), {cache: 'no-cache'}).then(function(response) {
+            if (!response.ok) {
+                throw new Error('Не удалось скачать ' + path + ': HTTP ' + response.status);
+            }
+            return cache.put(key, response);
+        });
+    });
+}
+
+// Отложенные файлы: каждый сам по себе, ошибки не прерывают остальные
+function precacheDeferred() {
+    return caches.open(CACHE_NAME).then(function(cache) {
+        return Promise.allSettled(Array.from(DEFERRED_PATHS).map(function(path) {
+            return precacheFile(cache, path);
+        }));
+    });
+}
+
+// Установка: оболочка сайта целиком, иначе офлайн-режим был бы неполным
+self.addEventListener('install', function(event) {
+    const shell = Object.keys(PRECACHE_MANIFEST).filter(function(path) {
+        return !DEFERRED_PATHS.has(path);
+    });
+    event.waitUntil(caches.open(CACHE_NAME).then(function(cache) {
+        return Promise.all(shell.map(function(path) {
+            return precacheFile(cache, path);
+        }));
+    }).then(function() {
+        return self.skipWaiting();
+    }));
+});
+
+// Активация: удаляем версии файлов, которых нет в текущем списке
+self.addEventListener('activate', function(event) {
+    const current = new Set(Object.keys(PRECACHE_MANIFEST).map(cacheKey));
+    event.waitUntil(caches.open(CACHE_NAME).then(function(cache) {
+        return cache.keys().then(function(requests) {
+            return Promise.all(requests
+                .filter(function(request) { return !current.has(request.url); })
+                .map(function(request) { return cache.delete(request); }));
+        });
+    }).then(function() {
+        return self.clients.claim();
+    }));
+});
+
+// Докачка отложенных файлов: страница просит о ней при каждой загрузке (см. main.js)
+self.addEventListener('message', function(event) {
+    if (event.data && event.data.type === 'precache') {
+        event.waitUntil(precacheDeferred());
+    }
+});
+
+// Файлы сайта - из кэша, остальные запросы идут в сеть как обычно
+self.addEventListener('fetch', function(event) {
+    if (event.request.method !== 'GET') return;
+
+    const path = precachedPath(new URL(event.request.url));
+    if (path === null) return;
+
+    event.respondWith(caches.open(CACHE_NAME).then(function(cache) {
+        return cache.match(cacheKey(path));
+    }).then(function(cached) {
+        return cached || fetch(event.request);
+    }));
+});
+'''
+
+def file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:PRECACHE_HASH_LENGTH]
+
+def precache_manifest(root, paths):
+    """Путь -> хэш содержимого для существующих в root файлов (в порядке paths)"""
+    manifest = {}
+    for path in paths:
+        full_path = os.path.join(root, path)
+        if os.path.isfile(full_path):
+            manifest[path] = file_hash(full_path)
+    return manifest
+
+def service_worker(manifest, deferred=()):
+    """Исходный код sw.js со встроенным списком файлов и списком отложенных"""
+    deferred = [path for path in manifest if path in set(deferred)]
+    return (SERVICE_WORKER_TEMPLATE
+            .replace('__PRECACHE_MANIFEST__', json.dumps(manifest, indent=4))
+            .replace('__DEFERRED_PATHS__', json.dumps(deferred, indent=4)))
+
+def emit_service_worker(root, paths, files=None, deferred=()):
+    """Пишет sw.js и precache-manifest.json; возвращает список файлов с хэшами
+
+    deferred - пути из paths, которые не входят в оболочку сайта и
+    докачиваются после установки service worker.
+    """
+    manifest = precache_manifest(root, paths)
+    write_file(os.path.join(root, PRECACHE_MANIFEST_FILE),
+               json.dumps(manifest, indent=2) + '\n', files, PRECACHE_MANIFEST_FILE)
+    write_file(os.path.join(root, SERVICE_WORKER_FILE), service_worker(manifest, deferred),
+               files, SERVICE_WORKER_FILE)
+    return manifest
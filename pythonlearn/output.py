@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Запись результатов сборки
+
+Файл перезаписывается, только если его содержимое действительно изменилось,
+и всегда атомарно: через временный файл в том же каталоге и os.replace().
+Неизменённые файлы сохраняют mtime, поэтому rsync и CDN не считают их новыми.
+"""
+
+import os
+import tempfile
+
+# Итог записи файла
+WRITE_STATUSES = ('new', 'rewritten', 'unchanged')
+
+# umask процесса читается один раз при импорте: os.umask() меняет его для всех
+# потоков, а replace_file вызывается из пула потоков (см. compress.py)
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+def new_write_report():
+    """Пустой отчёт: статус -> список путей"""
+    return {status: [] for status in WRITE_STATUSES}
+
+def write_file(path, data, report=None, report_name=None):
+    """Записывает data (str или bytes) в path, если содержимое отличается
+
+    Возвращает 'new', 'rewritten' или 'unchanged' и, если передан report,
+    добавляет в него report_name (по умолчанию path).
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+
+    try:
+        with open(path, 'rb') as f:
+            existing = f.read()
+    except FileNotFoundError:
+        existing = None
+
+    if existing == data:
+        status = 'unchanged'
+    else:
+        status = 'new' if existing is None else 'rewritten'
+        replace_file(path, data)
+
+    if report is not None:
+        report[status].append(report_name or path)
+    return status
+
+def replace_file(path, data):
+    """Атомарно заменяет содержимое файла: читатели видят либо старую, либо новую версию"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+
+    # Права существующего файла сохраняем, новые - как у open() с учётом umask
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o666 & ~UMASK
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
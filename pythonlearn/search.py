@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Поисковый индекс курса
+
+Сборка извлекает из каждого урока заголовок, подзаголовки, код и текст и
+строит обратный индекс: нормализованное слово -> уроки с весом. Индекс
+разбит на части по первым SHARD_LENGTH буквам слова: main.js по запросу
+скачивает search/meta.json (список уроков и правила нормализации) и только
+те части, с которых начинаются слова запроса, и ищет без сервера и без
+загрузки страниц уроков. Последнее слово запроса ищется как префикс.
+
+Нормализация учитывает русский язык: регистр и ё не различаются, служебные
+слова (STOPWORDS) не индексируются, у русских слов отбрасываются окончания
+(ENDINGS), чтобы "словари", "словарей" и "словарь" были одним словом. Правила
+записываются в meta.json, и main.js применяет к запросу те же самые.
+"""
+
+import os
+import re
+import json
+from html.parser import HTMLParser
+
+from .compress import source_name
+from .output import write_file
+
+SEARCH_DIR = 'search'
+SEARCH_META_FILE = 'meta.json'
+
+# Версия формата индекса (проверяется в main.js)
+SEARCH_INDEX_VERSION = 1
+
+# Части индекса - по первым буквам слова; более короткие слова не индексируются
+SHARD_LENGTH = 2
+
+# Вес слова в зависимости от того, где оно встретилось в уроке
+FIELD_WEIGHTS = {'title': 8, 'heading': 4, 'code': 2, 'text': 1}
+
+# Окончания русских слов; отбрасывается самое длинное подходящее, если от
+# слова остаётся не меньше MIN_STEM букв
+ENDINGS = sorted({
+    'иями', 'ями', 'ами', 'иям', 'ием', 'иях', 'ией', 'ого', 'его', 'ому', 'ему',
+    'ыми', 'ими', 'ать', 'ять', 'ить', 'еть', 'ешь', 'ете', 'ишь', 'ите', 'ует', 'уют',
+    'ает', 'яет', 'ют', 'ут', 'ет', 'ит', 'ат', 'ят', 'ия', 'ие', 'ий', 'ии', 'ию',
+    'ой', 'ый', 'ая', 'яя', 'ое', 'ее', 'ые', 'ых', 'их', 'ым', 'им', 'ом', 'ем',
+    'ам', 'ям', 'ах', 'ях', 'ов', 'ев', 'ей', 'ою', 'ею', 'ью', 'ья', 'ье',
+    'а', 'я', 'о', 'е', 'ы', 'и', 'у', 'ю', 'ь', 'й',
+}, key=lambda ending: (-len(ending), ending))
+MIN_STEM = 3
+
+STOPWORDS = sorted({
+    'и', 'в', 'во', 'на', 'с', 'со', 'по', 'для', 'это', 'как', 'что', 'не', 'из', 'к',
+    'ко', 'о', 'об', 'у', 'а', 'но', 'или', 'то', 'же', 'так', 'ты', 'мы', 'вы', 'он',
+    'она', 'они', 'его', 'ее', 'их', 'от', 'до', 'за', 'при', 'все', 'всё', 'бы', 'ли',
+})
+
+WORD_PATTERN = re.compile(r'[0-9a-zа-яё_]+')
+CYRILLIC_PATTERN = re.compile(r'[а-я]')
+
+def normalize_word(word):
+    """Слово в форме индекса: без окончания (для русских слов) и с е вместо ё"""
+    word = word.replace('ё', 'е')
+    if CYRILLIC_PATTERN.search(word):
+        for ending in ENDINGS:
+            if word.endswith(ending) and len(word) - len(ending) >= MIN_STEM:
+                return word[:-len(ending)]
+    return word
+
+def tokenize(text):
+    """Нормализованные слова текста без служебных и слишком коротких"""
+    return [normalize_word(word) for word in WORD_PATTERN.findall(text.lower())
+            if word not in STOPWORDS and len(word) >= SHARD_LENGTH]
+
+class LessonTextParser(HTMLParser):
+    """Текст контента урока по полям: 'heading', 'code' и 'text'"""
+
+    FIELD_TAGS = {
+        'h1': 'heading', 'h2': 'heading', 'h3': 'heading', 'h4': 'heading',
+        'pre': 'code', 'code': 'code', 'textarea': 'code',
+    }
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.fields = []
+        self.texts = {'heading': [], 'code': [], 'text': []}
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.FIELD_TAGS:
+            self.fields.append(self.FIELD_TAGS[tag])
+
+    def handle_endtag(self, tag):
+        if tag in self.FIELD_TAGS and self.fields:
+            self.fields.pop()
+
+    def handle_data(self, data):
+        self.texts[self.fields[-1] if self.fields else 'text'].append(data)
+
+def lesson_terms(title, content_html):
+    """Слово -> вес в уроке"""
+    parser = LessonTextParser()
+    parser.feed(content_html)
+    parser.close()
+
+    texts = dict(parser.texts, title=[title])
+    terms = {}
+    for field, parts in texts.items():
+        for term in tokenize(' '.join(parts)):
+            terms[term] = terms.get(term, 0) + FIELD_WEIGHTS[field]
+    return terms
+
+def shard_file(key):
+    """Имя файла части индекса: коды букв, чтобы не было кириллицы в URL"""
+    return '-'.join(f'{ord(char):x}' for char in key) + '.json'
+
+def build_search_index(lessons):
+    """Индекс по урокам [(id, заголовок, модуль, html контента)] в порядке курса
+
+    Возвращает (meta, shards): содержимое meta.json и ключ части -> {слово: [урок, вес, ...]}.
+    Уроки в частях обозначены номерами в списке meta['docs'].
+    """
+    docs = []
+    shards = {}
+    for number, (lesson_id, title, module, content_html) in enumerate(lessons):
+        docs.append([lesson_id, title, module])
+        for term, weight in lesson_terms(title, content_html).items():
+            shards.setdefault(term[:SHARD_LENGTH], {}).setdefault(term, []).extend((number, weight))
+
+    shards = {key: dict(sorted(terms.items())) for key, terms in sorted(shards.items())}
+    meta = {
+        'version': SEARCH_INDEX_VERSION,
+        'shard_length': SHARD_LENGTH,
+        'min_stem': MIN_STEM,
+        'endings': ENDINGS,
+        'stopwords': STOPWORDS,
+        'docs': docs,
+        'shards': {key: shard_file(key) for key in shards},
+    }
+    return meta, shards
+
+def compact_json(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+def emit_search_index(root, lessons, files=None):
+    """Пишет search/meta.json и части индекса, удаляя устаревшие части
+    вместе с их сжатыми копиями (.gz, .br)
+
+    Возвращает пути записанных файлов относительно root.
+    """
+    meta, shards = build_search_index(lessons)
+    directory = os.path.join(root, SEARCH_DIR)
+    os.makedirs(directory, exist_ok=True)
+
+    paths = [f'{SEARCH_DIR}/{SEARCH_META_FILE}']
+    write_file(os.path.join(directory, SEARCH_META_FILE), compact_json(meta), files, paths[0])
+    for key, terms in shards.items():
+        path = f'{SEARCH_DIR}/{meta["shards"][key]}'
+        write_file(os.path.join(root, path), compact_json(terms), files, path)
+        paths.append(path)
+
+    current = set(meta['shards'].values()) | {SEARCH_META_FILE}
+    for name in os.listdir(directory):
+        base = source_name(name)
+        if base.endswith('.json') and base not in current:
+            os.remove(os.path.join(directory, name))
+    return paths
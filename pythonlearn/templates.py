@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+HTML-шаблоны уроков: страница, sidebar и общие фрагменты
+"""
+
+import json
+import string
+import functools
+
+from .course import DEFAULT_STEP_LIMIT, DEFAULT_TIME_LIMIT, load_course
+from .critical import stylesheet_links
+
+# Версия шаблона create_lesson_html. Увеличивай при любом изменении разметки
+# шаблона, чтобы инкрементальная сборка пересоздала все страницы
+TEMPLATE_VERSION = 6
+
+# Разметка одного модуля в навигации. Модули и ссылки помечены номером модуля
+# и id урока, чтобы main.js находил нужный элемент без перебора ссылок
+SIDEBAR_GROUP_TEMPLATE = '''
+        <div class="lesson-group{group_class}" data-module="{module}">
+            <div class="lesson-group-header">
+                <h3>{title}</h3>
+                <span class="toggle-icon">▼</span>
+            </div>
+            <ul>
+{links}
+            </ul>
+        </div>'''
+
+SIDEBAR_LINK_TEMPLATE = ('                <li><a href="{lesson_id}.html" data-lesson-id="{lesson_id}" '
+                         'data-module="{module}"{link_attrs}>{nav_title}</a></li>')
+
+# Версия отметки текущего урока в навигации (mark_sidebar). Увеличивай при
+# её изменении: разметка навигации без отметки учитывается в хэше урока целиком
+SIDEBAR_VERSION = 1
+
+# Места в разметке навигации, где отмечаются свёрнутый модуль и текущий урок.
+# Символы не встречаются в данных курса
+GROUP_MARK = '\x00'
+LINK_MARK = '\x01'
+GROUP_COLLAPSED = ' collapsed'
+LINK_ACTIVE = ' class="active"'
+
+def sidebar_markup(course):
+    """Навигация по модулям курса из индекса compile_course() с метками GROUP_MARK и LINK_MARK"""
+    groups = []
+    for index, module in enumerate(course['modules']):
+        links = '\n'.join(
+            SIDEBAR_LINK_TEMPLATE.format(lesson_id=lesson_id, module=index, link_attrs=LINK_MARK,
+                                         nav_title=course['lessons'][lesson_id]['nav_title'])
+            for lesson_id in module['lessons']
+        )
+        groups.append(SIDEBAR_GROUP_TEMPLATE.format(title=module['title'], group_class=GROUP_MARK,
+                                                    module=index, links=links))
+    return '\n'.join(groups)
+
+def compile_sidebar(course):
+    """Навигация, заготовленная для отметки текущего урока за константное число склеек
+
+    Возвращает (html, groups, links): разметку со свёрнутыми модулями и без
+    текущего урока, модуль -> (начало, конец) класса GROUP_COLLAPSED в ней и
+    id урока -> (позиция для LINK_ACTIVE, модуль урока).
+    """
+    pieces = sidebar_markup(course).split(GROUP_MARK)
+    html = [pieces[0]]
+    position = len(pieces[0])
+    groups = {}
+    links = {}
+    for index, (module, piece) in enumerate(zip(course['modules'], pieces[1:])):
+        groups[index] = (position, position + len(GROUP_COLLAPSED))
+        html.append(GROUP_COLLAPSED)
+        position += len(GROUP_COLLAPSED)
+        link_pieces = piece.split(LINK_MARK)
+        for lesson_id, link_piece in zip(module['lessons'], link_pieces):
+            position += len(link_piece)
+            links[lesson_id] = (position, index)
+        html.append(''.join(link_pieces))
+        position += len(link_pieces[-1])
+    return ''.join(html), groups, links
+
+def mark_sidebar(compiled, active_id):
+    """Навигация урока: ссылка на него отмечена как текущая, свёрнуты все модули, кроме его"""
+    html, groups, links = compiled
+    link_position, module = links[active_id]
+    group_start, group_end = groups[module]
+    return html[:group_start] + html[group_end:link_position] + LINK_ACTIVE + html[link_position:]
+
+def render_sidebar(course, active_id=None):
+    """Навигация по модулям курса из индекса compile_course()
+
+    С active_id ссылка на урок отмечена как текущая, а свёрнуты все модули,
+    кроме модуля этого урока. Без него модули не свёрнуты: это решает main.js.
+    Для многих уроков одного курса дешевле compile_sidebar() и mark_sidebar().
+    """
+    if active_id is not None:
+        return mark_sidebar(compile_sidebar(course), active_id)
+    return sidebar_markup(course).replace(GROUP_MARK, '').replace(LINK_MARK, '')
+
+# Полная структура навигации для sidebar (общая для всех страниц)
+@functools.lru_cache(maxsize=None)
+def generate_complete_sidebar():
+    return render_sidebar(load_course())
+
+# Навигация курса, заготовленная один раз на процесс сборки
+@functools.lru_cache(maxsize=None)
+def compiled_course_sidebar():
+    return compile_sidebar(load_course())
+
+# Навигация на странице урока: с текущим уроком и развёрнутым модулем
+def lesson_sidebar(lesson_id):
+    return mark_sidebar(compiled_course_sidebar(), lesson_id)
+
+# SVG маркер для стрелок в блок-схемах
+SVG_ARROW_MARKER = '''<marker id="arrowhead" markerWidth="10" markerHeight="10" refX="9" refY="3" orient="auto">
+                                <polygon points="0,0 0,6 9,3" fill="#1e293b"/>
+                            </marker>'''
+
+def get_svg_arrow_marker():
+    return SVG_ARROW_MARKER
+
+# Файл с общей навигацией курса (режим сборки --nav external)
+NAV_FRAGMENT_FILE = 'nav.html'
+
+# Фрагмент урока для клиентской навигации (режим сборки --client-nav):
+# lessons/<id>.json рядом со страницей урока
+LESSON_FRAGMENT_SUFFIX = '.json'
+
+# Пути к CSS и JS относительно корня сайта (при сборке с --fingerprint - с хэшем в имени)
+DEFAULT_ASSET_URLS = {'css/style.css': 'css/style.css', 'js/main.js': 'js/main.js'}
+
+# Базовый шаблон HTML. {nav_attrs}, {body_attrs}, {stylesheet_links} и {main_script}
+# подставляются один раз при компиляции, остальные поля - слоты, которые
+# заполняются для каждой страницы. {sidebar} - слот, потому что в нём
+# отмечен текущий урок, кроме режима nav_src, где навигации в странице нет
+LESSON_PAGE_TEMPLATE = '''<!DOCTYPE html>
+<html lang="ru">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title} - Python для школьников</title>
+    {stylesheet_links}
+</head>
+<body data-lesson-id="{lesson_id}" data-time-limit="{time_limit}" data-step-limit="{step_limit}"{body_attrs}>
+    <header>
+        <div class="container">
+            <h1>🐍 Python для школьников</h1>
+            <button class="menu-toggle" id="menuToggle">☰</button>
+        </div>
+    </header>
+
+    <nav id="sidebar" class="sidebar"{nav_attrs}>
+        <div class="sidebar-header">
+            <h2>Содержание курса</h2>
+            <button class="close-btn" id="closeBtn">×</button>
+        </div>
+        {sidebar}
+    </nav>
+
+    <main class="container">
+        <div class="lesson-container">
+            <div class="lesson-header">
+                <h1>{title}</h1>
+                <div class="lesson-meta">{module} • {duration}</div>
+            </div>
+
+            <div class="lesson-content">
+{content_html}
+            </div>
+
+            <div class="lesson-nav">
+                <a href="{prev_lesson}">← Предыдущий урок</a>
+                <button class="btn-primary" id="mark-complete">Отметить как пройденное</button>
+                <a href="{next_lesson}">Следующий урок →</a>
+            </div>
+        </div>
+    </main>
+
+    <footer>
+        <div class="container">
+            <p>Python для школьников © 2024</p>
+        </div>
+    </footer>
+
+    <script src="../{main_script}"></script>
+</body>
+</html>'''
+
+def compile_template(template, **fixed):
+    """Компилирует шаблон: fixed подставляются сразу, остальные поля становятся слотами
+
+    Возвращает (static, slots): неизменяемые куски разметки и имена слотов между ними,
+    len(static) == len(slots) + 1.
+    """
+    static = ['']
+    slots = []
+    for literal, field, _, _ in string.Formatter().parse(template):
+        static[-1] += literal
+        if field is None:
+            continue
+        if field in fixed:
+            static[-1] += fixed[field]
+        else:
+            slots.append(field)
+            static.append('')
+    return tuple(static), tuple(slots)
+
+def render_template(compiled, **values):
+    """Заполняет слоты скомпилированного шаблона"""
+    static, slots = compiled
+    parts = [static[0]]
+    for field, chunk in zip(slots, static[1:]):
+        parts.append(str(values[field]))
+        parts.append(chunk)
+    return ''.join(parts)
+
+@functools.lru_cache(maxsize=8)
+def compile_lesson_template(nav_src=None, assets=None, client_nav=False, search=False, critical_css=None):
+    """Шаблон страницы урока (компилируется один раз на сборку)
+
+    Если задан nav_src, навигация не встраивается в страницу: main.js загружает
+    её из этого файла, общего для всех уроков. assets - пары (файл, путь к нему)
+    поверх DEFAULT_ASSET_URLS. client_nav включает на странице клиентскую
+    навигацию по фрагментам уроков, search - поиск по индексу курса.
+    critical_css встраивается в <head>, а таблица стилей загружается без
+    блокировки отрисовки (см. critical.py).
+    """
+    asset_urls = dict(DEFAULT_ASSET_URLS, **dict(assets or ()))
+    fixed = {
+        'stylesheet_links': stylesheet_links('../' + asset_urls['css/style.css'], critical_css),
+        'main_script': asset_urls['js/main.js'],
+        'body_attrs': (' data-client-nav' if client_nav else '') + (' data-search' if search else ''),
+    }
+    if nav_src:
+        return compile_template(LESSON_PAGE_TEMPLATE, sidebar='', nav_attrs=f' data-nav-src="{nav_src}"', **fixed)
+    return compile_template(LESSON_PAGE_TEMPLATE, nav_attrs='', **fixed)
+
+def create_lesson_html(lesson_id, title, module, duration, content_html, prev_lesson, next_lesson,
+                       sidebar=None, nav_src=None, asset_urls=None,
+                       time_limit=DEFAULT_TIME_LIMIT, step_limit=DEFAULT_STEP_LIMIT, client_nav=False,
+                       search=False, critical_css=None):
+    if sidebar is None and not nav_src:
+        sidebar = lesson_sidebar(lesson_id)
+    assets = tuple(sorted(asset_urls.items())) if asset_urls else None
+
+    return render_template(
+        compile_lesson_template(nav_src, assets, client_nav, search, critical_css),
+        sidebar=sidebar,
+        lesson_id=lesson_id,
+        title=title,
+        module=module,
+        duration=duration,
+        content_html=content_html,
+        prev_lesson=prev_lesson,
+        next_lesson=next_lesson,
+        time_limit=time_limit,
+        step_limit=step_limit,
+    )
+
+def create_lesson_fragment(lesson_id, title, module, duration, content_html, prev_lesson, next_lesson,
+                           time_limit=DEFAULT_TIME_LIMIT, step_limit=DEFAULT_STEP_LIMIT):
+    """Фрагмент урока для клиентской навигации: всё, чем страницы уроков отличаются"""
+    return json.dumps({
+        'id': lesson_id,
+        'title': title,
+        'module': module,
+        'duration': duration,
+        'content': content_html,
+        'prev': prev_lesson,
+        'next': next_lesson,
+        'time_limit': time_limit,
+        'step_limit': step_limit,
+    }, ensure_ascii=False, separators=(',', ':'))
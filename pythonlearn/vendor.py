@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Локальная копия Skulpt (Python-интерпретатора для браузера)
+
+python -m pythonlearn vendor один раз скачивает файлы Skulpt в js/vendor/,
+после чего сайт не зависит от CDN: страницы работают в классах за
+строгим прокси и без интернета. main.js подгружает интерпретатор по
+требованию, при первом запуске кода, из каталога рядом с собой.
+Версия входит в путь каталога, поэтому файлы можно кэшировать навсегда.
+"""
+
+import os
+
+from .output import write_file
+
+SKULPT_VERSION = '1.2.0'
+
+# Порядок важен: stdlib регистрирует модули в уже созданном объекте Sk
+SKULPT_FILES = ['skulpt.min.js', 'skulpt-stdlib.js']
+
+SKULPT_DIR = f'js/vendor/skulpt-{SKULPT_VERSION}'
+SKULPT_CDN_URL = f'https://cdn.jsdelivr.net/npm/skulpt@{SKULPT_VERSION}/dist/'
+
+def skulpt_paths():
+    """Пути файлов Skulpt относительно корня сайта"""
+    return [f'{SKULPT_DIR}/{name}' for name in SKULPT_FILES]
+
+def is_vendored(root):
+    return all(os.path.isfile(os.path.join(root, path)) for path in skulpt_paths())
+
+def download(url, timeout=60):
+    # urllib.request импортируется долго, а нужен только команде vendor
+    import urllib.request
+
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        data = response.read()
+    if not data:
+        raise OSError(f"пустой ответ: {url}")
+    return data
+
+def vendor_skulpt(root, force=False):
+    """Скачивает отсутствующие файлы Skulpt в root/js/vendor
+
+    Возвращает список скачанных путей относительно root.
+    """
+    downloaded = []
+    for name, path in zip(SKULPT_FILES, skulpt_paths()):
+        target = os.path.join(root, path)
+        if os.path.isfile(target) and not force:
+            continue
+        write_file(target, download(SKULPT_CDN_URL + name))
+        downloaded.append(path)
+    return downloaded
+
+def emit_vendor(source_root, root, files=None):
+    """Переносит скачанный Skulpt в корень сайта
+
+    Возвращает пути перенесённых файлов или [], если Skulpt не скачан:
+    тогда main.js загрузит его с CDN.
+    """
+    if not is_vendored(source_root):
+        return []
+    if os.path.abspath(source_root) != os.path.abspath(root):
+        for path in skulpt_paths():
+            with open(os.path.join(source_root, path), 'rb') as f:
+                write_file(os.path.join(root, path), f.read(), files, path)
+    return skulpt_paths()
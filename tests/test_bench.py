@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Замеры сборки: масштабирование курса и сравнение с эталоном
+"""
+
+from pythonlearn.bench import (SHORT_STAGES, compare_results, sample_lessons, scaled_course,
+                               source_lesson_id)
+from pythonlearn.course import COURSE, compile_course
+
+def result(stages, size=1000):
+    return {'scales': {'1': {'lessons': 85, 'sampled': 85, 'stages': stages, 'bytes': size}}}
+
+def test_scaled_course_has_unique_lesson_ids():
+    order = compile_course(scaled_course(3))['order']
+    assert len(order) == len(set(order)) == 3 * len(compile_course(COURSE)['order'])
+    assert {source_lesson_id(lesson_id) for lesson_id in order} == set(compile_course(COURSE)['order'])
+
+def test_sample_keeps_order_and_size():
+    order = list(range(1000))
+    sample = sample_lessons(order, 100)
+    assert len(sample) == 100 and sample == sorted(sample)
+    assert sample_lessons(order[:10], 100) == order[:10]
+
+def test_long_stage_regression():
+    regressions = compare_results(result({'build': 1.5}), result({'build': 1.0}))
+    assert len(regressions) == 1 and 'build' in regressions[0]
+
+def test_short_stages_are_compared_by_sum():
+    baseline = result({'sidebar': 0.01, 'manifest_hash': 0.01})
+    # Каждый этап по отдельности не сравнивается, а сумма выросла вдвое
+    regressions = compare_results(result({'sidebar': 0.02, 'manifest_hash': 0.02}), baseline)
+    assert len(regressions) == 1 and SHORT_STAGES in regressions[0]
+    assert compare_results(result({'sidebar': 0.011, 'manifest_hash': 0.011}), baseline) == []
+
+def test_page_size_growth():
+    regressions = compare_results(result({}, size=1100), result({}, size=1000))
+    assert len(regressions) == 1
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Бюджеты страниц: измерения, бюджеты модулей и отчёт по страницам
+"""
+
+from pythonlearn.budget import (DEFAULT_BUDGET, MODULE_BUDGETS, check_budgets,
+                                format_budget_report, measure_page, page_budget)
+from pythonlearn.course import LESSONS_DATA
+
+SVG = '<svg>' + '<rect/>' * 300 + '</svg>'
+PAGE = ('<html><head><link rel="stylesheet" href="a.css"><script src="b.js" defer></script>'
+        '<noscript><link rel="stylesheet" href="c.css"></noscript></head>'
+        '<body><p>текст</p>{}</body></html>')
+
+def test_measure_page_counts_blocking_and_inline_blocks():
+    metrics = measure_page(PAGE.format(SVG))
+    assert metrics['blocking_resources'] == ['a.css']
+    assert metrics['inline_count'] == 1
+    assert metrics['largest_inline'] == len(SVG)
+
+def test_module_budgets_name_course_modules():
+    modules = {lesson_data['module'] for lesson_data in LESSONS_DATA.values()}
+    assert set(MODULE_BUDGETS) <= modules
+    module = next(iter(MODULE_BUDGETS))
+    assert page_budget('x', module)['largest_inline'] > DEFAULT_BUDGET['largest_inline']
+
+def test_diagram_allowed_only_in_diagram_modules(tmp_path):
+    (tmp_path / 'page.html').write_text(PAGE.format(SVG), encoding='utf-8')
+    module = next(iter(MODULE_BUDGETS))
+    assert check_budgets(str(tmp_path), [('page.html', 'page', module)])['violations'] == []
+    violations = check_budgets(str(tmp_path), [('page.html', 'page', None)])['violations']
+    assert [violation[1] for violation in violations] == ['largest_inline']
+
+def test_report_has_row_per_page():
+    pages = {'index.html': measure_page(PAGE.format('')), 'lessons/a.html': measure_page(PAGE.format(SVG))}
+    lines = format_budget_report(pages).splitlines()
+    assert len(lines) == 3
+    assert lines[2].split()[:2] == ['lessons/a.html', str(len(PAGE.format(SVG).encode('utf-8')))]
+    assert lines[2].endswith('a.css')
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Инкрементальная сборка: пересобираются только уроки с изменившимися входными данными
+"""
+
+import os
+
+from pythonlearn.build import build
+from pythonlearn.course import LESSONS_DATA
+from pythonlearn.manifest import BUILD_MANIFEST_PATH, compute_lesson_hash, load_build_manifest
+
+LESSONS = ['algo-01', 'python-01', 'oge-01']
+
+def test_noop_rebuild_skips_everything(tmp_path):
+    root = str(tmp_path)
+    first = build(root=root, lesson_ids=LESSONS)
+    assert first['written'] == LESSONS
+    second = build(root=root, lesson_ids=LESSONS)
+    assert second['written'] == [] and second['skipped'] == LESSONS
+    assert set(load_build_manifest(os.path.join(root, BUILD_MANIFEST_PATH))) == set(LESSONS)
+
+def test_deleted_page_and_option_change_rebuild(tmp_path):
+    root = str(tmp_path)
+    build(root=root, lesson_ids=LESSONS)
+    os.remove(os.path.join(root, 'lessons', 'python-01.html'))
+    assert build(root=root, lesson_ids=LESSONS)['written'] == ['python-01']
+    # Минификация меняет входные данные всех страниц
+    assert build(root=root, lesson_ids=LESSONS, minify=True)['written'] == LESSONS
+    assert build(root=root, lesson_ids=LESSONS, force=True, minify=True)['written'] == LESSONS
+
+def test_lesson_hash_depends_on_inputs():
+    lesson = LESSONS_DATA['python-01']
+    base = compute_lesson_hash('python-01', lesson, '<p>a</p>', 'nav')
+    assert base == compute_lesson_hash('python-01', lesson, '<p>a</p>', 'nav')
+    assert base != compute_lesson_hash('python-01', lesson, '<p>b</p>', 'nav')
+    assert base != compute_lesson_hash('python-01', lesson, '<p>a</p>', 'nav2')
+    assert base != compute_lesson_hash('python-01', dict(lesson, title='x'), '<p>a</p>', 'nav')
+
+def test_parallel_build_matches_serial(tmp_path):
+    serial, parallel = tmp_path / 'serial', tmp_path / 'parallel'
+    lessons = list(LESSONS_DATA)[:12]
+    build(root=str(serial), lesson_ids=lessons, jobs=1)
+    result = build(root=str(parallel), lesson_ids=lessons, jobs=3)
+    # Результаты собираются в порядке курса независимо от числа процессов
+    assert result['written'] == lessons
+    for lesson_id in lessons:
+        name = os.path.join('lessons', f'{lesson_id}.html')
+        assert (parallel / name).read_bytes() == (serial / name).read_bytes()
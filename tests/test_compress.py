@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Сжатые копии артефактов: .gz (и .br, если установлен brotli) обновляются только для изменившихся файлов
+"""
+
+import os
+import gzip
+
+from pythonlearn.compress import GZIP_SUFFIX, brotli, compress_files, source_name
+
+def test_compressed_copies_follow_source(tmp_path):
+    root = str(tmp_path)
+    (tmp_path / 'a.html').write_text('<p>' + 'урок ' * 200 + '</p>', encoding='utf-8')
+    (tmp_path / 'b.css').write_text('p{color:red}' * 50, encoding='utf-8')
+
+    written = compress_files(root, ['a.html', 'b.css', 'missing.js'], jobs=2)
+    expected = {'a.html.gz', 'b.css.gz'}
+    if brotli is not None:
+        expected |= {'a.html.br', 'b.css.br'}
+    assert set(written) == expected
+    with gzip.open(tmp_path / 'a.html.gz') as f:
+        assert f.read() == (tmp_path / 'a.html').read_bytes()
+
+    # Неизменённые файлы повторно не сжимаются
+    assert compress_files(root, ['a.html', 'b.css']) == []
+    (tmp_path / 'b.css').write_text('p{color:blue}', encoding='utf-8')
+    os.utime(tmp_path / 'b.css.gz', ns=(0, 0))
+    assert 'b.css.gz' in compress_files(root, ['a.html', 'b.css'])
+
+def test_source_name():
+    assert source_name('search/31-30.json' + GZIP_SUFFIX) == 'search/31-30.json'
+    assert source_name('css/style.css.br') == 'css/style.css'
+    assert source_name('index.html') == 'index.html'
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Индекс курса и граф зависимостей: изменение поля урока затрагивает только читающие его артефакты
+"""
+
+import copy
+
+import pytest
+
+from pythonlearn.course import (COURSE, COURSE_END, COURSE_START, NAV_ARTIFACT, affected_artifacts,
+                                compile_course, lesson_artifact)
+
+def edited(change):
+    course = copy.deepcopy(COURSE)
+    change(course)
+    return compile_course(course)
+
+def test_prev_next_follow_course_order():
+    index = compile_course()
+    order = index['order']
+    assert index['lessons'][order[0]]['prev'] == COURSE_START
+    assert index['lessons'][order[-1]]['next'] == COURSE_END
+    assert index['lessons'][order[1]]['prev'] == f'{order[0]}.html'
+
+def test_duplicate_lesson_is_rejected():
+    course = copy.deepcopy(COURSE)
+    course[0]['lessons'].append(dict(course[0]['lessons'][0]))
+    with pytest.raises(ValueError):
+        compile_course(course)
+
+def test_title_change_affects_only_its_page():
+    old = compile_course()
+    lesson_id = old['order'][3]
+    new = edited(lambda course: course[0]['lessons'][3].update(title='Новый заголовок'))
+    assert affected_artifacts(old, new) == {lesson_artifact(lesson_id)}
+
+def test_nav_title_change_affects_navigation():
+    old = compile_course()
+    new = edited(lambda course: course[0]['lessons'][0].update(nav_title='Новое'))
+    assert affected_artifacts(old, new, nav='external') == {NAV_ARTIFACT}
+    assert affected_artifacts(old, new) == {lesson_artifact(lesson_id) for lesson_id in new['order']}
+
+def test_removed_lesson_affects_neighbours():
+    old = compile_course()
+    removed = old['order'][2]
+    new = edited(lambda course: course[0]['lessons'].pop(2))
+    affected = affected_artifacts(old, new, nav='external')
+    assert affected == {NAV_ARTIFACT, lesson_artifact(old['order'][1]), lesson_artifact(old['order'][3])}
+    assert lesson_artifact(removed) not in affected
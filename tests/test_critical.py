@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Критический CSS: в первый экран не попадают стили тестов и редакторов кода
+"""
+
+import os
+import re
+
+import pytest
+
+from pythonlearn.assets import INDEX_SOURCE
+from pythonlearn.build import DEFAULT_ROOT, build, lesson_critical_css
+from pythonlearn.content import DEFAULT_VARIANT, generate_lesson_content
+from pythonlearn.course import LESSONS_DATA
+from pythonlearn.critical import INDEX_FOLD_CONTAINER, critical_css
+
+# Классы разметки тестов и редакторов кода в уроках
+DEFERRED_SELECTORS = ['quiz-container', 'question', 'options', 'check-answer-btn',
+                      'python-editor', 'editor-header', 'run-btn', 'code-editor',
+                      'output-container']
+
+def used_classes(css):
+    return set(re.findall(r'\.([\w-]+)', css))
+
+@pytest.fixture(scope='module')
+def contents():
+    return {lesson_id: generate_lesson_content(DEFAULT_VARIANT, lesson_id, lesson_data)
+            for lesson_id, lesson_data in LESSONS_DATA.items()}
+
+@pytest.mark.parametrize('search', [False, True], ids=['plain', 'search'])
+def test_lesson_critical_css_skips_quiz_and_editor(contents, search):
+    classes = used_classes(lesson_critical_css(contents, search))
+    assert 'lesson-content' in classes
+    assert classes.isdisjoint(DEFERRED_SELECTORS)
+
+def test_lesson_critical_css_is_shared_by_lesson_types(contents):
+    # Один CSS на все уроки годится, только пока первые экраны типов не различаются
+    by_type = {}
+    for lesson_id, content_html in contents.items():
+        by_type.setdefault(LESSONS_DATA[lesson_id]['type'], {})[lesson_id] = content_html
+    assert len(by_type) > 1
+    assert {lesson_critical_css(type_contents) for type_contents in by_type.values()} == {
+        lesson_critical_css(contents)}
+
+def test_build_inlines_one_critical_css(tmp_path):
+    result = build(root=str(tmp_path), lesson_ids=['algo-01', 'python-01'], critical_css=True)
+    styles = set()
+    for lesson_id in ('algo-01', 'python-01'):
+        page = (tmp_path / 'lessons' / f'{lesson_id}.html').read_text(encoding='utf-8')
+        styles.update(re.findall(r'<style data-critical>(.*?)</style>', page, re.S))
+    assert styles == {result['critical_css']}
+
+def test_index_critical_css_skips_quiz_and_editor():
+    with open(os.path.join(DEFAULT_ROOT, 'css', 'style.css'), encoding='utf-8') as f:
+        css = f.read()
+    with open(os.path.join(DEFAULT_ROOT, INDEX_SOURCE), encoding='utf-8') as f:
+        html = f.read()
+    classes = used_classes(critical_css(css, html, INDEX_FOLD_CONTAINER))
+    assert classes.isdisjoint(DEFERRED_SELECTORS)
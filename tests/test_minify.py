@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+Минификация: пробелы схлопываются только там, где браузер их не показывает
+"""
+
+import os
+import re
+
+from pythonlearn.build import build
+from pythonlearn.minify import minify_html
+
+def test_minify_collapses_text_but_keeps_raw_blocks():
+    html = ('<div class="a">\n    <p>один   два</p>\n</div>\n'
+            '<pre>x = 1\n    y = 2</pre>\n<textarea>a\n  b</textarea>')
+    assert minify_html(html) == ('<div class="a"><p>один два</p></div>'
+                                 '<pre>x = 1\n    y = 2</pre><textarea>a\n  b</textarea>')
+
+def test_minify_keeps_expected_output_lines():
+    html = '<div id="output" class="expected-output">0\n1\n2</div>'
+    assert minify_html(html) == html
+
+def test_build_with_examples_and_minify_keeps_output_lines(tmp_path):
+    build(root=str(tmp_path), lesson_ids=['python-09'], examples=True, minify=True)
+    with open(os.path.join(tmp_path, 'lessons', 'python-09.html'), encoding='utf-8') as f:
+        page = f.read()
+    outputs = re.findall(r'class="expected-output">([^<]*)</div>', page)
+    assert '0\n1\n2\n3\n4' in outputs
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Офлайн-кэш: оболочка сайта при установке, остальное - отложенно
+"""
+
+import re
+import json
+
+from pythonlearn.build import build
+from pythonlearn.offline import PRECACHE_MANIFEST_FILE, SERVICE_WORKER_FILE
+
+def embedded(source, pattern):
+    return json.loads(re.search(pattern, source, re.S).group(1))
+
+def test_shell_holds_only_home_page_and_assets(tmp_path):
+    result = build(root=str(tmp_path), client_nav=True, search=True, nav='external')
+    source = (tmp_path / SERVICE_WORKER_FILE).read_text(encoding='utf-8')
+    manifest = embedded(source, r'const PRECACHE_MANIFEST = (\{.*?\});')
+    deferred = set(embedded(source, r'const DEFERRED_PATHS = new Set\((\[.*?\])\);'))
+
+    assert manifest == json.loads((tmp_path / PRECACHE_MANIFEST_FILE).read_text(encoding='utf-8'))
+    assert manifest == result['precached']
+    shell = [path for path in manifest if path not in deferred]
+    assert 'index.html' in shell and 'lessons/nav.html' in shell
+    assert all(path in ('index.html', 'lessons/nav.html') or path.startswith('js/')
+               or path.startswith('css/') for path in shell)
+    assert {'lessons/python-01.html', 'lessons/python-01.json', 'search/meta.json'} <= deferred
+
+def test_deferred_files_are_fetched_inside_wait_until(tmp_path):
+    build(root=str(tmp_path), lesson_ids=['python-01'])
+    source = (tmp_path / SERVICE_WORKER_FILE).read_text(encoding='utf-8')
+    calls = [line for line in re.findall(r'^.*precacheDeferred\(\).*$', source, re.M)
+             if not line.startswith('function')]
+    assert calls and all('waitUntil' in line for line in calls)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Запись результатов сборки: статусы, сохранение mtime и прав файлов
+"""
+
+import os
+import sys
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+from pythonlearn.output import UMASK, new_write_report, replace_file, write_file
+
+def test_write_file_statuses(tmp_path):
+    path = str(tmp_path / 'page.html')
+    report = new_write_report()
+    assert write_file(path, 'a', report, 'page.html') == 'new'
+    mtime = os.stat(path).st_mtime_ns
+    assert write_file(path, 'a', report, 'page.html') == 'unchanged'
+    assert os.stat(path).st_mtime_ns == mtime
+    assert write_file(path, b'b', report, 'page.html') == 'rewritten'
+    assert report == {'new': ['page.html'], 'rewritten': ['page.html'], 'unchanged': ['page.html']}
+    with open(path, 'rb') as f:
+        assert f.read() == b'b'
+
+def test_replace_file_keeps_existing_mode(tmp_path):
+    path = str(tmp_path / 'run.sh')
+    replace_file(path, b'1')
+    os.chmod(path, 0o750)
+    replace_file(path, b'2')
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o750
+
+def test_replace_file_from_threads_respects_umask(tmp_path):
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        paths = [str(tmp_path / f'{number}.gz') for number in range(400)]
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            list(pool.map(lambda path: replace_file(path, b'x'), paths))
+    finally:
+        sys.setswitchinterval(interval)
+    modes = {stat.S_IMODE(os.stat(path).st_mode) for path in paths}
+    assert modes == {0o666 & ~UMASK}
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Кэш компиляции js/python-worker.js: прогретый пример урока запускается без компиляции
+
+Поток выполняется в Node.js с заглушкой Skulpt, которая компилирует главный
+модуль так же, как Skulpt 1.2.0: importMainWithBody -> Sk.compile(code,
+'<stdin>.py', 'exec', canSuspend, true).
+"""
+
+import os
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from pythonlearn.build import DEFAULT_ROOT
+
+WORKER_HARNESS = r'''
+const fs = require('fs');
+const vm = require('vm');
+
+const messages = [];
+let compiles = 0;
+const context = {console: console, Promise: Promise, JSON: JSON, Date: Date, Math: Math,
+                 Object: Object, Map: Map};
+context.self = context;
+context.postMessage = function(message) { messages.push(message); };
+context.importScripts = function() {
+    context.Sk = {
+        python3: {},
+        configure: function(options) { context.Sk.debugging = options.debugging; },
+        compile: function(source, filename, mode, canSuspend, annotate) {
+            compiles++;
+            return {funcname: '$compiled', code: source};
+        },
+        importMainWithBody: function(name, dumpJS, body, canSuspend) {
+            return context.Sk.compile(body, name + '.py', 'exec', canSuspend, true);
+        },
+        misceval: {asyncToPromise: function(fn) { return Promise.resolve().then(fn); }},
+        builtin: {TimeLimitError: Error},
+    };
+};
+vm.createContext(context);
+vm.runInContext(fs.readFileSync(process.argv[1], 'utf8'), context);
+
+const source = 'for i in range(3):\n    print(i)\n';
+context.onmessage({data: {type: 'load', urls: ['vendor/'], files: ['skulpt.min.js'], version: '1.2.0'}});
+context.onmessage({data: {type: 'warm', sources: [source]}});
+setTimeout(function() {
+    const warmed = compiles;
+    context.onmessage({data: {type: 'run', code: source, stepLimit: 1000}});
+    setTimeout(function() {
+        console.log(JSON.stringify({warmed: warmed, compiles: compiles, messages: messages}));
+    }, 50);
+}, 50);
+'''
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='нужен Node.js')
+def test_prewarmed_example_hits_compile_cache():
+    completed = subprocess.run(
+        ['node', '-e', WORKER_HARNESS, os.path.join(DEFAULT_ROOT, 'js', 'python-worker.js')],
+        capture_output=True, text=True, timeout=30, check=True)
+    result = json.loads(completed.stdout)
+    assert result['warmed'] == 1
+    assert result['compiles'] == 1
+    assert {'type': 'done', 'cached': True} in result['messages']
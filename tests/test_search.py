@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Поисковый индекс: нормализация слов, части индекса и удаление устаревших частей
+"""
+
+import os
+import json
+
+from pythonlearn.search import (SEARCH_DIR, SEARCH_META_FILE, build_search_index,
+                                emit_search_index, normalize_word, shard_file)
+
+LESSONS = [
+    ('python-01', 'Словари', 'Python', '<h2>Словарь</h2><p>Ключи словарей</p><pre>d = {}</pre>'),
+    ('python-02', 'Списки', 'Python', '<p>Список и словарь</p>'),
+]
+
+def test_word_forms_share_one_term():
+    assert normalize_word('словари') == normalize_word('словарей') == normalize_word('словарь')
+    assert normalize_word('ёлка') == normalize_word('елка')
+
+def test_index_weights_title_above_text():
+    meta, shards = build_search_index(LESSONS)
+    assert [doc[0] for doc in meta['docs']] == ['python-01', 'python-02']
+    postings = shards['сл'][normalize_word('словарь')]
+    weights = dict(zip(postings[::2], postings[1::2]))
+    assert weights[0] > weights[1] > 0
+
+def test_emit_removes_stale_shards_with_compressed_copies(tmp_path):
+    root = str(tmp_path)
+    directory = os.path.join(root, SEARCH_DIR)
+    os.makedirs(directory)
+    stale = shard_file('zz')
+    for name in (stale, stale + '.gz', stale + '.br'):
+        with open(os.path.join(directory, name), 'w') as f:
+            f.write('{}')
+
+    paths = emit_search_index(root, LESSONS)
+    assert not {stale, stale + '.gz', stale + '.br'} & set(os.listdir(directory))
+    assert sorted(os.listdir(directory)) == sorted(os.path.basename(path) for path in paths)
+    with open(os.path.join(directory, SEARCH_META_FILE), encoding='utf-8') as f:
+        assert json.load(f)['shards']['сл'] == shard_file('сл')